@@ -14,9 +14,10 @@ except ImportError:
 
 import json
 import os
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
 
 class DatabaseConfig:
@@ -33,6 +34,13 @@ class DatabaseConfig:
                 For SQLite:
                     database (str): Path to SQLite database file
                         Default: 'scraper_history.db'
+                    uri (bool): Interpret database as a SQLite URI filename
+                        (e.g. 'file:memdb?mode=memory&cache=shared')
+                        Default: False
+                    pooled (bool): Keep one connection open and reuse it for
+                        every call instead of reconnecting each time.
+                        Threads take turns on the connection.
+                        Default: False
 
                 For MySQL:
                     host (str): MySQL server hostname or IP address
@@ -68,6 +76,8 @@ class DatabaseConfig:
 
         if self.db_type == 'sqlite':
             self.database = kwargs.get('database', 'scraper_history.db')
+            self.uri = kwargs.get('uri', False)
+            self.pooled = kwargs.get('pooled', False)
         elif self.db_type == 'mysql':
             if not MYSQL_AVAILABLE:
                 raise ImportError("mysql-connector-python is required for MySQL support. Install it with: pip install mysql-connector-python")
@@ -91,28 +101,68 @@ class DatabaseManager:
             config: DatabaseConfig instance
         """
         self.config = config
+        self._conn = None
+        # Serializes threads sharing the pooled connection
+        self._conn_lock = threading.RLock()
+        # Connection held open by an enclosing transaction(), per thread
+        self._local = threading.local()
+
+    def _connect(self):
+        """Open a new connection for the configured database"""
+        if self.config.db_type == 'sqlite':
+            # A pooled connection is used from whichever thread holds _conn_lock
+            conn = sqlite3.connect(self.config.database, uri=self.config.uri,
+                                   check_same_thread=not self.config.pooled)
+            conn.row_factory = sqlite3.Row
+            # Opt-in statement tracing for debugging; off by default so normal
+            # runs never pay for a Python callback per statement
+            if os.environ.get('SQLITE_TRACE') == '1':
+                conn.set_trace_callback(print)
+        elif self.config.db_type == 'mysql':
+            conn = mysql.connector.connect(
+                host=self.config.host,
+                user=self.config.user,
+                password=self.config.password,
+                database=self.config.database,
+                port=self.config.port
+            )
+        return conn
 
     @contextmanager
     def get_connection(self):
         """
         Context manager for database connections
 
+        With a pooled SQLite config the same connection is yielded on every
+        call and left open, and other threads wait until the block exits;
+        otherwise a fresh connection is opened and closed.
+
+        Inside a transaction() block the transaction's connection is yielded
+        as-is; committing or rolling back is left to the transaction.
+
         Yields:
             Database connection object
         """
+        active = getattr(self._local, 'conn', None)
+        if active is not None:
+            yield active
+            return
+
+        if self.config.db_type == 'sqlite' and self.config.pooled:
+            with self._conn_lock:
+                if self._conn is None:
+                    self._conn = self._connect()
+                try:
+                    yield self._conn
+                    self._conn.commit()
+                except Exception as e:
+                    self._conn.rollback()
+                    raise e
+            return
+
         conn = None
         try:
-            if self.config.db_type == 'sqlite':
-                conn = sqlite3.connect(self.config.database)
-                conn.row_factory = sqlite3.Row
-            elif self.config.db_type == 'mysql':
-                conn = mysql.connector.connect(
-                    host=self.config.host,
-                    user=self.config.user,
-                    password=self.config.password,
-                    database=self.config.database,
-                    port=self.config.port
-                )
+            conn = self._connect()
 
             yield conn
             conn.commit()
@@ -124,6 +174,36 @@ class DatabaseManager:
             if conn:
                 conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Group every query issued in the block into a single commit
+
+        Calls made through get_connection() on this thread share one
+        connection and are committed together on exit, or all rolled back
+        if the block raises. Nested transactions join the outer one.
+
+        Yields:
+            Database connection object
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield self._local.conn
+            return
+
+        with self.get_connection() as conn:
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = None
+
+    def close(self):
+        """Close the pooled connection, if one is open"""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def execute_query(self, query: str, params: tuple = (), fetch: bool = False) -> Optional[List]:
         """
         Execute a database query
@@ -150,6 +230,50 @@ class DatabaseManager:
 
             return cursor.lastrowid if cursor.lastrowid else None
 
+    def execute_many(self, query: str, params_seq: Iterable[tuple]) -> int:
+        """
+        Execute a query once for every parameter tuple in a single transaction
+
+        The statement is prepared once and reused for every row.
+
+        Args:
+            query: SQL query string
+            params_seq: Iterable of query parameter tuples
+
+        Returns:
+            Number of rows affected
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(query, params_seq)
+            return cursor.rowcount
+
+    def iter_query(self, query: str, params: tuple = (),
+                   batch_size: int = 1000) -> Iterator[Sequence]:
+        """
+        Run a SELECT and yield its rows as they are fetched
+
+        Rows are fetched ``batch_size`` at a time, so the full result set is
+        never held in memory. The connection stays open until the iterator
+        is exhausted or closed.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Row tuples (sqlite3.Row for SQLite), in column order
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from rows
+
     def initialize_schema(self, schema_file: str = 'schema.sql'):
         """
         Initialize database schema from SQL file
@@ -210,6 +334,20 @@ class SearchHistoryDB:
         """
         self.db = db_manager
 
+    def transaction(self):
+        """
+        Run several operations in one database transaction
+
+        Example:
+            with history_db.transaction():
+                history_db.add_results_batch(search_id, results)
+                history_db.update_search(search_id, len(results))
+
+        Returns:
+            Context manager committing once on exit
+        """
+        return self.db.transaction()
+
     # ========== SEARCH OPERATIONS ==========
 
     def create_search(self, query: str, user_id: Optional[int] = None,
@@ -306,9 +444,58 @@ class SearchHistoryDB:
         """
         return self.db.execute_query(sql, (query_pattern,), fetch=True)
 
+    def find_recent_completed_search(self, query: str, max_age_seconds: int,
+                                     sites_filter: Optional[str] = None) -> Optional[int]:
+        """
+        Find the latest successful search for a query made within a time window
+
+        The query is matched ignoring case and surrounding whitespace. Only
+        completed searches that found at least one result qualify.
+
+        Args:
+            query: Search query string
+            max_age_seconds: Oldest search to accept, in seconds
+            sites_filter: Comma-separated sites the search was limited to,
+                as stored in its 'sites_filter' metadata (None = all sites)
+
+        Returns:
+            search_id of the matching search, or None
+        """
+        cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
+        if sites_filter is None:
+            sites_clause = """NOT EXISTS (
+                SELECT 1 FROM search_metadata m
+                WHERE m.search_id = s.search_id AND m.metadata_key = 'sites_filter'
+            )"""
+            params = (query.strip().lower(), cutoff)
+        else:
+            sites_clause = """EXISTS (
+                SELECT 1 FROM search_metadata m
+                WHERE m.search_id = s.search_id AND m.metadata_key = 'sites_filter'
+                  AND m.metadata_value = ?
+            )"""
+            params = (query.strip().lower(), cutoff, sites_filter)
+
+        sql = f"""
+            SELECT s.search_id FROM searches s
+            WHERE LOWER(TRIM(s.query)) = ?
+              AND s.status = 'completed'
+              AND s.total_results > 0
+              AND s.search_timestamp >= ?
+              AND {sites_clause}
+            ORDER BY s.search_timestamp DESC
+            LIMIT 1
+        """
+        results = self.db.execute_query(sql, params, fetch=True)
+        return results[0]['search_id'] if results else None
+
     def get_recent_searches(self, limit: int = 20) -> List[Dict]:
         """
-        Get most recent searches
+        Get most recent searches, newest first
+
+        Ordered by search_id like get_searches_before(), so the last
+        search_id here is a cursor for the next page even when several
+        searches share a (one-second) timestamp.
 
         Args:
             limit: Maximum number of results
@@ -318,11 +505,34 @@ class SearchHistoryDB:
         """
         sql = """
             SELECT * FROM searches
-            ORDER BY search_timestamp DESC
+            ORDER BY search_id DESC
             LIMIT ?
         """
         return self.db.execute_query(sql, (limit,), fetch=True)
 
+    def get_searches_before(self, before_id: int, limit: int = 20) -> List[Dict]:
+        """
+        Get the searches made just before another one, newest first
+
+        Keyset pagination for history: pass the last search_id of one page
+        to get the next. Each page is an index seek on the primary key, so
+        deep pages cost the same as the first.
+
+        Args:
+            before_id: Only return searches with a lower search_id
+            limit: Maximum number of results
+
+        Returns:
+            List of search records
+        """
+        sql = """
+            SELECT * FROM searches
+            WHERE search_id < ?
+            ORDER BY search_id DESC
+            LIMIT ?
+        """
+        return self.db.execute_query(sql, (before_id, limit), fetch=True)
+
     # ========== SITE OPERATIONS ==========
 
     def add_site(self, site_name: str, site_url: str) -> int:
@@ -388,26 +598,18 @@ class SearchHistoryDB:
 
     # ========== SEARCH RESULTS OPERATIONS ==========
 
-    def add_result(self, search_id: int, site_id: int, result_data: Dict) -> int:
-        """
-        Add a search result
-
-        Args:
-            search_id: ID of the search
-            site_id: ID of the site
-            result_data: Dictionary containing result fields
+    _INSERT_RESULT_SQL = """
+        INSERT INTO search_results (
+            search_id, site_id, product_name, price, original_price,
+            discount_percentage, rating, reviews_count, availability,
+            seller, product_url, image_url, scraped_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
-        Returns:
-            result_id of the created result
-        """
-        sql = """
-            INSERT INTO search_results (
-                search_id, site_id, product_name, price, original_price,
-                discount_percentage, rating, reviews_count, availability,
-                seller, product_url, image_url, scraped_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        params = (
+    @staticmethod
+    def _result_params(search_id: int, site_id: int, result_data: Dict) -> tuple:
+        """Build the search_results insert parameters for one result"""
+        return (
             search_id,
             site_id,
             result_data.get('product_name'),
@@ -423,33 +625,71 @@ class SearchHistoryDB:
             datetime.now()
         )
 
-        result_id = self.db.execute_query(sql, params, fetch=False)
+    def add_result(self, search_id: int, site_id: int, result_data: Dict) -> int:
+        """
+        Add a search result
+
+        Args:
+            search_id: ID of the search
+            site_id: ID of the site
+            result_data: Dictionary containing result fields
+
+        Returns:
+            result_id of the created result
+        """
+        params = self._result_params(search_id, site_id, result_data)
+
+        result_id = self.db.execute_query(self._INSERT_RESULT_SQL, params, fetch=False)
         return result_id
 
+    def add_results_many(self, search_id: int, site_id: int, results: List[Dict]) -> int:
+        """
+        Add several results from the same site with one prepared statement
+
+        Args:
+            search_id: ID of the search
+            site_id: ID of the site
+            results: List of result dictionaries
+
+        Returns:
+            Number of results inserted
+        """
+        rows = [self._result_params(search_id, site_id, result) for result in results]
+        return self.db.execute_many(self._INSERT_RESULT_SQL, rows)
+
     def add_results_batch(self, search_id: int, results: List[Dict]):
         """
         Add multiple results for a search
 
+        Results are grouped by site and each group is inserted with one
+        prepared statement (see add_results_many).
+
         Args:
             search_id: ID of the search
             results: List of result dictionaries (each must have 'site' or 'site_id')
         """
+        by_site: Dict[int, List[Dict]] = {}
+        site_ids: Dict[str, int] = {}
         for result in results:
-            # Get or create site
-            site_name = result.get('site', result.get('seller', 'Unknown'))
-            site_url = result.get('site_url', result.get('url', ''))
-
             if 'site_id' in result:
                 site_id = result['site_id']
             else:
-                site = self.get_site_by_name(site_name)
-                if site:
-                    site_id = site['site_id']
-                else:
-                    site_id = self.add_site(site_name, site_url)
-
-            # Add result
-            self.add_result(search_id, site_id, result)
+                # Get or create site, once per site name
+                site_name = result.get('site', result.get('seller', 'Unknown'))
+                site_id = site_ids.get(site_name)
+                if site_id is None:
+                    site = self.get_site_by_name(site_name)
+                    if site:
+                        site_id = site['site_id']
+                    else:
+                        site_url = result.get('site_url', result.get('url', ''))
+                        site_id = self.add_site(site_name, site_url)
+                    site_ids[site_name] = site_id
+
+            by_site.setdefault(site_id, []).append(result)
+
+        for site_id, site_results in by_site.items():
+            self.add_results_many(search_id, site_id, site_results)
 
     def get_results_by_search_id(self, search_id: int) -> List[Dict]:
         """
@@ -470,6 +710,32 @@ class SearchHistoryDB:
         """
         return self.db.execute_query(sql, (search_id,), fetch=True)
 
+    # Column names of iter_results_for_export rows, in order
+    EXPORT_COLUMNS = (
+        'product_name', 'price', 'original_price', 'discount_percentage',
+        'rating', 'reviews_count', 'availability', 'seller', 'url', 'scraped_at'
+    )
+
+    def iter_results_for_export(self, search_id: int) -> Iterator[Sequence]:
+        """
+        Stream a search's results as rows ready for a CSV writer
+
+        Args:
+            search_id: ID of the search
+
+        Yields:
+            One row per result with the EXPORT_COLUMNS values, cheapest first
+        """
+        sql = """
+            SELECT product_name, price, original_price, discount_percentage,
+                   rating, reviews_count, availability, seller,
+                   product_url AS url, scraped_at
+            FROM search_results
+            WHERE search_id = ?
+            ORDER BY price ASC
+        """
+        return self.db.iter_query(sql, (search_id,))
+
     def get_results_by_search_and_date(self, search_id: int,
                                        start_date: datetime,
                                        end_date: Optional[datetime] = None) -> List[Dict]:
@@ -670,18 +936,21 @@ class SearchHistoryDB:
 # Convenience functions for quick setup
 
 def create_sqlite_db(db_path: str = 'scraper_history.db',
-                     schema_file: str = 'schema.sql') -> SearchHistoryDB:
+                     schema_file: str = 'schema.sql',
+                     pooled: bool = False) -> SearchHistoryDB:
     """
     Create and initialize SQLite database
 
     Args:
         db_path: Path to SQLite database file
         schema_file: Path to schema SQL file
+        pooled: Keep a single connection open, shared by all threads
+            (required for ':memory:')
 
     Returns:
         SearchHistoryDB instance
     """
-    config = DatabaseConfig('sqlite', database=db_path)
+    config = DatabaseConfig('sqlite', database=db_path, pooled=pooled)
     db_manager = DatabaseManager(config)
     db_manager.initialize_schema(schema_file)
     return SearchHistoryDB(db_manager)
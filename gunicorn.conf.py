@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for serving the web app in production
+
+Usage (from the project root, which gunicorn reads this file from):
+    gunicorn web.app:app
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '127.0.0.1:5000')
+
+# One process: the latest search, the result/search caches and background
+# search jobs live in process memory, so a second worker would not see them
+workers = 1
+
+# Requests spend most of their time waiting on scrapers and the database,
+# so threads give concurrency without monkey-patching the scrapers' I/O
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '16'))
+
+# A cold scrape across every site can take well over gunicorn's default 30s
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+
+
+def post_worker_init(worker):
+    """Configure proxy/user-agent rotation, as main.py does for the dev server"""
+    from main import configure_rotation
+    configure_rotation()
@@ -57,9 +57,25 @@ _CURRENCY_MAP = {
 }
 
 
+# Currency tokens longest first (e.g., 'c$' before '$'), computed once rather than per parse
+_CURRENCY_KEYS_BY_LEN = tuple(sorted(_CURRENCY_MAP, key=len, reverse=True))
+# Each token in the spellings stripped from price text: as-is, upper and capitalized
+_CURRENCY_STRIP_TOKENS = tuple(
+    dict.fromkeys(v for key in _CURRENCY_KEYS_BY_LEN for v in (key, key.upper(), key.capitalize()))
+)
+
 _NBSP = "\xa0"
 _THINSP = "\u2009"
 
+_CODE_RE = re.compile(r"\b([a-z]{3})\b")
+_LETTER_RE = re.compile(r"[A-Za-z]")
+_NON_NUMERIC_RE = re.compile(r"[^0-9,.'\-\s]")
+_SPACES_RE = re.compile(r"\s+")
+_NUMBER_TOKEN_RE = re.compile(r"-?\s*[0-9][0-9,.'\s]*")
+_DECIMAL_TAIL_RE = re.compile(r"\d{1,2}")
+_NON_DECIMAL_RE = re.compile(r"[^0-9.\-]")
+_DECIMAL_RE = re.compile(r"-?\d+(\.\d+)?")
+
 
 def _bankers_round_2(dec: Decimal) -> Decimal:
     return dec.quantize(Decimal("0.01"), rounding=ROUND_HALF_EVEN)
@@ -78,12 +94,11 @@ def detect_currency(text: Optional[str], hint: Optional[str] = None) -> str:
     t = text.strip().lower()
     # Quick checks for known symbols/codes anywhere in the string
     # Prefer longer tokens first (e.g., 'c$' before '$')
-    for key in sorted(_CURRENCY_MAP.keys(), key=len, reverse=True):
-        code = _CURRENCY_MAP[key]
+    for key in _CURRENCY_KEYS_BY_LEN:
         if key in t:
-            return code
+            return _CURRENCY_MAP[key]
     # Word-boundary match for 3-letter codes
-    m = re.search(r"\b([a-z]{3})\b", t)
+    m = _CODE_RE.search(t)
     if m:
         return _CURRENCY_MAP.get(m.group(1), m.group(1).upper())
     return "UNK"
@@ -93,16 +108,15 @@ def _strip_currency_and_keep_separators(text: str) -> str:
     # Remove currency words/symbols but keep digits, separators, minus sign
     t = text.replace(_NBSP, " ").replace(_THINSP, " ")
     # Remove known currency tokens
-    for token in sorted(_CURRENCY_MAP.keys(), key=len, reverse=True):
-        t = t.replace(token, " ")
-        t = t.replace(token.upper(), " ")
-        t = t.replace(token.capitalize(), " ")
+    for token in _CURRENCY_STRIP_TOKENS:
+        if token in t:
+            t = t.replace(token, " ")
     # Remove other letters
-    t = re.sub(r"[A-Za-z]", " ", t)
+    t = _LETTER_RE.sub(" ", t)
     # Keep digits, separators, spaces, and hyphen
-    t = re.sub(r"[^0-9,.'\-\s]", " ", t)
+    t = _NON_NUMERIC_RE.sub(" ", t)
     # Collapse spaces
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _SPACES_RE.sub(" ", t).strip()
     return t
 
 
@@ -128,12 +142,12 @@ def _infer_decimal_separator(num_text: str) -> Tuple[Optional[str], Optional[str
             return ".", ","
     if has_comma:
         after = s.split(",")[-1]
-        if re.fullmatch(r"\d{1,2}", after):
+        if _DECIMAL_TAIL_RE.fullmatch(after):
             return ",", None
         return None, ","
     if has_dot:
         after = s.split(".")[-1]
-        if re.fullmatch(r"\d{1,2}", after):
+        if _DECIMAL_TAIL_RE.fullmatch(after):
             return ".", None
         return None, "."
     # No dot/comma — spaces/apostrophes may be thousand separators
@@ -151,7 +165,7 @@ def normalize_numeric_string(text: str) -> Optional[Decimal]:
     if not t:
         return None
     # Keep only the last numeric token (often the price), but support negatives for discounts
-    tokens = [tok for tok in re.findall(r"-?\s*[0-9][0-9,.'\s]*", t) if any(c.isdigit() for c in tok)]
+    tokens = [tok for tok in _NUMBER_TOKEN_RE.findall(t) if any(c.isdigit() for c in tok)]
     if not tokens:
         return None
     # Prefer a token that contains a minus sign (for negative values like discounts);
@@ -171,7 +185,7 @@ def normalize_numeric_string(text: str) -> Optional[Decimal]:
     if dec_sep and dec_sep != ".":
         work = work.replace(dec_sep, ".")
     # If no explicit decimal sep but there's a dot or comma left from ambiguous case, strip others
-    work = re.sub(r"[^0-9.\-]", "", work)
+    work = _NON_DECIMAL_RE.sub("", work)
 
     # Validate: ensure hyphen is only at the start (for negative numbers)
     if "-" in work:
@@ -191,7 +205,7 @@ def normalize_numeric_string(text: str) -> Optional[Decimal]:
         work = work[:last_dot].replace(".", "") + work[last_dot:]
 
     # Final validation: ensure the pattern is valid (optional minus, digits, optional decimal point with digits)
-    if not re.fullmatch(r"-?\d+(\.\d+)?", work):
+    if not _DECIMAL_RE.fullmatch(work):
         return None
 
     try:
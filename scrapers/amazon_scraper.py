@@ -7,7 +7,6 @@ import re
 import urllib.parse
 from typing import Dict
 
-import requests
 from bs4 import BeautifulSoup
 
 from scrapers.hybrid_scraper import HybridScraper
@@ -51,7 +50,7 @@ class AmazonScraper(HybridScraper):
             search_url = self.search_url.format(encoded_query)
 
             # Get search results
-            response = requests.get(search_url, headers=self.get_headers(), timeout=self.timeout)
+            response = self.http_get(search_url, headers=self.get_headers(), timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -88,7 +87,7 @@ class AmazonScraper(HybridScraper):
         Scrape using static requests
         """
         try:
-            response = requests.get(input_data, headers=self.get_headers(), timeout=self.timeout)
+            response = self.http_get(input_data, headers=self.get_headers(), timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
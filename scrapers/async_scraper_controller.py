@@ -5,6 +5,7 @@ Target: ≤15 seconds for 5 websites
 """
 
 import asyncio
+import contextvars
 import time
 from typing import Dict, List, Optional
 
@@ -63,9 +64,11 @@ class AsyncScraperController:
 
         for attempt in range(self.max_retries):
             try:
-                # Run the synchronous scrape method in an executor
+                # Run the synchronous scrape method in an executor, carrying
+                # context variables such as fresh_fetches() along with it
                 loop = asyncio.get_running_loop()
-                result = await loop.run_in_executor(None, scraper.scrape, input_data)
+                context = contextvars.copy_context()
+                result = await loop.run_in_executor(None, context.run, scraper.scrape, input_data)
 
                 # Validate the output
                 if scraper.validate_output(result):
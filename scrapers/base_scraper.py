@@ -4,10 +4,34 @@ Defines the abstract interface that all site-specific scrapers must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+import requests
 
 from scrapers.rotation_manager import RotationManager
 
+# Set inside fresh_fetches(); the async controller copies it into scrape threads
+_fresh_fetches = ContextVar('fresh_fetches', default=False)
+
+
+@contextmanager
+def fresh_fetches(enabled: bool = True) -> Iterator[None]:
+    """
+    Make page fetches in this block skip the HTTP cache
+
+    The fresh pages still replace what the cache held for their URLs.
+
+    Args:
+        enabled (bool): False makes the block a no-op
+    """
+    token = _fresh_fetches.set(enabled)
+    try:
+        yield
+    finally:
+        _fresh_fetches.reset(token)
+
 
 class BaseScraper(ABC):
     """
@@ -18,6 +42,19 @@ class BaseScraper(ABC):
     # Class-level rotation manager shared across all scrapers
     _rotation_manager = None
 
+    # Session for page fetches shared across all scrapers (e.g. an HTTP
+    # cache); None fetches with plain requests.get
+    _http_session = None
+
+    # Default request headers (User-Agent is added per request by rotation)
+    _HEADER_TEMPLATE = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    }
+
     def __init__(self):
         """Initialize the scraper with basic configuration."""
         self.site_name = self.__class__.__name__.replace('Scraper', '')
@@ -27,14 +64,9 @@ class BaseScraper(ABC):
         if BaseScraper._rotation_manager is None:
             BaseScraper._rotation_manager = RotationManager()
         
-        # Base headers (User-Agent will be rotated)
-        self.base_headers = {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+        # Base headers (User-Agent will be rotated); copied so
+        # set_custom_header only affects this instance
+        self.base_headers = dict(self._HEADER_TEMPLATE)
         
         # Current proxy being used (for tracking)
         self.current_proxy = None
@@ -88,6 +120,38 @@ class BaseScraper(ABC):
         """
         return BaseScraper._rotation_manager.get_headers_with_rotation(self.base_headers)
 
+    def get_headers_batch(self, count: int) -> List[Dict[str, str]]:
+        """
+        Get HTTP headers for several requests at once, each with a rotated User-Agent.
+
+        Args:
+            count (int): Number of header sets to build
+
+        Returns:
+            List[Dict]: HTTP headers with rotated User-Agents
+        """
+        return BaseScraper._rotation_manager.get_headers_batch(count, self.base_headers)
+
+    def http_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Fetch a page through the shared HTTP session, if one is set.
+
+        Inside fresh_fetches() a cached copy of the page is never used.
+
+        Args:
+            url (str): Page URL
+            **kwargs: Passed on to ``get`` (headers, timeout, ...)
+
+        Returns:
+            requests.Response: The response
+        """
+        session = BaseScraper._http_session
+        if session is None:
+            return requests.get(url, **kwargs)
+        if _fresh_fetches.get():
+            kwargs['force_refresh'] = True
+        return session.get(url, **kwargs)
+
     def get_proxy(self) -> Optional[Dict[str, str]]:
         """
         Get the next available proxy from rotation.
@@ -139,6 +203,17 @@ class BaseScraper(ABC):
         else:
             cls._rotation_manager.add_proxies(proxy_list)
 
+    @classmethod
+    def set_http_session(cls, session):
+        """
+        Route every scraper's page fetches through a shared session.
+
+        Args:
+            session: A requests-compatible session such as a
+                requests_cache.CachedSession, or None for plain requests.get
+        """
+        cls._http_session = session
+
     @classmethod
     def get_rotation_status(cls) -> Dict:
         """
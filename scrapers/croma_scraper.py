@@ -6,7 +6,6 @@ Scrapes product data from Croma.com (Electronics)
 import urllib.parse
 from typing import Dict
 
-import requests
 from bs4 import BeautifulSoup
 
 from scrapers.hybrid_scraper import HybridScraper
@@ -44,7 +43,7 @@ class CromaScraper(HybridScraper):
             encoded_query = urllib.parse.quote(query)
             search_url = self.search_url.format(encoded_query)
 
-            response = requests.get(search_url, headers=self.get_headers(), timeout=self.timeout)
+            response = self.http_get(search_url, headers=self.get_headers(), timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -89,7 +88,7 @@ class CromaScraper(HybridScraper):
         Scrape using static requests
         """
         try:
-            response = requests.get(input_data, headers=self.get_headers(), timeout=self.timeout)
+            response = self.http_get(input_data, headers=self.get_headers(), timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
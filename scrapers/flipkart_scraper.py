@@ -7,7 +7,6 @@ import re
 import urllib.parse
 from typing import Dict
 
-import requests
 from bs4 import BeautifulSoup
 
 from scrapers.hybrid_scraper import HybridScraper
@@ -46,7 +45,7 @@ class FlipkartScraper(HybridScraper):
             encoded_query = urllib.parse.quote(query)
             search_url = self.search_url.format(encoded_query)
 
-            response = requests.get(search_url, headers=self.get_headers(), timeout=self.timeout)
+            response = self.http_get(search_url, headers=self.get_headers(), timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -80,7 +79,7 @@ class FlipkartScraper(HybridScraper):
     def _scrape_static(self, input_data: str) -> Dict:
         """Scrape using static requests"""
         try:
-            response = requests.get(input_data, headers=self.get_headers(), timeout=self.timeout)
+            response = self.http_get(input_data, headers=self.get_headers(), timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -7,7 +7,6 @@ import re
 import urllib.parse
 from typing import Dict
 
-import requests
 from bs4 import BeautifulSoup
 
 from scrapers.hybrid_scraper import HybridScraper
@@ -58,7 +57,7 @@ class MyntraScraper(HybridScraper):
         Scrape using static requests (limited for Myntra)
         """
         try:
-            response = requests.get(input_data, headers=self.get_headers(), timeout=self.timeout)
+            response = self.http_get(input_data, headers=self.get_headers(), timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
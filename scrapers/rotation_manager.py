@@ -83,6 +83,34 @@ class UserAgentRotator:
         self.current_index = (self.current_index + 1) % len(self.user_agents)
         return user_agent
 
+    def get_random_batch(self, count: int) -> List[str]:
+        """
+        Get several random user agents from the pool in one call.
+        
+        Args:
+            count (int): Number of user agents to return
+            
+        Returns:
+            List[str]: Randomly chosen user agent strings
+        """
+        return random.choices(self.user_agents, k=count)
+
+    def get_next_batch(self, count: int) -> List[str]:
+        """
+        Get the next several user agents in rotation in one call.
+        
+        Args:
+            count (int): Number of user agents to return
+            
+        Returns:
+            List[str]: User agent strings in rotation order
+        """
+        user_agents = self.user_agents
+        pool_size = len(user_agents)
+        start = self.current_index
+        self.current_index = (start + count) % pool_size
+        return [user_agents[(start + i) % pool_size] for i in range(count)]
+
     def add_user_agent(self, user_agent: str):
         """
         Add a custom user agent to the pool.
@@ -337,9 +365,23 @@ class RotationManager:
         Returns:
             Dict[str, str]: Headers with rotated user agent
         """
-        headers = base_headers.copy() if base_headers else {}
-        headers['User-Agent'] = self.user_agent_rotator.get_random()
-        return headers
+        return {**(base_headers or {}), 'User-Agent': self.user_agent_rotator.get_random()}
+
+    def get_headers_batch(self, count: int,
+                          base_headers: Optional[Dict[str, str]] = None) -> List[Dict[str, str]]:
+        """
+        Get several sets of HTTP headers, each with a randomly rotated user agent.
+        
+        Args:
+            count (int): Number of header sets to build
+            base_headers (Optional[Dict[str, str]]): Base headers to extend
+            
+        Returns:
+            List[Dict[str, str]]: Headers with rotated user agents
+        """
+        base = base_headers or {}
+        user_agents = self.user_agent_rotator.get_random_batch(count)
+        return [{**base, 'User-Agent': user_agent} for user_agent in user_agents]
 
     def add_proxies(self, proxy_list: List[str]):
         """Add multiple proxies to the pool."""
@@ -4,6 +4,7 @@ Coordinates scraping across multiple e-commerce sites with advanced pricing util
 Uses async scraping for improved performance (target: ≤15s for 5 websites)
 """
 
+import asyncio
 import time
 from decimal import Decimal
 from typing import Dict, List
@@ -57,6 +58,23 @@ class ScraperManager:
         """
         Search for product across multiple sites using async scraping
 
+        Args:
+            query: Product name or search query
+            sites: List of site names to search (None = all sites)
+
+        Returns:
+            List of product results from all sites
+        """
+        # Flask views are synchronous, so run the async search on a fresh event loop
+        return asyncio.run(self.search_product_async(query, sites))
+
+    async def search_product_async(self, query: str, sites: List[str] = None) -> List[Dict]:
+        """
+        Search for product across multiple sites from inside a running event loop
+
+        Sites are scraped concurrently, so the wait is roughly the slowest
+        site rather than the sum of all of them.
+
         Args:
             query: Product name or search query
             sites: List of site names to search (None = all sites)
@@ -71,12 +89,12 @@ class ScraperManager:
         if sites is None or 'all' in sites or len(sites) == 0:
             # Search all registered sites using async controller
             print(f"[SCRAPER_MANAGER] Searching ALL registered sites: {self.registry.get_registered_sites()}")
-            results = self.controller.scrape_all(query)
+            results = await self.controller.scrape_all_async(query)
             print(f"[SCRAPER_MANAGER] Raw results from async scrape_all: {len(results)} results")
         else:
             # Search specific sites using async controller
             print(f"[SCRAPER_MANAGER] Searching specific sites: {sites}")
-            results = self.controller.scrape_all(query, specific_sites=sites)
+            results = await self.controller.scrape_all_async(query, specific_sites=sites)
 
         elapsed_time = time.time() - start_time
         print(f"[SCRAPER_MANAGER] Total scraping time: {elapsed_time:.2f}s")
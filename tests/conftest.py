@@ -0,0 +1,63 @@
+"""
+Shared pytest fixtures
+"""
+
+import os
+
+import pytest
+
+# Point the web app at an in-memory database, without HTTP or template cache
+# files or PDF worker processes, before it is first imported
+os.environ.setdefault('SCRAPER_DB_PATH', ':memory:')
+os.environ.setdefault('SCRAPER_HTTP_CACHE', '')
+os.environ.setdefault('JINJA_CACHE_DIR', '')
+os.environ.setdefault('PDF_WORKERS', '0')
+
+import web.app as web_app
+from scrapers.base_scraper import BaseScraper
+from web.app import app
+
+
+TEST_PROXIES = [
+    'http://test-proxy1.example.com:8080',
+    'http://test-proxy2.example.com:3128',
+]
+
+
+@pytest.fixture(scope="session")
+def configured_proxies():
+    """Configure the shared scraper proxy pool once per session"""
+    previous = BaseScraper._rotation_manager
+    BaseScraper.configure_proxies(TEST_PROXIES)
+    yield TEST_PROXIES
+    BaseScraper._rotation_manager = previous
+
+
+@pytest.fixture(scope="session", autouse=True)
+def flask_app():
+    """The Flask app, put in testing mode once per session (and xdist worker)"""
+    app.config['TESTING'] = True
+    app.config['SECRET_KEY'] = 'test-secret-key'
+    return app
+
+
+@pytest.fixture
+def client(flask_app):
+    """Fresh Flask test client on the shared app, with nothing cached"""
+    web_app._search_cache.clear()
+    web_app._result_cache.clear()
+    web_app._report_cache.clear()
+    with flask_app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def set_current_results():
+    """Swap web.app.current_results by plain assignment, restoring it afterwards"""
+    previous = web_app.current_results
+
+    def _set(value):
+        web_app.current_results = value
+
+    yield _set
+    web_app.current_results = previous
@@ -44,7 +44,7 @@ class TestCromaScraper:
             
             mock_search.assert_called_once_with('laptop')
 
-    @patch('scrapers.croma_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_search_and_scrape_success(self, mock_get, scraper):
         """Test successful search and scrape"""
         # Mock search response
@@ -64,7 +64,7 @@ class TestCromaScraper:
             assert mock_get.called
             assert mock_scrape.called
 
-    @patch('scrapers.croma_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_search_and_scrape_no_results(self, mock_get, scraper):
         """Test search with no results"""
         mock_response = MagicMock()
@@ -76,7 +76,7 @@ class TestCromaScraper:
         assert 'error' in result
         assert 'No products found' in result['error']
 
-    @patch('scrapers.croma_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_search_and_scrape_network_error(self, mock_get, scraper):
         """Test search with network error"""
         mock_get.side_effect = Exception("Network error")
@@ -140,7 +140,7 @@ class TestCromaScraper:
         
         assert link is None
 
-    @patch('scrapers.croma_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_scrape_static_success(self, mock_get, scraper):
         """Test static scraping"""
         mock_response = MagicMock()
@@ -209,7 +209,7 @@ class TestSnapdealScraper:
             
             mock_search.assert_called_once_with('laptop')
 
-    @patch('scrapers.snapdeal_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_search_and_scrape_success(self, mock_get, scraper):
         """Test successful search and scrape"""
         mock_response = MagicMock()
@@ -228,7 +228,7 @@ class TestSnapdealScraper:
             assert mock_get.called
             assert mock_scrape.called
 
-    @patch('scrapers.snapdeal_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_search_and_scrape_no_results(self, mock_get, scraper):
         """Test search with no results"""
         mock_response = MagicMock()
@@ -240,7 +240,7 @@ class TestSnapdealScraper:
         assert 'error' in result
         assert 'No products found' in result['error']
 
-    @patch('scrapers.snapdeal_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_search_and_scrape_exception(self, mock_get, scraper):
         """Test search with exception"""
         mock_get.side_effect = Exception("Network timeout")
@@ -303,7 +303,7 @@ class TestSnapdealScraper:
         assert link is not None
         assert '/product/valid-123' in link
 
-    @patch('scrapers.snapdeal_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_scrape_static_success(self, mock_get, scraper):
         """Test static scraping"""
         mock_response = MagicMock()
@@ -377,8 +377,8 @@ class TestScraperIntegration:
         assert 'error' in croma_error
         assert 'error' in snapdeal_error
 
-    @patch('scrapers.croma_scraper.requests.get')
-    @patch('scrapers.snapdeal_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
+    @patch('scrapers.base_scraper.requests.get')
     def test_both_scrapers_handle_network_errors(self, mock_snap_get, mock_croma_get):
         """Test both scrapers handle network errors gracefully"""
         mock_croma_get.side_effect = Exception("Network error")
@@ -417,11 +417,11 @@ class TestScraperEdgeCases:
         croma = CromaScraper()
         snapdeal = SnapdealScraper()
         
-        with patch('scrapers.croma_scraper.requests.get') as mock_croma_get:
+        with patch('scrapers.base_scraper.requests.get') as mock_croma_get:
             mock_croma_get.return_value = MagicMock(content=b'<html></html>')
             croma._search_and_scrape('laptop "15 inch" & tablet')
         
-        with patch('scrapers.snapdeal_scraper.requests.get') as mock_snap_get:
+        with patch('scrapers.base_scraper.requests.get') as mock_snap_get:
             mock_snap_get.return_value = MagicMock(content=b'<html></html>')
             snapdeal._search_and_scrape('laptop "15 inch" & tablet')
 
@@ -429,7 +429,7 @@ class TestScraperEdgeCases:
         """Test scraping with unicode characters"""
         croma = CromaScraper()
         
-        with patch('scrapers.croma_scraper.requests.get') as mock_get:
+        with patch('scrapers.base_scraper.requests.get') as mock_get:
             mock_get.return_value = MagicMock(content=b'<html></html>')
             croma._search_and_scrape('लैपटॉप')  # Hindi text
 
@@ -438,7 +438,7 @@ class TestScraperEdgeCases:
         long_query = 'laptop ' * 100
         croma = CromaScraper()
         
-        with patch('scrapers.croma_scraper.requests.get') as mock_get:
+        with patch('scrapers.base_scraper.requests.get') as mock_get:
             mock_get.return_value = MagicMock(content=b'<html></html>')
             result = croma._search_and_scrape(long_query)
 
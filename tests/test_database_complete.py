@@ -2,12 +2,16 @@
 Complete working tests for database operations using correct API
 """
 
+import os
 import pytest
 import sqlite3
+import tempfile
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch, call
 from datetime import datetime
 
 from database.database import (
+    DatabaseConfig,
     DatabaseManager,
     SearchHistoryDB,
     create_sqlite_db,
@@ -15,22 +19,49 @@ from database.database import (
 )
 
 
+# Prebuilt rows for the multi-site integration test
+SITES = (
+    ('site0', 'http://site0.com'),
+    ('site1', 'http://site1.com'),
+    ('site2', 'http://site2.com'),
+)
+PRODUCTS = (
+    {'product_name': 'Product 0', 'price': '1000', 'product_url': 'http://site0.com/product'},
+    {'product_name': 'Product 1', 'price': '1100', 'product_url': 'http://site1.com/product'},
+    {'product_name': 'Product 2', 'price': '1200', 'product_url': 'http://site2.com/product'},
+)
+
+
+@pytest.fixture(scope="module")
+def _noop_init_schema():
+    """Patch out schema initialization once for the whole module"""
+    patcher = patch('database.database.DatabaseManager.initialize_schema')
+    mock_init_schema = patcher.start()
+    yield mock_init_schema
+    patcher.stop()
+
+
+@pytest.fixture
+def init_schema(_noop_init_schema):
+    """Module-wide schema patch with call history cleared for this test"""
+    _noop_init_schema.reset_mock()
+    return _noop_init_schema
+
+
 class TestDatabaseFactory:
     """Test database factory functions"""
 
-    @patch('database.database.DatabaseManager.initialize_schema')
-    def test_create_sqlite_db_returns_search_history_wrapper(self, mock_init_schema):
+    def test_create_sqlite_db_returns_search_history_wrapper(self, init_schema):
         db = create_sqlite_db(':memory:')
         assert isinstance(db, SearchHistoryDB)
-        mock_init_schema.assert_called_once()
+        init_schema.assert_called_once()
 
-    @patch('database.database.DatabaseManager.initialize_schema')
-    def test_create_sqlite_db_with_file(self, mock_init_schema, tmp_path):
+    def test_create_sqlite_db_with_file(self, init_schema, tmp_path):
         db_path = tmp_path / "test.db"
         db = create_sqlite_db(str(db_path))
         assert db is not None
         assert isinstance(db, SearchHistoryDB)
-        mock_init_schema.assert_called_once()
+        init_schema.assert_called_once()
 
     @patch('database.database.DatabaseManager')
     def test_create_mysql_db_calls_manager(self, mock_manager):
@@ -51,9 +82,8 @@ class TestSearchHistoryDB:
     """Test SearchHistoryDB wrapper class"""
 
     @pytest.fixture
-    def db(self):
-        with patch('database.database.DatabaseManager.initialize_schema'):
-            return create_sqlite_db(':memory:')
+    def db(self, _noop_init_schema):
+        return create_sqlite_db(':memory:')
 
     def test_create_search(self, db):
         with patch.object(db.db, 'execute_query') as mock:
@@ -148,7 +178,6 @@ class TestDatabaseManager:
 
     @pytest.fixture
     def manager(self):
-        from database.database import DatabaseConfig
         config = DatabaseConfig(db_type='sqlite', database=':memory:')
         return DatabaseManager(config)
 
@@ -165,20 +194,45 @@ class TestDatabaseManager:
             result = cursor.fetchone()
             assert result[0] == 1
 
+    def test_sqlite_trace_disabled_by_default(self, manager, monkeypatch, capsys):
+        monkeypatch.delenv('SQLITE_TRACE', raising=False)
+        manager.execute_query("SELECT 1", fetch=True)
+        assert capsys.readouterr().out == ''
+
+    def test_sqlite_trace_enabled_by_env(self, manager, monkeypatch, capsys):
+        monkeypatch.setenv('SQLITE_TRACE', '1')
+        manager.execute_query("SELECT 1", fetch=True)
+        assert 'SELECT 1' in capsys.readouterr().out
+
+    def test_pooled_connection_is_reused(self):
+        config = DatabaseConfig(db_type='sqlite', database=':memory:', pooled=True)
+        manager = DatabaseManager(config)
+
+        with manager.get_connection() as first:
+            first.execute("CREATE TABLE t (x INTEGER)")
+        with manager.get_connection() as second:
+            assert second is first
+            second.execute("INSERT INTO t VALUES (1)")
+
+        # Data survives across calls because the in-memory database is never closed
+        assert manager.execute_query("SELECT x FROM t", fetch=True) == [{'x': 1}]
+
+        manager.close()
+        assert manager._conn is None
+
 
 class TestDatabaseIntegration:
     """Integration tests with actual database"""
 
     @pytest.fixture
     def db(self):
-        import tempfile
-        import os
-        # Create temporary database file
-        from database.database import DatabaseConfig, DatabaseManager
-        fd, db_path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
+        # Create temporary database file; the directory also collects any
+        # -journal/-wal/-shm sidecar files SQLite creates next to it
+        tmp_dir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(tmp_dir.name, 'test.db')
         
-        config = DatabaseConfig(db_type='sqlite', database=db_path)
+        # One long-lived connection for the whole test instead of reconnecting per query
+        config = DatabaseConfig(db_type='sqlite', database=db_path, pooled=True)
         db_manager = DatabaseManager(config)
         
         # Create tables directly (schema for testing)
@@ -238,18 +292,35 @@ class TestDatabaseIntegration:
                     FOREIGN KEY (search_id) REFERENCES searches (search_id)
                 )
             ''')
+            # Same lookup index as schema_sqlite.sql
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_results_search ON search_results(search_id)'
+            )
             conn.commit()
         
         # Create SearchHistoryDB wrapper
-        from database.database import SearchHistoryDB
         db = SearchHistoryDB(db_manager)
         yield db
         
-        # Cleanup: remove temporary database file
-        try:
-            os.unlink(db_path)
-        except:
-            pass
+        # Cleanup: close pooled connection, then remove the database and its sidecars
+        db_manager.close()
+        tmp_dir.cleanup()
+
+    @pytest.fixture
+    def bulk_mode(self, db):
+        """Context manager that defers result index maintenance until a bulk insert is done"""
+        @contextmanager
+        def _bulk_mode():
+            # Foreign key enforcement is per connection and off by default, so
+            # DatabaseManager's short-lived connections already skip it
+            db.db.execute_query('DROP INDEX IF EXISTS idx_results_search')
+            try:
+                yield
+            finally:
+                db.db.execute_query(
+                    'CREATE INDEX IF NOT EXISTS idx_results_search ON search_results(search_id)'
+                )
+        return _bulk_mode
 
     def test_full_search_workflow(self, db):
         # Create a search
@@ -291,31 +362,34 @@ class TestDatabaseIntegration:
         # Get history
         history = db.get_recent_searches(limit=10)
         assert len(history) == 3
+        # Same-second searches still come back newest first, in cursor order
+        assert [h['search_id'] for h in history] == [id3, id2, id1]
+        assert db.get_searches_before(id2, limit=10)[0]['search_id'] == id1
 
-    def test_search_with_multiple_results(self, db):
+    def test_search_with_multiple_results(self, db, bulk_mode):
         search_id = db.create_search('laptop', status='pending')
 
-        # Add sites first
-        site_ids = []
-        for i in range(3):
-            site_id = db.add_site(f'site{i}', f'http://site{i}.com')
-            site_ids.append(site_id)
+        # All products from one site go in through a single prepared statement
+        with bulk_mode():
+            site_id = db.add_site(*SITES[0])
+            inserted = db.add_results_many(search_id, site_id, list(PRODUCTS))
+        assert inserted == 3
 
-        # Add multiple results
-        for i, site_id in enumerate(site_ids):
-            result_data = {
-                'product_name': f'Product {i}',
-                'price': f'{1000 + i * 100}',
-                'product_url': f'http://site{i}.com/product'
-            }
-            db.add_result(search_id, site_id, result_data)
+        # Index is rebuilt once the bulk insert finishes
+        indexes = db.db.execute_query(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_results_search'",
+            fetch=True
+        )
+        assert len(indexes) == 1
 
         # Update search
         db.update_search(search_id, total_results=3, status='completed')
 
         # Get results
         results = db.get_results_by_search_id(search_id)
-        assert len(results) == 3
+        assert [(r['product_name'], r['site_id']) for r in results] == [
+            (p['product_name'], site_id) for p in PRODUCTS
+        ]
 
     def test_search_with_error_result(self, db):
         search_id = db.create_search('test', status='pending')
@@ -1,10 +1,12 @@
 """Extended database tests to increase coverage"""
 import pytest
-import tempfile
-import os
+import sqlite3
+import threading
+import uuid
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from database.database import (
-    DatabaseConfig, DatabaseManager, SearchHistoryDB
+    DatabaseConfig, DatabaseManager, SearchHistoryDB, create_sqlite_db
 )
 
 
@@ -13,14 +15,14 @@ class TestDatabaseExtended:
 
     @pytest.fixture
     def db(self):
-        import tempfile
-        import os
-        # Create temporary database file
-        from database.database import DatabaseConfig, DatabaseManager
-        fd, db_path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
-        
-        config = DatabaseConfig(db_type='sqlite', database=db_path)
+        # Shared-cache in-memory database: no disk I/O, but every connection
+        # opened by DatabaseManager sees the same data
+        db_uri = f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        # The in-memory database is discarded once its last connection closes,
+        # so keep one open for the lifetime of the fixture
+        keepalive = sqlite3.connect(db_uri, uri=True)
+
+        config = DatabaseConfig(db_type='sqlite', database=db_uri, uri=True)
         db_manager = DatabaseManager(config)
         
         # Create tables directly
@@ -88,15 +90,10 @@ class TestDatabaseExtended:
             ''')
             conn.commit()
         
-        from database.database import SearchHistoryDB
         db = SearchHistoryDB(db_manager)
         yield db
-        
-        # Cleanup
-        try:
-            os.unlink(db_path)
-        except:
-            pass
+
+        keepalive.close()
 
     def test_get_search_by_id(self, db):
         """Test retrieving a specific search by ID"""
@@ -174,3 +171,155 @@ class TestDatabaseExtended:
         results = db.get_results_by_search_and_date(search_id, start_date, end_date)
         assert len(results) == 1
         assert results[0]['product_name'] == 'Dell Laptop'
+
+    def test_create_sqlite_db_pooled_in_memory(self):
+        """Test a pooled :memory: database keeps its schema between calls"""
+        db = create_sqlite_db(':memory:', schema_file='database/schema_sqlite.sql', pooled=True)
+        try:
+            search_id = db.create_search('laptop')
+            assert db.get_search_by_id(search_id)['query'] == 'laptop'
+        finally:
+            db.db.close()
+
+    def test_pooled_in_memory_shared_across_threads(self):
+        """Test threads other than the creator can use a pooled :memory: database"""
+        db = create_sqlite_db(':memory:', schema_file='database/schema_sqlite.sql', pooled=True)
+        errors = []
+
+        def search(n):
+            try:
+                with db.transaction():
+                    search_id = db.create_search(f'laptop {n}')
+                    db.update_search(search_id, total_results=0, status='completed')
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            threads = [threading.Thread(target=search, args=(n,)) for n in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert errors == []
+            assert len(db.get_recent_searches(limit=20)) == 8
+        finally:
+            db.db.close()
+
+    def test_transaction_uses_one_connection(self, db):
+        """Test every call inside a transaction shares a single connection"""
+        search_id = db.create_search('laptop')
+        opened = []
+        connect = db.db._connect
+
+        def counting_connect():
+            opened.append(1)
+            return connect()
+
+        db.db._connect = counting_connect
+        with db.transaction():
+            db.add_results_batch(search_id, [
+                {'site': 'amazon', 'product_name': 'Dell Laptop', 'price': '45000'},
+            ])
+            db.update_search(search_id, total_results=1, status='completed')
+            db.add_metadata(search_id, 'source', 'test')
+
+        assert len(opened) == 1
+        assert db.get_search_by_id(search_id)['status'] == 'completed'
+        assert len(db.get_results_by_search_id(search_id)) == 1
+
+    def test_transaction_rolls_back_on_error(self, db):
+        """Test a failing transaction discards every write made inside it"""
+        search_id = db.create_search('laptop')
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.update_search(search_id, total_results=1, status='completed')
+                db.add_metadata(search_id, 'source', 'test')
+                raise RuntimeError("scrape failed")
+
+        assert db.get_search_by_id(search_id)['status'] == 'in_progress'
+        assert db.get_metadata(search_id) == []
+
+    def test_find_recent_completed_search(self, db):
+        """Test only a recent, completed, non-empty search for the query matches"""
+        failed_id = db.create_search('laptop')
+        db.update_search(failed_id, total_results=0, status='failed')
+        empty_id = db.create_search('laptop')
+        db.update_search(empty_id, total_results=0, status='completed')
+        assert db.find_recent_completed_search('laptop', 900) is None
+
+        search_id = db.create_search('Laptop ')
+        db.update_search(search_id, total_results=2, status='completed')
+
+        assert db.find_recent_completed_search('  LAPTOP', 900) == search_id
+        assert db.find_recent_completed_search('phone', 900) is None
+
+    def test_find_recent_completed_search_too_old(self, db):
+        """Test searches older than the window are ignored"""
+        search_id = db.create_search('laptop')
+        db.update_search(search_id, total_results=2, status='completed')
+        db.db.execute_query(
+            "UPDATE searches SET search_timestamp = ? WHERE search_id = ?",
+            (datetime.now() - timedelta(hours=1), search_id)
+        )
+        assert db.find_recent_completed_search('laptop', 900) is None
+
+    def test_find_recent_completed_search_by_sites(self, db):
+        """Test a search limited to some sites only matches the same filter"""
+        search_id = db.create_search('laptop')
+        db.update_search(search_id, total_results=2, status='completed')
+        db.add_metadata(search_id, 'sites_filter', 'amazon')
+
+        assert db.find_recent_completed_search('laptop', 900) is None
+        assert db.find_recent_completed_search('laptop', 900, sites_filter='amazon') == search_id
+        assert db.find_recent_completed_search('laptop', 900, sites_filter='flipkart') is None
+
+    def test_add_results_batch_one_statement_per_site(self, db):
+        """Test batch inserts group results by site and reuse known sites"""
+        search_id = db.create_search('laptop')
+        amazon_id = db.add_site('amazon', 'https://amazon.in')
+        results = [
+            {'site': 'amazon', 'product_name': 'Dell', 'price': 45000.0},
+            {'site': 'flipkart', 'product_name': 'HP', 'price': 40000.0},
+            {'site': 'amazon', 'product_name': 'Lenovo', 'price': 50000.0},
+        ]
+
+        with patch.object(db, 'add_results_many', wraps=db.add_results_many) as many:
+            db.add_results_batch(search_id, results)
+
+        groups = {call.args[1]: [r['product_name'] for r in call.args[2]] for call in many.call_args_list}
+        flipkart_id = db.get_site_by_name('flipkart')['site_id']
+        assert groups == {amazon_id: ['Dell', 'Lenovo'], flipkart_id: ['HP']}
+        stored = db.get_results_by_search_id(search_id)
+        assert sorted((r['product_name'], r['site_name']) for r in stored) == [
+            ('Dell', 'amazon'), ('HP', 'flipkart'), ('Lenovo', 'amazon'),
+        ]
+
+    def test_iter_results_for_export(self, db):
+        """Test stored results stream as EXPORT_COLUMNS rows, cheapest first"""
+        search_id = db.create_search('laptop')
+        db.add_results_batch(search_id, [
+            {'site': 'amazon', 'product_name': 'Dell', 'price': 45000.0, 'url': 'https://a/1'},
+            {'site': 'flipkart', 'product_name': 'HP', 'price': 40000.0, 'url': 'https://f/1'},
+        ])
+        other_id = db.create_search('phone')
+        db.add_results_batch(other_id, [{'site': 'amazon', 'product_name': 'Pixel', 'price': 1.0}])
+
+        rows = [dict(zip(db.EXPORT_COLUMNS, row)) for row in db.iter_results_for_export(search_id)]
+
+        assert [(r['product_name'], r['price'], r['url']) for r in rows] == [
+            ('HP', '40000.0', 'https://f/1'),  # price is a TEXT column here
+            ('Dell', '45000.0', 'https://a/1'),
+        ]
+
+    def test_get_searches_before(self, db):
+        """Test keyset pages walk history newest first without overlap"""
+        ids = [db.create_search(f'query {i}') for i in range(5)]
+
+        first = db.get_searches_before(ids[-1] + 1, limit=2)
+        second = db.get_searches_before(first[-1]['search_id'], limit=2)
+        last = db.get_searches_before(second[-1]['search_id'], limit=2)
+
+        assert [s['search_id'] for s in first + second + last] == ids[::-1]
+        assert db.get_searches_before(ids[0], limit=2) == []
@@ -1,55 +1,67 @@
 """
-Test cases for export utilities (CSV export only)
+Test cases for export utilities (CSV, JSON, Parquet and PDF)
 """
 
+import asyncio
 import io
+import json
 import os
+import signal
 import tempfile
 from datetime import datetime
+from decimal import Decimal
+from types import MappingProxyType
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from reportlab.platypus import LongTable, Paragraph
 
-from utils.export_utils import CSVExporter
+from utils import export_utils
+from utils.export_utils import (
+    CSVExporter, JSONExporter, ParquetExporter, PDFExporter, PDFWorkerPool, _to_columns, create_exporter
+)
+
+_SAMPLE_ROWS = [
+    {
+        'product_name': 'Laptop 1',
+        'price': 50000,
+        'original_price': 60000,
+        'discount_percentage': 16.67,
+        'rating': 4.5,
+        'reviews_count': 100,
+        'availability': 'In Stock',
+        'seller': 'Amazon',
+        'url': 'https://amazon.in/laptop1',
+        'scraped_at': '2024-01-01'
+    },
+    {
+        'product_name': 'Laptop 2',
+        'price': 45000,
+        'original_price': 50000,
+        'discount_percentage': 10.0,
+        'rating': 4.0,
+        'reviews_count': 50,
+        'availability': 'In Stock',
+        'seller': 'Flipkart',
+        'url': 'https://flipkart.com/laptop2',
+        'scraped_at': '2024-01-01'
+    }
+]
+SAMPLE_RESULTS = tuple(MappingProxyType(r) for r in _SAMPLE_ROWS)
 
 
 class TestCSVExporter:
     """Test CSVExporter class"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def csv_exporter(self):
-        """Create CSVExporter instance"""
+        """Create CSVExporter instance (stateless, shared across tests)"""
         return CSVExporter()
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_results(self):
-        """Sample product results"""
-        return [
-            {
-                'product_name': 'Laptop 1',
-                'price': 50000,
-                'original_price': 60000,
-                'discount_percentage': 16.67,
-                'rating': 4.5,
-                'reviews_count': 100,
-                'availability': 'In Stock',
-                'seller': 'Amazon',
-                'url': 'https://amazon.in/laptop1',
-                'scraped_at': '2024-01-01'
-            },
-            {
-                'product_name': 'Laptop 2',
-                'price': 45000,
-                'original_price': 50000,
-                'discount_percentage': 10.0,
-                'rating': 4.0,
-                'reviews_count': 50,
-                'availability': 'In Stock',
-                'seller': 'Flipkart',
-                'url': 'https://flipkart.com/laptop2',
-                'scraped_at': '2024-01-01'
-            }
-        ]
+        """Sample product results, read-only so tests can't leak mutations"""
+        return SAMPLE_RESULTS
 
     def test_csv_exporter_initialization(self, csv_exporter):
         """Test CSVExporter initialization"""
@@ -65,6 +77,9 @@ class TestCSVExporter:
             assert os.path.exists(result_file)
             assert result_file == filename
 
+            with open(result_file, 'r', encoding='utf-8') as f:
+                assert f.readline().startswith('product_name')
+
     def test_export_to_csv_auto_filename(self, csv_exporter, sample_results):
         """Test CSV export with auto-generated filename"""
         filename = csv_exporter.export_to_csv(sample_results)
@@ -74,36 +89,43 @@ class TestCSVExporter:
         if os.path.exists(filename):
             os.remove(filename)
 
-    def test_export_to_csv_content(self, csv_exporter, sample_results):
-        """Test CSV export content is correct"""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            filename = f.name
+    def test_export_to_csv_file_object(self, csv_exporter, sample_results):
+        """Test CSV export to an open file-like object"""
+        buf = io.StringIO()
+        result = csv_exporter.export_to_csv(sample_results, file=buf)
 
-        csv_exporter.export_to_csv(sample_results, filename=filename)
+        assert result is None
+        assert buf.getvalue() == csv_exporter.export_to_csv_string(sample_results)
 
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert 'product_name' in content
-            assert 'Laptop 1' in content
-            assert 'Laptop 2' in content
+    def test_export_to_csv_flush_every(self, csv_exporter, tmp_path):
+        """Test periodic flush syncs once per chunk and keeps the output intact"""
+        rows = [{'product_name': f'P{i}', 'price': i} for i in range(5)]
+        filename = str(tmp_path / 'synced.csv')
 
-        os.remove(filename)
+        with patch('utils.export_utils.os.fsync') as mock_fsync:
+            csv_exporter.export_to_csv(rows, filename=filename, flush_every=2)
 
-    def test_export_to_csv_custom_fields(self, csv_exporter, sample_results):
-        """Test CSV export with custom fields"""
-        custom_fields = ['product_name', 'price', 'url']
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            filename = f.name
+        assert mock_fsync.call_count == 3
+        with open(filename, encoding='utf-8', newline='') as f:
+            assert f.read() == csv_exporter.export_to_csv_string(rows)
 
-        csv_exporter.export_to_csv(sample_results, filename=filename, fields=custom_fields)
+    def test_export_to_csv_flush_every_in_memory(self, csv_exporter, sample_results):
+        """Test periodic flush works on streams without a file descriptor"""
+        buf = io.StringIO()
+        csv_exporter.export_to_csv(sample_results, file=buf, flush_every=1)
+        assert buf.getvalue() == csv_exporter.export_to_csv_string(sample_results)
 
-        with open(filename, 'r', encoding='utf-8') as f:
-            header = f.readline()
-            assert 'product_name' in header
-            assert 'price' in header
-            assert 'url' in header
+    def test_export_to_csv_rows(self, csv_exporter, sample_results):
+        """Test line-by-line CSV export joins to the same text as the string export"""
+        lines = list(csv_exporter.export_to_csv_rows(sample_results))
+        assert len(lines) == len(sample_results) + 1
+        assert lines[0].startswith('product_name,')
+        assert ''.join(lines) == csv_exporter.export_to_csv_string(sample_results)
 
-        os.remove(filename)
+    def test_export_to_csv_rows_empty_raises_error(self, csv_exporter):
+        """Test line-by-line CSV export rejects empty results up front"""
+        with pytest.raises(ValueError, match="No results to export"):
+            csv_exporter.export_to_csv_rows([])
 
     def test_export_to_csv_empty_results_raises_error(self, csv_exporter):
         """Test CSV export with empty results raises error"""
@@ -122,23 +144,29 @@ class TestCSVExporter:
         with pytest.raises(ValueError, match="No results to export"):
             csv_exporter.export_to_csv_string([])
 
-    def test_export_handles_missing_fields(self, csv_exporter):
-        """Test export handles missing fields gracefully"""
-        results = [
-            {'product_name': 'Product 1', 'price': 100},
-            {'product_name': 'Product 2', 'price': 200}
-        ]
-        csv_string = csv_exporter.export_to_csv_string(results)
-        assert 'product_name' in csv_string
-        assert 'price' in csv_string
-
-    def test_export_handles_special_characters(self, csv_exporter):
-        """Test export handles special characters in data"""
-        results = [
-            {'product_name': 'Product, with "comma"', 'price': 100}
-        ]
-        csv_string = csv_exporter.export_to_csv_string(results)
-        assert 'Product, with "comma"' in csv_string or 'Product' in csv_string
+    @pytest.mark.parametrize("rows,fields,expected_substrings", [
+        # Default fields, full rows
+        (SAMPLE_RESULTS, None, ['product_name', 'Laptop 1', 'Laptop 2']),
+        # Custom field selection
+        (SAMPLE_RESULTS, ['product_name', 'price', 'url'], ['product_name,price,url\r\n']),
+        # Rows missing most default fields
+        (
+            [{'product_name': 'Product 1', 'price': 100}, {'product_name': 'Product 2', 'price': 200}],
+            None,
+            ['product_name,price\r\n', 'Product 2,200'],
+        ),
+        # Single field
+        (SAMPLE_RESULTS, ['product_name'], ['product_name\r\nLaptop 1\r\nLaptop 2\r\n']),
+        # Later rows missing a header field get an empty cell
+        ([{'product_name': 'A', 'price': 1}, {'product_name': 'B'}], None, ['A,1\r\n', 'B,\r\n']),
+        # Delimiters and quotes are escaped
+        ([{'product_name': 'Product, with "comma"', 'price': 100}], None, ['"Product, with ""comma""",100']),
+    ], ids=['content', 'custom_fields', 'missing_fields', 'single_field', 'ragged_rows', 'special_characters'])
+    def test_export_to_csv_string_variants(self, csv_exporter, rows, fields, expected_substrings):
+        """Test CSV string export across field selections and row shapes"""
+        csv_string = csv_exporter.export_to_csv_string(rows, fields=fields)
+        for expected in expected_substrings:
+            assert expected in csv_string
 
     def test_timestamp_format_consistency(self):
         """Test timestamp formats are consistent"""
@@ -148,3 +176,236 @@ class TestCSVExporter:
         ]
         csv_string = csv_exp.export_to_csv_string(results)
         assert len(csv_string) > 0
+
+
+class TestJSONExporter:
+    """Test JSONExporter class"""
+
+    ROWS = [{'product_name': 'Café', 'price': Decimal('99.50'), 'scraped_at': datetime(2024, 1, 1, 12, 30)}]
+    EXPECTED = '[{"product_name":"Café","price":"99.50","scraped_at":"2024-01-01T12:30:00"}]'
+
+    def test_create_exporter_json(self):
+        """Test factory returns a JSON exporter"""
+        assert isinstance(create_exporter('json'), JSONExporter)
+
+    def test_export_to_json_string(self):
+        """Test JSON export with the default serializer"""
+        data = JSONExporter().export_to_json_string(SAMPLE_RESULTS)
+        assert json.loads(data) == _SAMPLE_ROWS
+
+    @pytest.mark.parametrize("use_orjson", [
+        pytest.param(True, marks=pytest.mark.skipif(not export_utils.ORJSON_AVAILABLE, reason="orjson not installed")),
+        False,
+    ], ids=['orjson', 'stdlib'])
+    def test_export_to_json_string_serializers_agree(self, monkeypatch, use_orjson):
+        """Test orjson and stdlib paths give identical text for non-JSON types"""
+        monkeypatch.setattr(export_utils, 'ORJSON_AVAILABLE', use_orjson)
+        assert JSONExporter().export_to_json_string(self.ROWS) == self.EXPECTED
+
+    def test_export_to_json_string_empty_raises_error(self):
+        """Test JSON export with empty results raises error"""
+        with pytest.raises(ValueError, match="No results to export"):
+            JSONExporter().export_to_json_string([])
+
+
+class TestParquetExporter:
+    """Test ParquetExporter class"""
+
+    def test_create_exporter_parquet(self):
+        """Test factory returns a Parquet exporter"""
+        assert isinstance(create_exporter('parquet'), ParquetExporter)
+
+    def test_export_without_pyarrow_raises_import_error(self, monkeypatch):
+        """Test a clear error when pyarrow is not installed"""
+        monkeypatch.setattr(export_utils, 'PYARROW_AVAILABLE', False)
+        with pytest.raises(ImportError, match="pyarrow"):
+            ParquetExporter().export_to_parquet(SAMPLE_RESULTS)
+
+    @pytest.mark.skipif(not export_utils.PYARROW_AVAILABLE, reason="pyarrow not installed")
+    def test_export_to_parquet_round_trip(self, tmp_path):
+        """Test Parquet export keeps the present default fields as columns"""
+        import pyarrow.parquet as pq
+
+        filename = str(tmp_path / 'results.parquet')
+        assert ParquetExporter().export_to_parquet(SAMPLE_RESULTS, filename=filename) == filename
+
+        table = pq.read_table(filename)
+        assert table.column_names[0] == 'product_name'
+        assert table.column('product_name').to_pylist() == ['Laptop 1', 'Laptop 2']
+
+
+def _columns(rows):
+    """Columns in the shape the PDF summary and chart sections take"""
+    return _to_columns(rows, ('price', 'rating', 'discount_percentage'))
+
+
+@pytest.fixture(scope="module")
+def pdf_exporter():
+    """Create PDFExporter instance (shared, styles are read-only)"""
+    return PDFExporter()
+
+
+class TestPDFExporter:
+    """Test PDF report building blocks"""
+
+    def test_product_table_repeats_header(self, pdf_exporter):
+        """Test the product table is a LongTable that repeats its header row"""
+        (table,) = pdf_exporter._create_product_table(list(SAMPLE_RESULTS))
+        assert isinstance(table, LongTable)
+        assert table.repeatRows == 1
+
+    def test_generate_reports_bulk(self, pdf_exporter, tmp_path):
+        """Test bulk generation writes every report and keeps job order"""
+        jobs = [([dict(r) for r in SAMPLE_RESULTS], str(tmp_path / f'report_{i}.pdf')) for i in range(2)]
+        paths = pdf_exporter.generate_reports_bulk(jobs, max_workers=2)
+
+        assert paths == [filename for _, filename in jobs]
+        for path in paths:
+            with open(path, 'rb') as f:
+                assert f.read(5) == b'%PDF-'
+
+    def test_worker_pool_renders_bytes(self):
+        """Test the worker pool returns PDF bytes and reuses its workers"""
+        pool = PDFWorkerPool(max_workers=1)
+        try:
+            first = pool.render([dict(r) for r in SAMPLE_RESULTS])
+            executor = pool._executor
+            second = pool.render([dict(r) for r in SAMPLE_RESULTS], title="Again")
+            assert pool._executor is executor
+        finally:
+            pool.shutdown()
+
+        assert first.startswith(b'%PDF-') and second.startswith(b'%PDF-')
+        assert pool._executor is None
+
+    @pytest.mark.skipif(not hasattr(signal, 'SIGKILL'), reason="needs SIGKILL")
+    def test_worker_pool_recovers_from_dead_worker(self):
+        """Test a killed worker does not break every later render"""
+        pool = PDFWorkerPool(max_workers=1)
+        try:
+            pool.render([dict(r) for r in SAMPLE_RESULTS])
+            broken = pool._executor
+            for pid in list(broken._processes):
+                os.kill(pid, signal.SIGKILL)
+
+            pdf = pool.render([dict(r) for r in SAMPLE_RESULTS], title="After crash")
+            assert pdf.startswith(b'%PDF-')
+            assert pool._executor is not broken
+        finally:
+            pool.shutdown()
+
+    def test_worker_pool_empty_raises_error(self):
+        """Test an empty report is rejected without starting workers"""
+        pool = PDFWorkerPool()
+        with pytest.raises(ValueError, match="No results to export"):
+            pool.render([])
+        assert pool._executor is None
+
+    def test_generate_report_to_file_object(self, pdf_exporter):
+        """Test PDF report written to an open binary stream"""
+        buf = io.BytesIO()
+        assert pdf_exporter.generate_report(list(SAMPLE_RESULTS), file=buf) is None
+        assert buf.getvalue().startswith(b'%PDF-')
+
+    def test_best_deals_ordered_by_discount(self, pdf_exporter):
+        """Test best deals keep the five largest discounts, highest first"""
+        rows = [{'product_name': f'P{d}', 'price': 10.0, 'discount_percentage': d}
+                for d in (0, 5, 40, 15, 30, 20, 10)]
+        deals = pdf_exporter._create_best_deals_section(rows)[-1]
+        assert isinstance(deals, Paragraph)
+        names = [line for line in deals.text.split('<br/>') if line.startswith('<b>')]
+        assert names == [f'<b>{i}. P{d}</b>' for i, d in enumerate((40, 30, 20, 15, 10), 1)]
+
+    def test_price_chart_uses_cheapest_products(self, pdf_exporter):
+        """Test the chart plots the ten lowest prices in ascending order"""
+        rows = [{'price': p} for p in range(20, 0, -1)]
+        drawing = pdf_exporter._create_price_chart(_columns(rows))
+        assert drawing.contents[0].data == [[float(p) for p in range(1, 11)]]
+
+    def test_comparison_report_reuses_render(self, tmp_path):
+        """Test repeat comparison reports for the same products render once"""
+        exporter = PDFExporter()
+        rows = [dict(r) for r in SAMPLE_RESULTS]
+        first, second = str(tmp_path / 'first.pdf'), str(tmp_path / 'second.pdf')
+
+        with patch.object(exporter, 'generate_report', wraps=exporter.generate_report) as mock_generate, \
+                patch('utils.export_utils.time.time', return_value=1000.0):
+            exporter.generate_comparison_report(rows, [1, 0], filename=first)
+            exporter.generate_comparison_report(rows, [1, 0], filename=second)
+            exporter.generate_comparison_report(rows, [0], filename=second)
+
+        assert mock_generate.call_count == 2
+        with open(first, 'rb') as f:
+            assert f.read(5) == b'%PDF-'
+
+    def test_comparison_report_rerendered_in_later_window(self, tmp_path):
+        """Test a cached report is not reused once its generation time is stale"""
+        exporter = PDFExporter()
+        rows = [dict(r) for r in SAMPLE_RESULTS]
+        path = str(tmp_path / 'report.pdf')
+        later = 1000.0 + export_utils.PDF_RENDER_CACHE_SECONDS
+
+        with patch.object(exporter, 'generate_report', wraps=exporter.generate_report) as mock_generate:
+            with patch('utils.export_utils.time.time', return_value=1000.0):
+                exporter.generate_comparison_report(rows, [0], filename=path)
+            with patch('utils.export_utils.time.time', return_value=later):
+                exporter.generate_comparison_report(rows, [0], filename=path)
+
+        assert mock_generate.call_count == 2
+
+    def test_comparison_report_empty_selection_raises_error(self, pdf_exporter, tmp_path):
+        """Test comparing no products raises like generate_report"""
+        with pytest.raises(ValueError, match="No results to export"):
+            pdf_exporter.generate_comparison_report([dict(SAMPLE_RESULTS[0])], [5],
+                                                    filename=str(tmp_path / 'empty.pdf'))
+
+    def test_generate_report_async(self, pdf_exporter):
+        """Test the async report writes a PDF to the stream"""
+        buf = io.BytesIO()
+        result = asyncio.run(pdf_exporter.generate_report_async(list(SAMPLE_RESULTS), file=buf))
+
+        assert result is None
+        assert buf.getvalue().startswith(b'%PDF-')
+
+    def test_generate_report_async_empty_raises_error(self, pdf_exporter):
+        """Test the async report rejects empty results before starting threads"""
+        with pytest.raises(ValueError, match="No results to export"):
+            asyncio.run(pdf_exporter.generate_report_async([], file=io.BytesIO()))
+
+    def test_table_styles_built_once(self, pdf_exporter):
+        """Test section builders reuse the exporter's table styles"""
+        with patch('utils.export_utils.TableStyle') as mock_style:
+            pdf_exporter._create_summary_section(_columns(SAMPLE_RESULTS))
+            pdf_exporter._create_product_table(list(SAMPLE_RESULTS))
+        mock_style.assert_not_called()
+
+    def test_to_columns(self):
+        """Test rows are transposed with None for missing fields"""
+        assert _to_columns([{'a': 1, 'b': 2}, {'a': 3}], ('a', 'b')) == {'a': [1, 3], 'b': [2, None]}
+
+    def test_summary_stats(self):
+        """Test averages, extremes and discount count"""
+        stats = PDFExporter._summary_stats(_columns(SAMPLE_RESULTS))
+        assert stats == {
+            'avg_price': 47500.0,
+            'min_price': 45000.0,
+            'max_price': 50000.0,
+            'avg_rating': 4.25,
+            'discounted': 2,
+        }
+
+    def test_summary_stats_skips_missing_values(self):
+        """Test rows without price or rating are left out of those figures"""
+        stats = PDFExporter._summary_stats(_columns([
+            {'price': 100, 'rating': 4.0, 'discount_percentage': 0},
+            {'price': None, 'rating': 0},
+        ]))
+        assert stats['avg_price'] == stats['min_price'] == stats['max_price'] == 100.0
+        assert stats['avg_rating'] == 4.0
+        assert stats['discounted'] == 0
+
+    def test_summary_stats_without_prices(self):
+        """Test empty price and rating columns fall back to zero"""
+        stats = PDFExporter._summary_stats(_columns([{'product_name': 'X'}]))
+        assert stats['avg_price'] == stats['min_price'] == stats['max_price'] == 0
+        assert stats['avg_rating'] == 0
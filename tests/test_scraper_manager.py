@@ -0,0 +1,82 @@
+"""
+Test cases for ScraperManager search entry points
+"""
+
+import asyncio
+
+import pytest
+
+from scrapers.base_scraper import BaseScraper, _fresh_fetches, fresh_fetches
+from scrapers.scraper_manager import ScraperManager
+
+
+def _dummy_scraper(site):
+    """Scraper returning one fixed offer for ``site``"""
+
+    class DummyScraper(BaseScraper):
+        def scrape(self, input_data):
+            return {
+                "site": site,
+                "title": input_data,
+                "price": "₹1000",
+                "rating": "4.5",
+                "availability": "In Stock",
+                "link": f"https://{site.lower()}/item",
+            }
+
+        def get_site_name(self):
+            return site
+
+    return DummyScraper()
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """Manager with two offline scrapers registered"""
+    manager = ScraperManager()
+    manager.registry.clear()
+    manager.registry.register(_dummy_scraper("Sitea"))
+    manager.registry.register(_dummy_scraper("Siteb"))
+    return manager
+
+
+class TestScraperManagerSearch:
+    """Test sync and async search entry points"""
+
+    def test_search_product_async_inside_event_loop(self, manager):
+        """Test awaiting the search from a coroutine gathers every site"""
+        async def caller():
+            return await manager.search_product_async("Prod")
+
+        results = asyncio.run(caller())
+        assert sorted(r["seller"] for r in results) == ["Sitea", "Siteb"]
+
+    def test_search_product_matches_async(self, manager):
+        """Test the sync wrapper returns the same offers"""
+        sync_results = manager.search_product("Prod", ["sitea"])
+        async_results = asyncio.run(manager.search_product_async("Prod", ["sitea"]))
+
+        assert [r["seller"] for r in sync_results] == ["Sitea"]
+        assert [r["seller"] for r in async_results] == ["Sitea"]
+
+    def test_fresh_fetches_reach_scraper_threads(self):
+        """Test fresh_fetches() set by the caller is visible inside each scrape"""
+        seen = []
+
+        class RecordingScraper(BaseScraper):
+            def scrape(self, input_data):
+                seen.append(_fresh_fetches.get())
+                return _dummy_scraper("Sitea").scrape(input_data)
+
+            def get_site_name(self):
+                return "Sitea"
+
+        manager = ScraperManager()
+        manager.registry.clear()
+        manager.registry.register(RecordingScraper())
+
+        with fresh_fetches():
+            manager.search_product("Prod")
+        manager.search_product("Prod")
+
+        assert seen == [True, False]
@@ -2,209 +2,214 @@
 Comprehensive working tests for all scrapers with correct method calls
 """
 
+import importlib
+
 import pytest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, patch
 
-from scrapers.amazon_scraper import AmazonScraper
-from scrapers.flipkart_scraper import FlipkartScraper
-from scrapers.croma_scraper import CromaScraper
-from scrapers.snapdeal_scraper import SnapdealScraper
-from scrapers.myntra_scraper import MyntraScraper
 from scrapers.hybrid_scraper import HybridScraper
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, fresh_fetches
+
+
+class _StubHybrid(HybridScraper):
+    """Minimal concrete HybridScraper for exercising the shared logic"""
+
+    def _scrape_static(self, input_data):
+        return {}
+
+    def _scrape_with_selenium(self, input_data):
+        return {}
+
+
+class _StubBase(BaseScraper):
+    """Minimal concrete BaseScraper"""
+
+    def scrape(self, input_data):
+        return {}
+
+
+@pytest.fixture(scope="module")
+def base_scraper():
+    return _StubBase()
+
+
+@pytest.fixture
+def stub():
+    """Fresh stub for tests that change scraper state"""
+    return _StubHybrid()
+
+
+@pytest.fixture(scope="module")
+def stub_ro():
+    """Shared stub for tests that only read scraper state"""
+    return _StubHybrid()
+
+
+# One scraper instance per class, shared by every test in the module.
+# Site scrapers are imported on first use so a -k selection only loads
+# the modules it needs.
+@pytest.fixture(scope="module")
+def amazon_scraper():
+    from scrapers.amazon_scraper import AmazonScraper
+    return AmazonScraper()
+
+
+@pytest.fixture(scope="module")
+def flipkart_scraper():
+    from scrapers.flipkart_scraper import FlipkartScraper
+    return FlipkartScraper()
+
+
+@pytest.fixture(scope="module")
+def croma_scraper():
+    from scrapers.croma_scraper import CromaScraper
+    return CromaScraper()
+
+
+@pytest.fixture(scope="module")
+def snapdeal_scraper():
+    from scrapers.snapdeal_scraper import SnapdealScraper
+    return SnapdealScraper()
+
+
+@pytest.fixture(scope="module")
+def myntra_scraper():
+    from scrapers.myntra_scraper import MyntraScraper
+    return MyntraScraper()
+
+
+@pytest.fixture
+def amazon_with_search_mock(amazon_scraper):
+    with patch.object(amazon_scraper, '_search_and_scrape') as mock:
+        mock.return_value = {'title': 'Laptop', 'price': '50000'}
+        yield amazon_scraper, mock
+
+
+@pytest.fixture
+def amazon_with_static_mock(amazon_scraper):
+    with patch.object(amazon_scraper, '_scrape_static') as mock:
+        mock.return_value = {'title': 'Product', 'price': '1000'}
+        yield amazon_scraper, mock
+
+
+@pytest.fixture
+def flipkart_with_search_mock(flipkart_scraper):
+    with patch.object(flipkart_scraper, '_search_and_scrape') as mock:
+        mock.return_value = {'title': 'Phone', 'price': '30000'}
+        yield flipkart_scraper, mock
+
+
+@pytest.fixture(scope="module", params=[
+    ('scrapers.amazon_scraper', 'AmazonScraper'),
+    ('scrapers.flipkart_scraper', 'FlipkartScraper'),
+    ('scrapers.croma_scraper', 'CromaScraper'),
+    ('scrapers.snapdeal_scraper', 'SnapdealScraper'),
+    ('scrapers.myntra_scraper', 'MyntraScraper')
+], ids=lambda param: param[1])
+def site_scraper(request):
+    """Each site scraper, built once and shared by the common-behavior tests"""
+    module_name, class_name = request.param
+    scraper_class = getattr(importlib.import_module(module_name), class_name)
+    return scraper_class()
 
 
 class TestAmazonScraperComplete:
     """Complete tests for Amazon scraper"""
 
-    @pytest.fixture
-    def scraper(self):
-        return AmazonScraper()
-
-    def test_initialization(self, scraper):
-        assert scraper.site_name == "Amazon"
-        assert "amazon" in scraper.base_url.lower()
+    def test_initialization(self, amazon_scraper):
+        assert amazon_scraper.site_name == "Amazon"
+        assert "amazon" in amazon_scraper.base_url.lower()
 
-    def test_scrape_with_product_name(self, scraper):
-        with patch.object(scraper, '_search_and_scrape') as mock:
-            mock.return_value = {'title': 'Laptop', 'price': '50000'}
-            result = scraper.scrape("laptop")
-            mock.assert_called_once_with("laptop")
+    def test_scrape_with_product_name(self, amazon_with_search_mock):
+        scraper, mock = amazon_with_search_mock
+        scraper.scrape("laptop")
+        mock.assert_called_once_with("laptop")
 
-    def test_scrape_with_amazon_url(self, scraper):
-        url = "https://www.amazon.in/dp/B0TEST"
-        with patch.object(scraper, '_scrape_static') as mock:
-            mock.return_value = {'title': 'Product', 'price': '1000'}
-            scraper.scrape(url)
-            mock.assert_called_once()
+    def test_scrape_with_amazon_url(self, amazon_with_static_mock):
+        scraper, mock = amazon_with_static_mock
+        scraper.scrape("https://www.amazon.in/dp/B0TEST")
+        mock.assert_called_once()
 
 
 class TestFlipkartScraperComplete:
     """Complete tests for Flipkart scraper"""
 
-    @pytest.fixture
-    def scraper(self):
-        return FlipkartScraper()
-
-    def test_initialization(self, scraper):
-        assert scraper.site_name == "Flipkart"
-        assert "flipkart" in scraper.base_url.lower()
+    def test_initialization(self, flipkart_scraper):
+        assert flipkart_scraper.site_name == "Flipkart"
+        assert "flipkart" in flipkart_scraper.base_url.lower()
 
-    def test_scrape_with_product_name(self, scraper):
-        with patch.object(scraper, '_search_and_scrape') as mock:
-            mock.return_value = {'title': 'Phone', 'price': '30000'}
-            result = scraper.scrape("phone")
-            mock.assert_called_once()
+    def test_scrape_with_product_name(self, flipkart_with_search_mock):
+        scraper, mock = flipkart_with_search_mock
+        scraper.scrape("phone")
+        mock.assert_called_once()
 
 
 class TestCromaScraperComplete:
     """Complete tests for Croma scraper"""
 
-    @pytest.fixture
-    def scraper(self):
-        return CromaScraper()
-
-    def test_initialization(self, scraper):
-        assert scraper.site_name == "Croma"
-        assert "croma" in scraper.base_url.lower()
+    def test_initialization(self, croma_scraper):
+        assert croma_scraper.site_name == "Croma"
+        assert "croma" in croma_scraper.base_url.lower()
 
 
 class TestSnapdealScraperComplete:
     """Complete tests for Snapdeal scraper"""
 
-    @pytest.fixture
-    def scraper(self):
-        return SnapdealScraper()
-
-    def test_initialization(self, scraper):
-        assert scraper.site_name == "Snapdeal"
-        assert "snapdeal" in scraper.base_url.lower()
+    def test_initialization(self, snapdeal_scraper):
+        assert snapdeal_scraper.site_name == "Snapdeal"
+        assert "snapdeal" in snapdeal_scraper.base_url.lower()
 
 
 class TestMyntraScraperComplete:
     """Complete tests for Myntra scraper"""
 
-    @pytest.fixture
-    def scraper(self):
-        return MyntraScraper()
-
-    def test_initialization(self, scraper):
-        assert scraper.site_name == "Myntra"
-        assert "myntra" in scraper.base_url.lower()
+    def test_initialization(self, myntra_scraper):
+        assert myntra_scraper.site_name == "Myntra"
+        assert "myntra" in myntra_scraper.base_url.lower()
 
 
 class TestHybridScraperComplete:
     """Complete tests for HybridScraper"""
 
-    def test_initialization(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {'title': 'Test', 'price': '100'}
-            def _scrape_with_selenium(self, input_data):
-                return {'title': 'Test', 'price': '100'}
-
-        scraper = TestScraper()
-        assert scraper.use_selenium is False
-        assert scraper.retry_attempts == 2
-
-    def test_should_fallback_to_selenium_with_error(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
-
-        scraper = TestScraper()
-        result = {'error': 'test error'}
-        assert scraper._should_fallback_to_selenium(result) is True
+    def test_initialization(self, stub_ro):
+        assert stub_ro.use_selenium is False
+        assert stub_ro.retry_attempts == 2
 
-    def test_should_fallback_with_missing_title(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
+    def test_should_fallback_to_selenium_with_error(self, stub_ro):
+        result = {'error': 'test error'}
+        assert stub_ro._should_fallback_to_selenium(result) is True
 
-        scraper = TestScraper()
+    def test_should_fallback_with_missing_title(self, stub_ro):
         result = {'title': 'N/A', 'price': '100'}
-        assert scraper._should_fallback_to_selenium(result) is True
+        assert stub_ro._should_fallback_to_selenium(result) is True
 
-    def test_should_fallback_with_missing_price(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
-
-        scraper = TestScraper()
+    def test_should_fallback_with_missing_price(self, stub_ro):
         result = {'title': 'Good Title', 'price': 'N/A'}
-        assert scraper._should_fallback_to_selenium(result) is True
-
-    def test_no_fallback_with_valid_data(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
+        assert stub_ro._should_fallback_to_selenium(result) is True
 
-        scraper = TestScraper()
+    def test_no_fallback_with_valid_data(self, stub_ro):
         result = {'title': 'Valid Product Title', 'price': '999'}
-        assert scraper._should_fallback_to_selenium(result) is False
-
-    def test_set_selenium_mode(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
-
-        scraper = TestScraper()
-        scraper.set_selenium_mode(True)
-        assert scraper.use_selenium is True
-
-    def test_set_headless(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
-
-        scraper = TestScraper()
-        scraper.set_headless(False)
-        assert scraper.selenium_config.headless is False
-
-    def test_set_retry_attempts(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
-
-        scraper = TestScraper()
-        scraper.set_retry_attempts(5)
-        assert scraper.retry_attempts == 5
-
-    def test_get_scraping_method(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
-
-        scraper = TestScraper()
-        assert scraper.get_scraping_method() == 'static'
-        scraper.static_failed = True
-        assert scraper.get_scraping_method() == 'selenium'
-
-    def test_get_scraping_stats(self):
-        class TestScraper(HybridScraper):
-            def _scrape_static(self, input_data):
-                return {}
-            def _scrape_with_selenium(self, input_data):
-                return {}
-
-        scraper = TestScraper()
-        stats = scraper.get_scraping_stats()
+        assert stub_ro._should_fallback_to_selenium(result) is False
+
+    def test_set_selenium_mode(self, stub):
+        stub.set_selenium_mode(True)
+        assert stub.use_selenium is True
+
+    def test_set_headless(self, stub):
+        stub.set_headless(False)
+        assert stub.selenium_config.headless is False
+
+    def test_set_retry_attempts(self, stub):
+        stub.set_retry_attempts(5)
+        assert stub.retry_attempts == 5
+
+    def test_get_scraping_method(self, stub):
+        assert stub.get_scraping_method() == 'static'
+        stub.static_failed = True
+        assert stub.get_scraping_method() == 'selenium'
+
+    def test_get_scraping_stats(self, stub_ro):
+        stats = stub_ro.get_scraping_stats()
         assert 'method_used' in stats
         assert 'selenium_mode' in stats
         assert 'retry_attempts' in stats
@@ -214,72 +219,76 @@ class TestHybridScraperComplete:
 class TestBaseScraperComplete:
     """Complete tests for BaseScraper"""
 
-    def test_base_scraper_initialization(self):
-        class TestScraper(BaseScraper):
-            def scrape(self, input_data):
-                return {}
-
-        scraper = TestScraper()
-        assert scraper.timeout == 10
+    def test_base_scraper_initialization(self, base_scraper):
+        assert base_scraper.timeout == 10
 
-    def test_get_headers(self):
-        class TestScraper(BaseScraper):
-            def scrape(self, input_data):
-                return {}
-
-        scraper = TestScraper()
-        headers = scraper.get_headers()
+    def test_get_headers(self, base_scraper):
+        headers = base_scraper.get_headers()
         assert 'User-Agent' in headers
         assert isinstance(headers, dict)
 
-    def test_create_error_result(self):
-        class TestScraper(BaseScraper):
-            def scrape(self, input_data):
-                return {}
+    def test_custom_header_does_not_leak_into_template(self):
+        scraper = _StubBase()
+        scraper.set_custom_header('X-Test', '1')
+        assert scraper.get_headers()['X-Test'] == '1'
+        assert 'X-Test' not in _StubBase().get_headers()
+        assert 'X-Test' not in BaseScraper._HEADER_TEMPLATE
 
-        scraper = TestScraper()
-        error = scraper.create_error_result("Test error")
+    def test_create_error_result(self, base_scraper):
+        error = base_scraper.create_error_result("Test error")
         assert 'error' in error
         assert error['error'] == "Test error"
 
 
+class TestHttpGet:
+    """Test page fetches through the shared HTTP session"""
+
+    @pytest.fixture
+    def session(self):
+        """Mock session installed for every scraper, removed afterwards"""
+        session = MagicMock()
+        BaseScraper.set_http_session(session)
+        yield session
+        BaseScraper.set_http_session(None)
+
+    def test_plain_requests_without_session(self, base_scraper):
+        with patch('scrapers.base_scraper.requests.get') as mock_get:
+            base_scraper.http_get('https://example.com', timeout=5)
+        mock_get.assert_called_once_with('https://example.com', timeout=5)
+
+    def test_uses_session(self, base_scraper, session):
+        base_scraper.http_get('https://example.com', timeout=5)
+        session.get.assert_called_once_with('https://example.com', timeout=5)
+
+    def test_fresh_fetches_skip_cached_pages(self, base_scraper, session):
+        with fresh_fetches():
+            base_scraper.http_get('https://example.com')
+        base_scraper.http_get('https://example.com')
+
+        first, second = session.get.call_args_list
+        assert first.kwargs == {'force_refresh': True}
+        assert second.kwargs == {}
+
+    def test_fresh_fetches_disabled(self, base_scraper, session):
+        with fresh_fetches(False):
+            base_scraper.http_get('https://example.com')
+        assert session.get.call_args.kwargs == {}
+
+
 class TestScraperCommonBehavior:
     """Test common behavior across all scrapers"""
 
-    @pytest.mark.parametrize("scraper_class", [
-        AmazonScraper,
-        FlipkartScraper,
-        CromaScraper,
-        SnapdealScraper,
-        MyntraScraper
-    ])
-    def test_all_scrapers_have_required_attributes(self, scraper_class):
-        scraper = scraper_class()
-        assert hasattr(scraper, 'site_name')
-        assert hasattr(scraper, 'base_url')
-        assert hasattr(scraper, 'scrape')
-        assert len(scraper.site_name) > 0
-        assert scraper.base_url.startswith('http')
-
-    @pytest.mark.parametrize("scraper_class", [
-        AmazonScraper,
-        FlipkartScraper,
-        CromaScraper,
-        SnapdealScraper,
-        MyntraScraper
-    ])
-    def test_all_scrapers_inherit_from_hybrid(self, scraper_class):
-        assert issubclass(scraper_class, HybridScraper)
-
-    @pytest.mark.parametrize("scraper_class", [
-        AmazonScraper,
-        FlipkartScraper,
-        CromaScraper,
-        SnapdealScraper,
-        MyntraScraper
-    ])
-    def test_scrapers_implement_required_methods(self, scraper_class):
-        scraper = scraper_class()
-        assert callable(getattr(scraper, 'scrape', None))
-        assert callable(getattr(scraper, 'get_headers', None))
-        assert callable(getattr(scraper, 'create_error_result', None))
+    def test_all_scrapers_have_required_attributes(self, site_scraper):
+        assert hasattr(site_scraper, 'site_name')
+        assert hasattr(site_scraper, 'base_url')
+        assert hasattr(site_scraper, 'scrape')
+        assert len(site_scraper.site_name) > 0
+        assert site_scraper.base_url.startswith('http')
+
+    def test_all_scrapers_inherit_from_hybrid(self, site_scraper):
+        assert issubclass(type(site_scraper), HybridScraper)
+
+    def test_scrapers_implement_required_methods(self, site_scraper):
+        assert callable(getattr(site_scraper, 'scrape', None))
+        assert callable(getattr(site_scraper, 'get_headers', None))
+        assert callable(getattr(site_scraper, 'create_error_result', None))
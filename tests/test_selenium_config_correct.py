@@ -3,25 +3,95 @@ Comprehensive tests for Selenium configuration and helper classes
 Tests SeleniumConfig and SeleniumHelper with mocked WebDriver
 """
 
+import itertools
+import random
+
 import pytest
-from unittest.mock import MagicMock, Mock, patch, call
+from unittest.mock import MagicMock, Mock, patch, sentinel
+
+# Skip the module cleanly when Selenium is not installed
+pytest.importorskip('selenium')
+
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 
 from scrapers.selenium_config import SeleniumConfig, SeleniumHelper
 
 
+# Locator strategies bound once for the whole module
+_BY_ID, _BY_CLASS = By.ID, By.CLASS_NAME
+
+
+@pytest.fixture(autouse=True)
+def _seed_rng():
+    """Make random user-agent and delay choices reproducible"""
+    state = random.getstate()
+    random.seed(0)
+    yield
+    random.setstate(state)
+
+
+@pytest.fixture(scope="module")
+def shared_config():
+    """One default SeleniumConfig for tests that only read its settings"""
+    return SeleniumConfig()
+
+
+@pytest.fixture(scope="module")
+def _webdriver_patches():
+    """Patch Chrome and ChromeDriverManager once for the whole module"""
+    chrome_patch = patch('scrapers.selenium_config.webdriver.Chrome')
+    manager_patch = patch('scrapers.selenium_config.ChromeDriverManager')
+    mock_chrome = chrome_patch.start()
+    mock_driver_manager = manager_patch.start()
+    yield mock_chrome, mock_driver_manager
+    manager_patch.stop()
+    chrome_patch.stop()
+
+
+@pytest.fixture
+def webdriver_mocks(_webdriver_patches):
+    """Module-wide Chrome/driver-manager mocks, reset to defaults for each test"""
+    mock_chrome, mock_driver_manager = _webdriver_patches
+    mock_chrome.reset_mock(return_value=True, side_effect=True)
+    mock_driver_manager.reset_mock(return_value=True, side_effect=True)
+    mock_chrome.return_value = MagicMock()
+    mock_driver_manager.return_value.install.return_value = '/path/to/driver'
+    return mock_chrome, mock_driver_manager
+
+
+@pytest.fixture(scope="module")
+def _base_driver():
+    """Spec'd WebDriver mock built once for the module"""
+    return Mock(spec_set=WebDriver)
+
+
+@pytest.fixture(scope="module")
+def element_factory():
+    """Return a maker that re-primes one cached WebElement mock"""
+    base = Mock(spec_set=WebElement)
+
+    def make(text=None, attr_ret=None):
+        base.reset_mock(return_value=True, side_effect=True)
+        base.text = text
+        base.get_attribute.return_value = attr_ret
+        return base
+
+    return make
+
+
 class TestSeleniumConfig:
     """Test SeleniumConfig class initialization and driver creation"""
 
-    def test_initialization_default_settings(self):
+    def test_initialization_default_settings(self, shared_config):
         """Test SeleniumConfig initializes with default settings"""
-        config = SeleniumConfig()
-        assert config.headless is True
-        assert config.window_size == "1920,1080"
-        assert config.page_load_timeout == 30
-        assert config.implicit_wait == 10
-        assert config.script_timeout == 30
+        assert shared_config.headless is True
+        assert shared_config.window_size == "1920,1080"
+        assert shared_config.page_load_timeout == 30
+        assert shared_config.implicit_wait == 10
+        assert shared_config.script_timeout == 30
 
     def test_initialization_custom_settings(self):
         """Test SeleniumConfig with custom settings"""
@@ -29,28 +99,23 @@ class TestSeleniumConfig:
         assert config.headless is False
         assert config.window_size == "1366,768"
 
-    def test_user_agents_pool_exists(self):
+    def test_user_agents_pool_exists(self, shared_config):
         """Test that user agents pool is properly initialized"""
-        config = SeleniumConfig()
-        assert hasattr(config, 'user_agents')
-        assert isinstance(config.user_agents, list)
-        assert len(config.user_agents) > 0
+        assert hasattr(shared_config, 'user_agents')
+        assert isinstance(shared_config.user_agents, tuple)
+        assert len(shared_config.user_agents) > 0
 
-    def test_user_agents_variety(self):
+    def test_user_agents_variety(self, shared_config):
         """Test user agents include different browsers and platforms"""
-        config = SeleniumConfig()
-        agents_str = ' '.join(config.user_agents)
-        assert 'Chrome' in agents_str
-        assert 'Firefox' in agents_str
-        assert 'Windows' in agents_str or 'Macintosh' in agents_str
-
-    @patch('scrapers.selenium_config.webdriver.Chrome')
-    @patch('scrapers.selenium_config.ChromeDriverManager')
-    def test_create_driver_headless(self, mock_driver_manager, mock_chrome):
+        agents = shared_config.user_agents
+        assert any('Chrome' in ua for ua in agents)
+        assert any('Firefox' in ua for ua in agents)
+        assert any('Windows' in ua or 'Macintosh' in ua for ua in agents)
+
+    def test_create_driver_headless(self, webdriver_mocks):
         """Test driver creation in headless mode"""
-        mock_driver_instance = MagicMock()
-        mock_chrome.return_value = mock_driver_instance
-        mock_driver_manager.return_value.install.return_value = '/path/to/driver'
+        mock_chrome, _ = webdriver_mocks
+        mock_driver_instance = mock_chrome.return_value
 
         config = SeleniumConfig(headless=True)
         driver = config.create_driver()
@@ -61,13 +126,9 @@ class TestSeleniumConfig:
         mock_driver_instance.implicitly_wait.assert_called_with(10)
         mock_driver_instance.set_script_timeout.assert_called_with(30)
 
-    @patch('scrapers.selenium_config.webdriver.Chrome')
-    @patch('scrapers.selenium_config.ChromeDriverManager')
-    def test_create_driver_non_headless(self, mock_driver_manager, mock_chrome):
+    def test_create_driver_non_headless(self, webdriver_mocks):
         """Test driver creation in non-headless mode"""
-        mock_driver_instance = MagicMock()
-        mock_chrome.return_value = mock_driver_instance
-        mock_driver_manager.return_value.install.return_value = '/path/to/driver'
+        mock_chrome, _ = webdriver_mocks
 
         config = SeleniumConfig(headless=False)
         driver = config.create_driver()
@@ -75,40 +136,32 @@ class TestSeleniumConfig:
         assert driver is not None
         mock_chrome.assert_called_once()
 
-    @patch('scrapers.selenium_config.webdriver.Chrome')
-    @patch('scrapers.selenium_config.ChromeDriverManager')
-    def test_create_driver_executes_stealth_script(self, mock_driver_manager, mock_chrome):
+    def test_create_driver_executes_stealth_script(self, webdriver_mocks, shared_config):
         """Test driver executes anti-detection stealth script"""
-        mock_driver_instance = MagicMock()
-        mock_chrome.return_value = mock_driver_instance
-        mock_driver_manager.return_value.install.return_value = '/path/to/driver'
+        mock_chrome, _ = webdriver_mocks
+        drivers = [MagicMock(), MagicMock()]
+        mock_chrome.side_effect = drivers
 
-        config = SeleniumConfig()
-        driver = config.create_driver()
+        shared_config.create_driver()
+        shared_config.create_driver()
 
-        # Verify CDP command was executed for stealth
-        mock_driver_instance.execute_cdp_cmd.assert_called_once()
-        call_args = mock_driver_instance.execute_cdp_cmd.call_args
-        assert call_args[0][0] == 'Page.addScriptToEvaluateOnNewDocument'
-        assert 'webdriver' in call_args[0][1]['source']
+        # Verify the stealth script is registered exactly once per driver
+        for driver in drivers:
+            driver.execute_cdp_cmd.assert_called_once()
+            command, params = driver.execute_cdp_cmd.call_args[0]
+            assert command == 'Page.addScriptToEvaluateOnNewDocument'
+            assert "Object.defineProperty(navigator, 'webdriver'" in params['source']
 
-    @patch('scrapers.selenium_config.webdriver.Chrome')
-    @patch('scrapers.selenium_config.ChromeDriverManager')
-    def test_create_driver_random_user_agent(self, mock_driver_manager, mock_chrome):
-        """Test driver uses random user agent"""
-        mock_driver_instance = MagicMock()
-        mock_chrome.return_value = mock_driver_instance
-        mock_driver_manager.return_value.install.return_value = '/path/to/driver'
+    def test_create_driver_random_user_agent(self, webdriver_mocks, shared_config):
+        """Test driver uses the seeded random user agent from the pool"""
+        mock_chrome, _ = webdriver_mocks
 
-        config = SeleniumConfig()
-        
-        # Create multiple drivers and check user agents vary
-        user_agents_used = []
-        for _ in range(5):
-            mock_chrome.reset_mock()
-            driver = config.create_driver()
-            # User agent is set in chrome_options, check if Chrome was called
-            assert mock_chrome.called
+        shared_config.create_driver()
+
+        options = mock_chrome.call_args.kwargs['options']
+        user_agents = [arg[len('user-agent='):] for arg in options.arguments
+                       if arg.startswith('user-agent=')]
+        assert user_agents == [random.Random(0).choice(shared_config.user_agents)]
 
     def test_set_page_load_timeout(self):
         """Test setting page load timeout"""
@@ -122,19 +175,16 @@ class TestSeleniumConfig:
         config.set_implicit_wait(20)
         assert config.implicit_wait == 20
 
-    @patch('scrapers.selenium_config.webdriver.Chrome')
-    @patch('scrapers.selenium_config.ChromeDriverManager')
-    def test_create_driver_handles_driver_manager_failure(self, mock_driver_manager, mock_chrome):
+    def test_create_driver_handles_driver_manager_failure(self, webdriver_mocks, shared_config):
         """Test driver creation falls back when driver manager fails"""
-        mock_driver_instance = MagicMock()
-        mock_chrome.return_value = mock_driver_instance
+        mock_chrome, mock_driver_manager = webdriver_mocks
         mock_driver_manager.return_value.install.side_effect = Exception("Failed to download")
 
-        config = SeleniumConfig()
-        driver = config.create_driver()
+        driver = shared_config.create_driver()
 
         # Should still create driver using fallback
         assert driver is not None
+        mock_driver_manager.return_value.install.assert_called_once()
         mock_chrome.assert_called_once()
 
 
@@ -142,13 +192,13 @@ class TestSeleniumHelper:
     """Test SeleniumHelper utility methods"""
 
     @pytest.fixture
-    def mock_driver(self):
-        """Create a mock WebDriver instance"""
-        driver = MagicMock()
-        driver.find_element.return_value = MagicMock()
-        driver.find_elements.return_value = [MagicMock()]
-        driver.execute_script.return_value = 'complete'
-        return driver
+    def mock_driver(self, _base_driver):
+        """Shared WebDriver mock, reset and re-stubbed for each test"""
+        _base_driver.reset_mock(return_value=True, side_effect=True)
+        _base_driver.find_element.return_value = Mock(spec_set=WebElement)
+        _base_driver.find_elements.return_value = [Mock(spec_set=WebElement)]
+        _base_driver.execute_script.return_value = 'complete'
+        return _base_driver
 
     @pytest.fixture
     def helper(self, mock_driver):
@@ -160,63 +210,30 @@ class TestSeleniumHelper:
         helper = SeleniumHelper(mock_driver)
         assert helper.driver == mock_driver
 
+    @pytest.mark.parametrize("method_name,args,raises,expected", [
+        ('wait_for_element', (_BY_ID, 'test-id', 10), False, sentinel.element),
+        ('wait_for_element', (_BY_ID, 'missing-id', 5), True, None),
+        ('wait_for_element_clickable', (_BY_ID, 'button-id', 10), False, sentinel.element),
+        ('wait_for_element_clickable', (_BY_ID, 'disabled-button', 5), True, None),
+        ('wait_for_page_load', (30,), False, True),
+        ('wait_for_page_load', (5,), True, False),
+    ], ids=[
+        'element-success', 'element-timeout',
+        'clickable-success', 'clickable-timeout',
+        'page-load-success', 'page-load-timeout',
+    ])
     @patch('scrapers.selenium_config.WebDriverWait')
-    def test_wait_for_element_success(self, mock_wait, helper):
-        """Test waiting for element successfully"""
-        mock_element = MagicMock()
-        mock_wait.return_value.until.return_value = mock_element
-
-        element = helper.wait_for_element(By.ID, 'test-id', timeout=10)
-        
-        assert element == mock_element
-        mock_wait.assert_called_once_with(helper.driver, 10)
-
-    @patch('scrapers.selenium_config.WebDriverWait')
-    def test_wait_for_element_timeout(self, mock_wait, helper):
-        """Test waiting for element timeout"""
-        mock_wait.return_value.until.side_effect = TimeoutException()
-
-        element = helper.wait_for_element(By.ID, 'missing-id', timeout=5)
-        
-        assert element is None
-
-    @patch('scrapers.selenium_config.WebDriverWait')
-    def test_wait_for_element_clickable_success(self, mock_wait, helper):
-        """Test waiting for clickable element"""
-        mock_element = MagicMock()
-        mock_wait.return_value.until.return_value = mock_element
-
-        element = helper.wait_for_element_clickable(By.ID, 'button-id', timeout=10)
-        
-        assert element == mock_element
-
-    @patch('scrapers.selenium_config.WebDriverWait')
-    def test_wait_for_element_clickable_timeout(self, mock_wait, helper):
-        """Test waiting for clickable element timeout"""
-        mock_wait.return_value.until.side_effect = TimeoutException()
-
-        element = helper.wait_for_element_clickable(By.ID, 'disabled-button', timeout=5)
-        
-        assert element is None
-
-    @patch('scrapers.selenium_config.WebDriverWait')
-    def test_wait_for_page_load_success(self, mock_wait, helper, mock_driver):
-        """Test waiting for page load"""
-        mock_driver.execute_script.return_value = 'complete'
-        mock_wait.return_value.until.return_value = True
-
-        result = helper.wait_for_page_load(timeout=30)
-        
-        assert result is True
-
-    @patch('scrapers.selenium_config.WebDriverWait')
-    def test_wait_for_page_load_timeout(self, mock_wait, helper):
-        """Test page load timeout"""
-        mock_wait.return_value.until.side_effect = TimeoutException()
-
-        result = helper.wait_for_page_load(timeout=5)
-        
-        assert result is False
+    def test_wait_variants(self, mock_wait, helper, monkeypatch,
+                           method_name, args, raises, expected):
+        """Test wait helpers return the element/flag on success and a fallback on timeout"""
+        # wait_for_page_load pauses after a successful load
+        monkeypatch.setattr('scrapers.selenium_config.time.sleep', lambda _: None)
+        mock_wait.return_value.until.return_value = sentinel.element
+        if raises:
+            mock_wait.return_value.until.side_effect = TimeoutException()
+
+        assert getattr(helper, method_name)(*args) == expected
+        mock_wait.assert_called_once_with(helper.driver, args[-1])
 
     @patch('scrapers.selenium_config.WebDriverWait')
     def test_wait_for_ajax_with_jquery(self, mock_wait, helper, mock_driver):
@@ -239,42 +256,38 @@ class TestSeleniumHelper:
 
     def test_safe_find_element_found(self, helper, mock_driver):
         """Test safe find element when element exists"""
-        mock_element = MagicMock()
+        mock_element = Mock(spec_set=WebElement)
         mock_driver.find_element.return_value = mock_element
 
-        element = helper.safe_find_element(By.ID, 'test-id')
+        element = helper.safe_find_element(_BY_ID, 'test-id')
         
         assert element == mock_element
 
-    def test_safe_find_element_not_found(self, helper, mock_driver):
-        """Test safe find element when element missing"""
-        mock_driver.find_element.side_effect = NoSuchElementException()
-
-        element = helper.safe_find_element(By.ID, 'missing-id')
-        
-        assert element is None
-
     def test_safe_find_elements_found(self, helper, mock_driver):
         """Test safe find elements when elements exist"""
-        mock_elements = [MagicMock(), MagicMock()]
+        mock_elements = [Mock(spec_set=WebElement), Mock(spec_set=WebElement)]
         mock_driver.find_elements.return_value = mock_elements
 
-        elements = helper.safe_find_elements(By.CLASS_NAME, 'test-class')
+        elements = helper.safe_find_elements(_BY_CLASS, 'test-class')
         
         assert elements == mock_elements
 
-    def test_safe_find_elements_not_found(self, helper, mock_driver):
-        """Test safe find elements when no elements found"""
-        mock_driver.find_elements.side_effect = NoSuchElementException()
+    @pytest.mark.parametrize("method_name,args,driver_method,exc,expected", [
+        ('safe_find_element', (_BY_ID, 'missing-id'), 'find_element', NoSuchElementException(), None),
+        ('safe_find_elements', (_BY_CLASS, 'missing-class'), 'find_elements', NoSuchElementException(), []),
+        ('is_element_present', (_BY_ID, 'missing-id'), 'find_element', NoSuchElementException(), False),
+        ('take_screenshot', ('test.png',), 'save_screenshot', Exception("Failed"), False),
+    ], ids=['safe_find_element', 'safe_find_elements', 'is_element_present', 'take_screenshot'])
+    def test_error_path_fallbacks(self, helper, mock_driver,
+                                  method_name, args, driver_method, exc, expected):
+        """Test helpers return their fallback when the driver call raises"""
+        getattr(mock_driver, driver_method).side_effect = exc
 
-        elements = helper.safe_find_elements(By.CLASS_NAME, 'missing-class')
-        
-        assert elements == []
+        assert getattr(helper, method_name)(*args) == expected
 
-    def test_get_text_safe_with_element(self):
+    def test_get_text_safe_with_element(self, element_factory):
         """Test getting text from element safely"""
-        mock_element = MagicMock()
-        mock_element.text = '  Test Text  '
+        mock_element = element_factory(text='  Test Text  ')
 
         text = SeleniumHelper.get_text_safe(mock_element)
         
@@ -292,19 +305,17 @@ class TestSeleniumHelper:
         
         assert text == 'Not Found'
 
-    def test_get_text_safe_empty_text(self):
+    def test_get_text_safe_empty_text(self, element_factory):
         """Test getting text when element has no text"""
-        mock_element = MagicMock()
-        mock_element.text = ''
+        mock_element = element_factory(text='')
 
         text = SeleniumHelper.get_text_safe(mock_element)
         
         assert text == 'N/A'
 
-    def test_get_attribute_safe_with_element(self):
+    def test_get_attribute_safe_with_element(self, element_factory):
         """Test getting attribute safely"""
-        mock_element = MagicMock()
-        mock_element.get_attribute.return_value = 'http://example.com'
+        mock_element = element_factory(attr_ret='http://example.com')
 
         attr = SeleniumHelper.get_attribute_safe(mock_element, 'href')
         
@@ -324,23 +335,15 @@ class TestSeleniumHelper:
 
     def test_is_element_present_exists(self, helper, mock_driver):
         """Test checking if element is present"""
-        mock_driver.find_element.return_value = MagicMock()
+        mock_driver.find_element.return_value = Mock(spec_set=WebElement)
 
-        result = helper.is_element_present(By.ID, 'test-id')
+        result = helper.is_element_present(_BY_ID, 'test-id')
         
         assert result is True
 
-    def test_is_element_present_missing(self, helper, mock_driver):
-        """Test checking if element is absent"""
-        mock_driver.find_element.side_effect = NoSuchElementException()
-
-        result = helper.is_element_present(By.ID, 'missing-id')
-        
-        assert result is False
-
     def test_scroll_to_element(self, helper, mock_driver):
         """Test scrolling to element"""
-        mock_element = MagicMock()
+        mock_element = Mock(spec_set=WebElement)
         
         helper.scroll_to_element(mock_element)
         
@@ -354,19 +357,20 @@ class TestSeleniumHelper:
         mock_driver.execute_script.assert_called_once()
         assert 'scrollHeight' in mock_driver.execute_script.call_args[0][0]
 
-    @patch('scrapers.selenium_config.time.sleep')
-    def test_human_like_delay(self, mock_sleep):
+    def test_human_like_delay(self, monkeypatch):
         """Test human-like delay"""
+        calls = []
+        monkeypatch.setattr('scrapers.selenium_config.time.sleep', calls.append)
+
         SeleniumHelper.human_like_delay(0.5, 2.0)
-        
-        mock_sleep.assert_called_once()
-        # Check delay is within range
-        delay = mock_sleep.call_args[0][0]
-        assert 0.5 <= delay <= 2.0
+
+        # Check a single delay within range
+        assert len(calls) == 1
+        assert 0.5 <= calls[0] <= 2.0
 
     def test_click_element_safe_normal_click(self, helper, mock_driver):
         """Test safe clicking element normally"""
-        mock_element = MagicMock()
+        mock_element = Mock(spec_set=WebElement)
         
         result = helper.click_element_safe(mock_element)
         
@@ -375,7 +379,7 @@ class TestSeleniumHelper:
 
     def test_click_element_safe_with_scroll(self, helper, mock_driver):
         """Test safe clicking with scroll on failure"""
-        mock_element = MagicMock()
+        mock_element = Mock(spec_set=WebElement)
         mock_element.click.side_effect = [Exception("Not clickable"), None]
         
         result = helper.click_element_safe(mock_element)
@@ -386,7 +390,7 @@ class TestSeleniumHelper:
 
     def test_click_element_safe_with_javascript(self, helper, mock_driver):
         """Test safe clicking with JavaScript fallback"""
-        mock_element = MagicMock()
+        mock_element = Mock(spec_set=WebElement)
         mock_element.click.side_effect = Exception("Not clickable")
         mock_driver.execute_script.return_value = None
 
@@ -404,52 +408,35 @@ class TestSeleniumHelper:
         assert result is True
         mock_driver.save_screenshot.assert_called_once_with('test.png')
 
-    def test_take_screenshot_failure(self, helper, mock_driver):
-        """Test taking screenshot failure"""
-        mock_driver.save_screenshot.side_effect = Exception("Failed")
-
-        result = helper.take_screenshot('test.png')
-        
-        assert result is False
-
     def test_handle_lazy_loading(self, helper, mock_driver):
         """Test handling lazy loading content"""
-        # Simulate page height: initial check, scroll, new height check (stabilized)
-        # The implementation calls execute_script twice per iteration:
-        # 1. Get initial height
-        # 2. Scroll down (returns None)
-        # 3. Get new height
+        # execute_script is called for the initial height, then a scroll
+        # (returns None) and a height check per iteration; the height
+        # stabilises on the second check
         mock_driver.execute_script.side_effect = [1000, None, 1500, None, 1500]
 
         result = helper.handle_lazy_loading(scroll_pause_time=0, max_scrolls=3)
         
-        # Will return False if an exception occurs, but should return True on success
-        assert result in [True, False]  # Accept either based on mock behavior
-        # Should have scrolled and checked height
-        assert mock_driver.execute_script.call_count >= 2
+        assert result is True
+        assert mock_driver.execute_script.call_count == 5
 
     def test_handle_lazy_loading_max_scrolls(self, helper, mock_driver):
         """Test lazy loading respects max scrolls"""
         # Always increasing height
-        mock_driver.execute_script.side_effect = [i * 1000 for i in range(1, 20)]
+        mock_driver.execute_script.side_effect = itertools.count(1000, 1000)
 
         result = helper.handle_lazy_loading(scroll_pause_time=0, max_scrolls=3)
         
         assert result is True
-        # Should stop at max_scrolls
+        # Initial height plus a scroll and a height check per allowed scroll
+        assert mock_driver.execute_script.call_count == 1 + 3 * 2
 
 
 class TestSeleniumIntegration:
     """Integration tests for SeleniumConfig and SeleniumHelper together"""
 
-    @patch('scrapers.selenium_config.webdriver.Chrome')
-    @patch('scrapers.selenium_config.ChromeDriverManager')
-    def test_config_and_helper_integration(self, mock_driver_manager, mock_chrome):
+    def test_config_and_helper_integration(self, webdriver_mocks):
         """Test SeleniumConfig and SeleniumHelper work together"""
-        mock_driver_instance = MagicMock()
-        mock_chrome.return_value = mock_driver_instance
-        mock_driver_manager.return_value.install.return_value = '/path/to/driver'
-
         # Create config and driver
         config = SeleniumConfig(headless=True)
         driver = config.create_driver()
@@ -470,13 +457,13 @@ class TestSeleniumIntegration:
 
     def test_helper_methods_chain(self):
         """Test chaining helper methods"""
-        mock_driver = MagicMock()
-        mock_driver.find_element.return_value = MagicMock()
+        mock_driver = Mock(spec_set=WebDriver)
+        mock_driver.find_element.return_value = Mock(spec_set=WebElement)
         
         helper = SeleniumHelper(mock_driver)
         
         # Chain operations
-        element = helper.safe_find_element(By.ID, 'test')
+        element = helper.safe_find_element(_BY_ID, 'test')
         if element:
             text = helper.get_text_safe(element)
             assert text is not None
@@ -507,10 +494,11 @@ class TestSeleniumConfigEdgeCases:
         helper = SeleniumHelper(None)
         assert helper.driver is None
 
-    def test_get_text_safe_with_exception(self):
+    def test_get_text_safe_with_exception(self, element_factory):
         """Test get_text_safe handles exceptions"""
-        mock_element = MagicMock()
-        mock_element.text = property(lambda self: (_ for _ in ()).throw(Exception("Error")))
+        mock_element = element_factory(
+            text=property(lambda self: (_ for _ in ()).throw(Exception("Error")))
+        )
         
         text = SeleniumHelper.get_text_safe(mock_element)
         
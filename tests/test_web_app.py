@@ -3,116 +3,130 @@ Test cases for Flask web application
 Comprehensive tests for all routes and functionality
 """
 
+import gzip
 import io
-import json
 import tempfile
+import time
+from datetime import datetime
+from decimal import Decimal
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from flask import jsonify, url_for
+from flask.json.provider import DefaultJSONProvider
 
+import web.app as web_app
 from web.app import app
 
-
-@pytest.fixture
-def client():
-    """Create Flask test client"""
-    app.config['TESTING'] = True
-    app.config['SECRET_KEY'] = 'test-secret-key'
-    with app.test_client() as client:
-        yield client
+# Resolve route URLs once instead of pushing a request context per assertion
+with app.test_request_context():
+    _INDEX_URL = url_for('index')
+
+
+# Mocks are built once and re-primed per test; copying a configured
+# MagicMock would share its child mocks (and their call counts)
+_DB_DEFAULTS = {
+    'create_search.return_value': 1,
+    'get_search_history.return_value': [],
+    'get_search.return_value': {'id': 1, 'query': 'test'},
+    'get_results_by_search.return_value': [],
+    'get_recent_searches.return_value': [],
+    'get_search_statistics.return_value': {},
+    'get_popular_queries.return_value': [],
+    'get_site_performance.return_value': [],
+    'find_recent_completed_search.return_value': None,
+    'get_metadata.return_value': [],
+}
+_DB_PROTOTYPE = MagicMock()
+
+# Built once at import; a tuple so views cannot append to the shared rows.
+# Rows stay plain dicts because /api/search serialises them with jsonify.
+_FAKE_RESULTS = (
+    {
+        'name': 'Test Product 1',
+        'price': 100.0,
+        'currency': 'INR',
+        'url': 'https://example.com/1',
+        'site': 'Amazon'
+    },
+    {
+        'name': 'Test Product 2',
+        'price': 200.0,
+        'currency': 'INR',
+        'url': 'https://example.com/2',
+        'site': 'Flipkart'
+    },
+)
+
+_SCRAPER_MANAGER_DEFAULTS = {
+    'search_product.return_value': _FAKE_RESULTS,
+}
+_SCRAPER_MANAGER_PROTOTYPE = MagicMock()
+
+
+def _primed(prototype, defaults):
+    """Reset a prototype mock and apply its default return values"""
+    prototype.reset_mock(return_value=True, side_effect=True)
+    prototype.configure_mock(**defaults)
+    return prototype
 
 
 @pytest.fixture
 def mock_db():
     """Mock database"""
-    with patch('web.app.db') as mock:
-        mock.create_search = MagicMock(return_value=1)
-        mock.add_results_batch = MagicMock()
-        mock.update_search = MagicMock()
-        mock.add_metadata = MagicMock()
-        mock.get_search_history = MagicMock(return_value=[])
-        mock.get_search = MagicMock(return_value={'id': 1, 'query': 'test'})
-        mock.get_results_by_search = MagicMock(return_value=[])
+    with patch('web.app.db', _primed(_DB_PROTOTYPE, _DB_DEFAULTS)) as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_scraper_manager():
     """Mock scraper manager"""
-    with patch('web.app.scraper_manager') as mock:
-        mock.search_product = MagicMock(return_value=[
-            {
-                'name': 'Test Product 1',
-                'price': 100.0,
-                'currency': 'INR',
-                'url': 'https://example.com/1',
-                'site': 'Amazon'
-            },
-            {
-                'name': 'Test Product 2',
-                'price': 200.0,
-                'currency': 'INR',
-                'url': 'https://example.com/2',
-                'site': 'Flipkart'
-            }
-        ])
+    with patch('web.app.scraper_manager',
+               _primed(_SCRAPER_MANAGER_PROTOTYPE, _SCRAPER_MANAGER_DEFAULTS)) as mock:
         yield mock
 
 
+@pytest.fixture(scope="module")
+def index_response(flask_app):
+    """GET / rendered once for the read-only index page checks"""
+    with flask_app.test_client() as client:
+        return client.get('/')
+
+
 class TestIndexRoute:
     """Test index route"""
 
-    def test_index_returns_200(self, client):
+    def test_index_returns_200(self, index_response):
         """Test index page loads successfully"""
-        response = client.get('/')
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
-    def test_index_returns_html(self, client):
+    def test_index_returns_html(self, index_response):
         """Test index page returns HTML"""
-        response = client.get('/')
-        assert b'<!DOCTYPE html>' in response.data or b'<html' in response.data
+        assert b'<!DOCTYPE html>' in index_response.data or b'<html' in index_response.data
 
 
 class TestSubmitInputRoute:
     """Test submit_input route"""
 
-    def test_submit_valid_product_name(self, client):
-        """Test submitting valid product name"""
-        response = client.post('/submit_input', data={'search_input': 'laptop'})
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['success'] is True
-        assert data['type'] == 'product_name'
-        assert data['value'] == 'laptop'
-
-    def test_submit_valid_url(self, client):
-        """Test submitting valid URL"""
-        response = client.post('/submit_input', data={
-            'search_input': 'https://example.com/product'
-        })
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['success'] is True
-        assert data['type'] == 'url'
-
-    def test_submit_invalid_input(self, client):
-        """Test submitting invalid input"""
-        response = client.post('/submit_input', data={'search_input': 'x'})
-        assert response.status_code == 400
-        data = json.loads(response.data)
-        assert data['success'] is False
-
-    def test_submit_empty_input(self, client):
-        """Test submitting empty input"""
-        response = client.post('/submit_input', data={'search_input': ''})
-        assert response.status_code == 400
-        data = json.loads(response.data)
-        assert data['success'] is False
-
-    def test_submit_whitespace_input(self, client):
-        """Test submitting whitespace-only input"""
-        response = client.post('/submit_input', data={'search_input': '   '})
-        assert response.status_code == 400
+    @pytest.mark.parametrize("payload,expected_status,expected_type", [
+        ('laptop', 200, 'product_name'),
+        ('https://example.com/product', 200, 'url'),
+        ('x', 400, None),
+        ('', 400, None),
+        ('   ', 400, None),
+    ], ids=['product_name', 'url', 'too_short', 'empty', 'whitespace'])
+    def test_submit_input(self, flask_app, payload, expected_status, expected_type):
+        """Test submit_input validates the search input"""
+        # Call the view directly; routing adds nothing to a validation check
+        with flask_app.test_request_context('/submit_input', method='POST',
+                                            data={'search_input': payload}):
+            response = flask_app.make_response(web_app.submit_input())
+        assert response.status_code == expected_status
+        data = response.get_json()
+        assert data['success'] is (expected_status == 200)
+        assert data['type'] == expected_type
+        if expected_status == 200:
+            assert data['value'] == payload
 
 
 class TestSearchRoute:
@@ -132,7 +146,7 @@ class TestSearchRoute:
         """Test search without query redirects to index"""
         response = client.post('/search', data={'query': ''})
         assert response.status_code == 302
-        assert response.location.endswith(url_for('index'))
+        assert response.location.endswith(_INDEX_URL)
 
     def test_search_saves_to_database(self, client, mock_db, mock_scraper_manager):
         """Test that search results are saved to database"""
@@ -172,47 +186,252 @@ class TestSearchRoute:
 class TestResultsRoute:
     """Test results route"""
 
-    def test_results_with_cached_data(self, client):
+    def test_results_with_cached_data(self, client, set_current_results):
         """Test results page with cached data"""
-        with patch('web.app.current_results', [{'name': 'Test', 'price': 100}]):
-            response = client.get('/results?q=laptop')
-            assert response.status_code == 200
+        set_current_results([{'name': 'Test', 'price': 100}])
+        response = client.get('/results?q=laptop')
+        assert response.status_code == 200
 
-    def test_results_without_data_redirects(self, client):
+    def test_results_without_data_redirects(self, client, set_current_results):
         """Test results page without data redirects to index"""
-        with patch('web.app.current_results', []):
-            response = client.get('/results')
-            assert response.status_code == 302
+        set_current_results([])
+        response = client.get('/results')
+        assert response.status_code == 302
+
+    def test_results_revalidated_by_etag(self, client, set_current_results, monkeypatch):
+        """Test a repeat view with the page's ETag gets an empty 304"""
+        set_current_results([{'name': 'Test', 'price': 100}])
+        monkeypatch.setattr(web_app, 'current_search_id', 5)
+
+        first = client.get('/results?q=laptop')
+        etag = first.headers['ETag']
+        assert etag.startswith('W/')
+        assert 'no-cache' in first.headers['Cache-Control']
+
+        repeat = client.get('/results?q=laptop', headers={'If-None-Match': etag})
+        assert repeat.status_code == 304
+        assert repeat.data == b''
+
+        other_query = client.get('/results?q=phone', headers={'If-None-Match': etag})
+        assert other_query.status_code == 200
+
+        monkeypatch.setattr(web_app, 'current_search_id', 6)
+        new_search = client.get('/results?q=laptop', headers={'If-None-Match': etag})
+        assert new_search.status_code == 200
 
 
 class TestExportRoutes:
     """Test export functionality"""
 
-    def test_export_csv(self, client):
+    def test_export_csv(self, client, set_current_results):
         """Test CSV export"""
         test_results = [
             {'name': 'Product 1', 'price': 100, 'site': 'Amazon'},
             {'name': 'Product 2', 'price': 200, 'site': 'Flipkart'}
         ]
-        with patch('web.app.current_results', test_results), \
-             patch('web.app.csv_exporter') as mock_exporter:
-            mock_exporter.export_to_csv_string = MagicMock(return_value='name,price\nTest,100')
-            response = client.post('/export/csv')  # Changed to POST
-            assert response.status_code == 200 or response.status_code == 302
+        set_current_results(test_results)
+        response = client.post('/export/csv')  # Changed to POST
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == 'text/csv'
+        assert response.headers['Content-Disposition'].startswith('attachment; filename=price_comparison_')
+        assert response.get_data(as_text=True) == 'price\r\n100\r\n200\r\n'
+
+    def test_export_csv_selected_rows(self, client, set_current_results):
+        """Test only the checked rows are exported, ignoring out-of-range indices"""
+        set_current_results([{'price': 100}, {'price': 200}, {'price': 300}])
+        response = client.post('/export/csv', data={'selected': ['2', '0', '3', '-1']})
+        assert response.get_data(as_text=True) == 'price\r\n300\r\n100\r\n'
+
+    def test_export_csv_gzip(self, client, set_current_results):
+        """Test a large export is gzipped for a client that accepts it"""
+        rows = [{'price': i} for i in range(web_app.CSV_GZIP_MIN_ROWS)]
+        set_current_results(rows)
+
+        response = client.post('/export/csv', headers={'Accept-Encoding': 'gzip, deflate'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        expected = 'price\r\n' + ''.join(f'{i}\r\n' for i in range(len(rows)))
+        assert gzip.decompress(response.get_data()).decode() == expected
+
+    def test_export_csv_small_not_gzipped(self, client, set_current_results):
+        """Test a small export is sent uncompressed even if gzip is accepted"""
+        set_current_results([{'price': 100}])
+        response = client.post('/export/csv', headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_data(as_text=True) == 'price\r\n100\r\n'
+
+    def test_export_csv_by_search_id(self, client, mock_db, mock_scraper_manager, set_current_results):
+        """Test an export naming its search is unaffected by a later search"""
+        set_current_results([])
+        client.post('/search', data={'query': 'laptop'})
+        set_current_results([{'price': 999}])  # someone else's newer search
+
+        response = client.post('/export/csv', data={'search_id': '1'})
 
-    def test_export_pdf(self, client):
+        assert response.get_data(as_text=True) == (
+            'price,url\r\n100.0,https://example.com/1\r\n200.0,https://example.com/2\r\n'
+        )
+        mock_db.get_results_by_search_id.assert_not_called()
+        assert mock_db.record_export.call_args.kwargs['search_id'] == 1
+
+    def test_export_csv_uncached_search_id_reads_db(self, client, mock_db):
+        """Test an export for a search no longer in memory loads it from the database"""
+        mock_db.get_results_by_search_id.return_value = [{
+            'product_name': 'Stored', 'price': 50.0, 'original_price': None,
+            'discount_percentage': None, 'rating': None, 'reviews_count': None,
+            'availability': None, 'seller': 'Amazon', 'product_url': 'https://example.com',
+            'site_name': 'Amazon', 'scraped_at': '2024-01-01',
+        }]
+
+        response = client.post('/export/csv', data={'search_id': '42'})
+
+        mock_db.get_results_by_search_id.assert_called_once_with(42)
+        assert 'Stored,50.0' in response.get_data(as_text=True)
+
+    def test_export_stored_search_csv(self, client, mock_db):
+        """Test a stored search streams straight from the database rows"""
+        mock_db.get_search_by_id.return_value = {'search_id': 7, 'status': 'completed',
+                                                 'total_results': 2}
+        mock_db.EXPORT_COLUMNS = ('product_name', 'price')
+        mock_db.iter_results_for_export.return_value = iter([('HP', 40000.0), ('Dell', 45000.0)])
+
+        response = client.post('/export/csv/7')
+
+        assert response.get_data(as_text=True) == (
+            'product_name,price\r\nHP,40000.0\r\nDell,45000.0\r\n'
+        )
+        assert mock_db.record_export.call_args.kwargs['result_count'] == 2
+        mock_db.get_results_by_search_id.assert_not_called()
+
+    def test_export_completed_search_csv_revalidates(self, client, mock_db):
+        """Test a completed search's CSV is immutable and revalidates to a 304"""
+        mock_db.get_search_by_id.return_value = {'search_id': 7, 'status': 'completed',
+                                                 'total_results': 1}
+        mock_db.EXPORT_COLUMNS = ('price',)
+        mock_db.iter_results_for_export.return_value = iter([(100,)])
+
+        response = client.get('/export/csv/7')
+        assert response.cache_control.immutable
+        assert response.cache_control.max_age == 31536000
+        assert response.headers['Content-Disposition'] == 'attachment; filename=search_7.csv'
+        etag = response.headers['ETag']
+
+        revalidated = client.get('/export/csv/7', headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+
+        # Neither GET came from the export button, so neither is recorded
+        mock_db.record_export.assert_not_called()
+
+    def test_export_in_progress_search_csv_not_cached(self, client, mock_db):
+        """Test a search that may still change is not marked cacheable"""
+        mock_db.get_search_by_id.return_value = {'search_id': 7, 'status': 'in_progress',
+                                                 'total_results': 1}
+        mock_db.EXPORT_COLUMNS = ('price',)
+        mock_db.iter_results_for_export.return_value = iter([(100,)])
+
+        response = client.get('/export/csv/7', headers={'If-None-Match': 'W/"search-7-csv"'})
+
+        assert response.status_code == 200
+        assert 'ETag' not in response.headers
+
+    def test_export_stored_search_csv_empty(self, client, mock_db):
+        """Test a stored search without results redirects back to it"""
+        mock_db.get_search_by_id.return_value = {'search_id': 7, 'status': 'completed',
+                                                 'total_results': 0}
+        response = client.post('/export/csv/7')
+        assert response.status_code == 302
+        mock_db.record_export.assert_not_called()
+        mock_db.iter_results_for_export.assert_not_called()
+
+    def test_export_unknown_search_csv(self, client, mock_db):
+        """Test exporting a search that does not exist redirects"""
+        mock_db.get_search_by_id.return_value = None
+        assert client.post('/export/csv/7').status_code == 302
+
+    def test_export_pdf(self, client, set_current_results):
         """Test PDF export"""
         test_results = [
             {'name': 'Product 1', 'price': 100, 'site': 'Amazon'}
         ]
-        with patch('web.app.current_results', test_results), \
-             patch('web.app.pdf_exporter') as mock_exporter:
+        set_current_results(test_results)
+        with patch('web.app.pdf_exporter') as mock_exporter:
             mock_exporter.generate_report = MagicMock(return_value='/tmp/test.pdf')
             response = client.post('/export/pdf')  # Changed to POST
             # May return 200 or redirect
             assert response.status_code in [200, 302]
 
 
+class TestSearchJobs:
+    """Test background search jobs"""
+
+    @staticmethod
+    def _wait(job_id):
+        """Block until the job's worker thread has finished"""
+        web_app._search_jobs[job_id][2].exception(timeout=5)
+
+    def test_job_runs_scrape_in_background(self, client, mock_db, mock_scraper_manager):
+        """Test a started job reports its results once done"""
+        response = client.post('/api/search/jobs', json={'query': 'laptop'})
+        assert response.status_code == 202
+        job = response.get_json()
+
+        self._wait(job['job_id'])
+        status = client.get(job['status_url']).get_json()
+
+        assert status['done'] is True
+        assert status['success'] is True
+        assert status['search_id'] == job['search_id'] == 1
+        assert status['total'] == len(_FAKE_RESULTS)
+        mock_db.add_results_batch.assert_called_once_with(1, _FAKE_RESULTS)
+        mock_db.add_metadata.assert_any_call(1, 'source', 'api_job')
+
+    def test_job_stores_results_in_real_database(self, client, mock_scraper_manager):
+        """Test a job writes to the app's in-memory database from its worker thread"""
+        offers = [
+            {'product_name': 'Laptop A', 'price': 45000.0, 'seller': 'Amazon', 'url': 'https://amazon.in/a'},
+            {'product_name': 'Laptop B', 'price': 47000.0, 'seller': 'Flipkart', 'url': 'https://flipkart.com/b'},
+        ]
+        mock_scraper_manager.search_product.return_value = offers
+        job = client.post('/api/search/jobs', json={'query': 'thread hop laptop'}).get_json()
+
+        deadline = time.monotonic() + 5
+        status = client.get(job['status_url']).get_json()
+        while not status['done'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+            status = client.get(job['status_url']).get_json()
+
+        assert status['done'] is True
+        assert status['success'] is True, status.get('error')
+        stored = web_app.db.get_search_by_id(job['search_id'])
+        assert stored['status'] == 'completed'
+        assert stored['total_results'] == len(offers)
+
+    def test_failed_job_reports_error(self, client, mock_db, mock_scraper_manager):
+        """Test a scrape error is returned to the poller and recorded"""
+        mock_scraper_manager.search_product.side_effect = Exception("Blocked")
+        job = client.post('/api/search/jobs', json={'query': 'laptop'}).get_json()
+
+        self._wait(job['job_id'])
+        status = client.get(job['status_url']).get_json()
+
+        assert status == {'done': True, 'success': False, 'search_id': 1, 'error': 'Blocked'}
+        assert mock_db.update_search.call_args.kwargs['status'] == 'failed'
+
+    def test_job_requires_query(self, client, mock_db):
+        """Test starting a job without a query is rejected"""
+        response = client.post('/api/search/jobs', json={'query': ''})
+        assert response.status_code == 400
+        mock_db.create_search.assert_not_called()
+
+    def test_unknown_job(self, client):
+        """Test polling an unknown job returns 404"""
+        assert client.get('/api/search/status/missing').status_code == 404
+
+
 class TestHistoryRoutes:
     """Test history functionality"""
 
@@ -235,19 +454,204 @@ class TestHistoryRoutes:
         assert response.status_code in [200, 404]
 
 
+class TestReportCache:
+    """Test caching of statistics and history queries"""
+
+    def test_statistics_queried_once(self, client, mock_db):
+        """Test repeated statistics requests reuse the first query results"""
+        mock_db.get_search_statistics.return_value = {'total_searches': 3}
+        client.get('/statistics')
+        response = client.get('/api/statistics')
+
+        assert response.get_json()['statistics'] == {'total_searches': 3}
+        mock_db.get_search_statistics.assert_called_once_with(days=30)
+        mock_db.get_site_performance.assert_called_once()
+
+    def test_history_queried_once_per_limit(self, client, mock_db):
+        """Test history is cached per limit"""
+        client.get('/api/search/history?limit=5')
+        client.get('/api/search/history?limit=5')
+        client.get('/api/search/history?limit=10')
+        assert mock_db.get_recent_searches.call_count == 2
+
+    def test_search_invalidates_cache(self, client, mock_db, mock_scraper_manager):
+        """Test a finished search is reflected in the next statistics request"""
+        client.get('/api/statistics')
+        client.post('/search', data={'query': 'laptop'})
+        client.get('/api/statistics')
+        assert mock_db.get_search_statistics.call_count == 2
+
+
 class TestAPIEndpoints:
     """Test API endpoints"""
 
-    def test_api_search_endpoint(self, client, mock_db, mock_scraper_manager):
-        """Test API search endpoint if it exists"""
-        response = client.post('/api/search', json={'query': 'laptop'})
+    @pytest.mark.parametrize("method,path,kwargs,allowed_statuses", [
+        ('post', '/api/search', {'json': {'query': 'laptop'}}, (200, 404, 405)),
+        ('get', '/api/results', {}, (200, 404)),
+    ], ids=['search', 'results'])
+    def test_api_endpoint(self, client, mock_db, mock_scraper_manager,
+                          method, path, kwargs, allowed_statuses):
+        """Test API endpoints respond if they exist"""
+        response = getattr(client, method)(path, **kwargs)
         # May or may not be implemented
-        assert response.status_code in [200, 404, 405]
+        assert response.status_code in allowed_statuses
 
-    def test_api_results_endpoint(self, client):
-        """Test API results endpoint if it exists"""
-        response = client.get('/api/results')
-        assert response.status_code in [200, 404]
+
+class TestCachingHeaders:
+    """Test HTTP caching of near-static API responses"""
+
+    @pytest.mark.parametrize("path,max_age", [
+        ('/api/currencies', 3600),
+        ('/api/statistics', web_app.REPORT_CACHE_TTL),
+    ], ids=['currencies', 'statistics'])
+    def test_revalidates_with_etag(self, client, mock_db, mock_scraper_manager, path, max_age):
+        """Test responses carry Cache-Control and an ETag, and a matching refetch gets 304"""
+        mock_scraper_manager.get_supported_currencies.return_value = ['INR', 'USD']
+        response = client.get(path)
+
+        assert response.status_code == 200
+        assert response.cache_control.public
+        assert response.cache_control.max_age == max_age
+        etag = response.headers['ETag']
+
+        revalidated = client.get(path, headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+
+
+class TestCompression:
+    """Test gzip compression of text responses"""
+
+    def test_html_gzipped_when_accepted(self, client):
+        """Test a page is compressed for a client that accepts gzip"""
+        response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.vary
+        assert b'<html' in gzip.decompress(response.get_data())
+
+    def test_not_gzipped_without_accept_encoding(self, client):
+        """Test clients that do not ask for gzip get the plain body"""
+        response = client.get('/')
+        assert 'Content-Encoding' not in response.headers
+        assert b'<html' in response.data
+
+    def test_small_response_not_gzipped(self, client, mock_db):
+        """Test bodies under COMPRESS_MIN_SIZE are left alone"""
+        response = client.get('/api/search/history', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert 'Content-Encoding' not in response.headers
+
+    def test_etag_weakened_and_revalidates(self, client, mock_scraper_manager):
+        """Test a compressed response keeps a usable (weak) ETag"""
+        mock_scraper_manager.get_supported_currencies.return_value = [f'C{i:03}' for i in range(200)]
+        response = client.get('/api/currencies', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['ETag'].startswith('W/')
+        revalidated = client.get('/api/currencies', headers={
+            'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag']})
+        assert revalidated.status_code == 304
+
+
+class TestJSONOutput:
+    """Test API JSON formatting"""
+
+    def test_compact_and_unsorted_in_debug(self, flask_app):
+        """Test jsonify neither indents nor sorts keys, even in debug mode"""
+        debug = flask_app.debug
+        flask_app.debug = True
+        try:
+            with flask_app.app_context():
+                body = jsonify({'b': 1, 'a': [1, 2]}).get_data(as_text=True)
+        finally:
+            flask_app.debug = debug
+
+        assert body == '{"b":1,"a":[1,2]}\n'
+
+
+@pytest.mark.skipif(not web_app.ORJSON_AVAILABLE, reason="orjson not installed")
+class TestJSONProvider:
+    """Test the orjson JSON provider"""
+
+    _PAYLOAD = {
+        'searches': [{'query': 'laptop', 'total_results': 2, 'price': 45000.5}],
+        'when': datetime(2024, 1, 2, 3, 4, 5),
+        'amount': Decimal('10.50'),
+        'count': 1,
+    }
+
+    def test_app_uses_orjson(self, flask_app):
+        """Test jsonify goes through the orjson provider"""
+        assert isinstance(flask_app.json, web_app.ORJSONProvider)
+
+    def test_response_matches_default_provider(self, flask_app):
+        """Test responses are byte-for-byte what the app's default provider settings write"""
+        default_provider = DefaultJSONProvider(flask_app)
+        default_provider.compact = True
+        default_provider.sort_keys = False
+        with flask_app.app_context():
+            fast = web_app.ORJSONProvider(flask_app).response(self._PAYLOAD)
+            default = default_provider.response(self._PAYLOAD)
+        assert fast.get_data() == default.get_data()
+        assert fast.mimetype == 'application/json'
+
+    def test_loads(self, flask_app):
+        """Test request bodies are parsed from bytes or text"""
+        provider = web_app.ORJSONProvider(flask_app)
+        assert provider.loads(b'{"query": "laptop"}') == {'query': 'laptop'}
+        assert provider.loads(provider.dumps(['₹'])) == ['₹']
+
+
+class TestSearchHistoryAPI:
+    """Test keyset pagination of the search history API"""
+
+    def test_first_page_returns_cursor(self, client, mock_db):
+        """Test a full first page points at its last search"""
+        mock_db.get_recent_searches.return_value = [{'search_id': 9}, {'search_id': 8}]
+        data = client.get('/api/search/history?limit=2').get_json()
+
+        assert data['next_cursor'] == 8
+        mock_db.get_searches_before.assert_not_called()
+
+    def test_cursor_fetches_older_page(self, client, mock_db):
+        """Test passing the cursor seeks past it, and a short page ends the walk"""
+        mock_db.get_searches_before.return_value = [{'search_id': 7}]
+        data = client.get('/api/search/history?limit=2&cursor=8').get_json()
+
+        mock_db.get_searches_before.assert_called_once_with(8, limit=2)
+        assert data['searches'] == [{'search_id': 7}]
+        assert data['next_cursor'] is None
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_non_positive_limit_rejected(self, client, mock_db, limit):
+        """Test a limit below 1 is a 400, not an IndexError on the empty page"""
+        response = client.get(f'/api/search/history?limit={limit}')
+
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+        mock_db.get_recent_searches.assert_not_called()
+
+
+class TestSearchResultsAPI:
+    """Test the stored search results endpoint"""
+
+    def test_date_range(self, client, mock_db):
+        """Test start and end dates are parsed and passed to the date query"""
+        mock_db.get_results_by_search_and_date.return_value = []
+        response = client.get('/api/search/1/results?start_date=2024-01-01&end_date=2024-01-02T12:00:00')
+
+        assert response.status_code == 200
+        mock_db.get_results_by_search_and_date.assert_called_once_with(
+            1, datetime(2024, 1, 1), datetime(2024, 1, 2, 12))
+
+    def test_invalid_date_rejected(self, client, mock_db):
+        """Test a malformed date is a 400, not a server error"""
+        response = client.get('/api/search/1/results?start_date=yesterday&end_date=2024-01-02')
+
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+        mock_db.get_results_by_search_and_date.assert_not_called()
 
 
 class TestErrorHandlers:
@@ -284,6 +688,83 @@ class TestSessionManagement:
             assert app.secret_key is not None
 
 
+class TestHTTPCache:
+    """Test the outbound HTTP cache wiring"""
+
+    def test_disabled_in_tests(self):
+        """Test no HTTP cache file is configured for the test run"""
+        assert web_app.http_cache_name == ''
+
+    @pytest.mark.skipif(not web_app.REQUESTS_CACHE_AVAILABLE, reason="requests-cache not installed")
+    def test_install_http_cache(self, tmp_path):
+        """Test installing the cache only affects scraper page fetches"""
+        import requests
+        import requests_cache
+        from scrapers.base_scraper import BaseScraper
+
+        try:
+            assert web_app._install_http_cache(str(tmp_path / 'http_cache')) is True
+            assert isinstance(BaseScraper._http_session, requests_cache.CachedSession)
+            assert not isinstance(requests.Session(), requests_cache.CachedSession)
+        finally:
+            BaseScraper._http_session.close()
+            BaseScraper.set_http_session(None)
+
+    @pytest.mark.skipif(not web_app.REQUESTS_CACHE_AVAILABLE, reason="requests-cache not installed")
+    def test_install_http_cache_creates_folder(self, tmp_path):
+        """Test the cache file's folder (e.g. the instance folder) is created"""
+        from scrapers.base_scraper import BaseScraper
+
+        cache_dir = tmp_path / 'instance'
+        try:
+            assert web_app._install_http_cache(str(cache_dir / 'http_cache')) is True
+            assert cache_dir.is_dir()
+        finally:
+            BaseScraper._http_session.close()
+            BaseScraper.set_http_session(None)
+
+    @pytest.mark.parametrize("body,cacheable", [
+        ('<html><title>Dell Laptop</title></html>', True),
+        ('<html>Enter the characters you see below (CAPTCHA)</html>', False),
+        ('<title>Access Denied</title>', False),
+    ])
+    def test_block_pages_not_cached(self, body, cacheable):
+        """Test block and CAPTCHA pages served with status 200 are rejected"""
+        assert web_app._is_cacheable_page(Mock(text=body)) is cacheable
+
+    def test_refresh_scrape_skips_http_cache(self, client, mock_scraper_manager):
+        """Test a forced refresh scrapes inside fresh_fetches(), a normal one does not"""
+        from scrapers.base_scraper import _fresh_fetches
+        seen = []
+        mock_scraper_manager.search_product.side_effect = (
+            lambda *args: seen.append(_fresh_fetches.get()) or list(_FAKE_RESULTS))
+
+        web_app._cached_search('laptop', refresh=True)
+        web_app._search_cache.clear()
+        web_app._cached_search('laptop')
+
+        assert seen == [True, False]
+
+
+class TestTemplateCache:
+    """Test the Jinja bytecode cache wiring"""
+
+    def test_disabled_in_tests(self):
+        """Test the test run writes no template cache files"""
+        assert app.jinja_env.bytecode_cache is None
+
+    def test_compiled_template_written_to_cache(self, tmp_path):
+        """Test rendering a template stores its bytecode in the cache folder"""
+        from flask import Flask
+
+        other = Flask(__name__, template_folder='../templates')
+        web_app._install_template_cache(other, str(tmp_path))
+        with other.test_request_context():
+            other.jinja_env.get_template('index.html')
+
+        assert list(tmp_path.iterdir())
+
+
 class TestDatabaseIntegration:
     """Test database integration"""
 
@@ -321,17 +802,15 @@ class TestDatabaseIntegration:
 class TestTemplateRendering:
     """Test template rendering"""
 
-    def test_index_template_renders(self, client):
+    def test_index_template_renders(self, index_response):
         """Test index template renders without errors"""
-        response = client.get('/')
-        assert response.status_code == 200
+        assert index_response.status_code == 200
 
-    def test_results_template_renders(self, client):
+    def test_results_template_renders(self, client, set_current_results):
         """Test results template renders with data"""
-        test_results = [{'name': 'Test', 'price': 100}]
-        with patch('web.app.current_results', test_results):
-            response = client.get('/results?q=test')
-            assert response.status_code == 200
+        set_current_results([{'name': 'Test', 'price': 100}])
+        response = client.get('/results?q=test')
+        assert response.status_code == 200
 
 
 class TestSecurityFeatures:
@@ -378,6 +857,94 @@ class TestConcurrentRequests:
         client.post('/search', data={'query': 'phone'})
         assert mock_scraper_manager.search_product.call_count == 2
 
+    def test_repeat_search_served_from_cache(self, client, mock_db, mock_scraper_manager):
+        """Test a repeated query (any case/spacing, same sites) scrapes only once"""
+        client.post('/search', data={'query': 'laptop'})
+        client.post('/search', data={'query': '  Laptop '})
+        response = client.post('/api/search', json={'query': 'LAPTOP', 'sites': ['all']})
+
+        assert mock_scraper_manager.search_product.call_count == 1
+        assert response.get_json()['total'] == len(_FAKE_RESULTS)
+        # Every search is still recorded in history
+        assert mock_db.create_search.call_count == 2
+
+    def test_empty_results_not_cached(self, client, mock_db, mock_scraper_manager):
+        """Test a search that found nothing is retried next time"""
+        mock_scraper_manager.search_product.return_value = []
+        client.post('/search', data={'query': 'laptop'})
+        client.post('/search', data={'query': 'laptop'})
+        assert mock_scraper_manager.search_product.call_count == 2
+
+    def test_recent_stored_search_skips_scrape(self, client, mock_db, mock_scraper_manager):
+        """Test a search completed minutes ago is shown from the database"""
+        mock_db.find_recent_completed_search.return_value = 7
+        mock_db.get_results_by_search_id.return_value = [{
+            'product_name': 'Stored Laptop', 'price': 45000.0, 'rating': '4.5',
+            'reviews_count': 10, 'availability': 'In Stock', 'seller': 'Amazon',
+            'product_url': 'https://example.com/1', 'site_name': 'Amazon',
+            'scraped_at': '2024-01-01',
+        }]
+
+        response = client.post('/search', data={'query': 'laptop'})
+        api_response = client.post('/api/search', json={'query': 'laptop'})
+
+        assert b'Stored Laptop' in response.data
+        assert api_response.get_json()['results'][0]['price_display'] == '₹45,000.00'
+        mock_scraper_manager.search_product.assert_not_called()
+        mock_db.create_search.assert_not_called()
+        mock_db.find_recent_completed_search.assert_called_with(
+            'laptop', web_app.RECENT_SEARCH_MAX_AGE, sites_filter=None)
+
+    def test_recent_stored_search_keeps_currency(self, client, mock_db, mock_scraper_manager):
+        """Test reused results are shown in the currency stored with the search"""
+        mock_db.find_recent_completed_search.return_value = 7
+        mock_db.get_metadata.return_value = [{'metadata_key': 'currency', 'metadata_value': 'USD'}]
+        mock_db.get_results_by_search_id.return_value = [{
+            'product_name': 'Stored Laptop', 'price': 999.5, 'rating': None,
+            'reviews_count': None, 'availability': None, 'seller': None,
+            'product_url': None, 'site_name': 'Amazon', 'scraped_at': '2024-01-01',
+        }]
+
+        result = client.post('/api/search', json={'query': 'laptop'}).get_json()['results'][0]
+
+        assert result['currency'] == 'USD'
+        assert result['price_display'] == '$999.50'
+        mock_db.get_metadata.assert_called_with(7, 'currency')
+
+    @pytest.mark.parametrize("sites,expected", [
+        (['flipkart', 'amazon'], 'amazon,flipkart'),
+        (['Amazon', 'flipkart', 'amazon'], 'amazon,flipkart'),
+        (['all'], None),
+        (['amazon', 'all'], None),
+        ([], None),
+    ])
+    def test_sites_filter_lookup_normalized(self, client, mock_db, mock_scraper_manager,
+                                            sites, expected):
+        """Test the stored-search lookup uses the canonical site selection"""
+        client.post('/api/search', json={'query': 'laptop', 'sites': sites})
+        mock_db.find_recent_completed_search.assert_called_with(
+            'laptop', web_app.RECENT_SEARCH_MAX_AGE, sites_filter=expected)
+
+    def test_scrape_stores_canonical_sites_and_currency(self, client, mock_db, mock_scraper_manager):
+        """Test a scrape records the same sites_filter the lookup will ask for"""
+        mock_scraper_manager.search_product.return_value = [dict(r) for r in _FAKE_RESULTS]
+        client.post('/search', data={'query': 'laptop', 'sites': ['flipkart', 'amazon']})
+        client.post('/search', data={'query': 'phone', 'sites': ['all']})
+
+        metadata = [c.args[1:] for c in mock_db.add_metadata.call_args_list]
+        assert metadata.count(('sites_filter', 'amazon,flipkart')) == 1
+        assert all(key != 'sites_filter' or value != 'all' for key, value in metadata)
+        assert metadata.count(('currency', 'INR')) == 2
+
+    def test_force_refresh_scrapes_again(self, client, mock_db, mock_scraper_manager):
+        """Test force_refresh bypasses both the database and in-memory caches"""
+        mock_db.find_recent_completed_search.return_value = 7
+        client.post('/search', data={'query': 'laptop', 'force_refresh': '1'})
+        client.post('/search', data={'query': 'laptop', 'force_refresh': '1'})
+
+        assert mock_scraper_manager.search_product.call_count == 2
+        mock_db.find_recent_completed_search.assert_not_called()
+
     def test_search_timing(self, client, mock_db, mock_scraper_manager):
         """Test that search duration is tracked"""
         client.post('/search', data={'query': 'laptop'})
@@ -387,11 +954,3 @@ class TestConcurrentRequests:
         call_kwargs = update_calls[0][1]
         assert 'duration_ms' in call_kwargs
         assert isinstance(call_kwargs['duration_ms'], int)
-
-
-# Helper function for testing
-def url_for(endpoint, **values):
-    """Mock url_for for testing"""
-    with app.test_request_context():
-        from flask import url_for as flask_url_for
-        return flask_url_for(endpoint, **values)
@@ -3,11 +3,25 @@ Export utilities for Web Scraper Price Comparison
 Provides CSV and PDF export functionality for scraped product data
 """
 
+import asyncio
 import csv
+import hashlib
+import heapq
 import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from itertools import islice
+from operator import itemgetter
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.shapes import Drawing
 from reportlab.lib import colors
@@ -15,9 +29,105 @@ from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
-from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from reportlab.platypus import LongTable, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 from reportlab.platypus.flowables import HRFlowable
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# The csv module issues one small write per row; a large buffer batches them
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Rendered comparison reports kept per PDFExporter for repeat requests.
+# A render is reused only within the same PDF_RENDER_CACHE_SECONDS window,
+# so its "Generated:" time is never older than that.
+PDF_RENDER_CACHE_SIZE = 16
+PDF_RENDER_CACHE_SECONDS = 60
+
+# Fields the PDF summary and chart sections read, gathered column-wise
+_PDF_COLUMN_FIELDS = ('price', 'rating', 'discount_percentage')
+
+
+def _row_getter(fields: Sequence[str]):
+    """
+    Build a function that pulls ``fields`` out of a result row, in order
+
+    Rows from one scrape share their keys, so itemgetter does the lookups
+    in C; a row missing a field falls back to blank cells for the gaps.
+
+    Args:
+        fields: Field names in output order
+
+    Returns:
+        Callable mapping a row dict to a tuple of values
+    """
+    fields = tuple(fields)
+    if not fields:
+        return lambda r: ()
+
+    if len(fields) == 1:
+        # itemgetter with a single key returns the bare value, not a tuple
+        key = fields[0]
+
+        def getter(r):
+            return (r[key],)
+    else:
+        getter = itemgetter(*fields)
+
+    def row(r):
+        try:
+            return getter(r)
+        except KeyError:
+            return tuple(r.get(f, '') for f in fields)
+
+    return row
+
+
+class _Echo:
+    """Write target that hands back what it is given, so csv.writer returns each line"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _sync_stream(stream: IO) -> None:
+    """Flush a stream and fsync it when it is backed by a real file"""
+    stream.flush()
+    try:
+        os.fsync(stream.fileno())
+    except (AttributeError, OSError):
+        # In-memory streams have no file descriptor to sync
+        pass
+
+
+def _to_columns(results: List[Dict[str, Any]], fields: Sequence[str]) -> Dict[str, List[Any]]:
+    """
+    Transpose result rows into one list per field
+
+    Args:
+        results: List of product dictionaries
+        fields: Fields to extract; missing values become None
+
+    Returns:
+        Dictionary mapping each field to its column of values
+    """
+    columns = {f: [] for f in fields}
+    appenders = [(f, columns[f].append) for f in fields]
+    for r in results:
+        for f, append in appenders:
+            append(r.get(f))
+    return columns
+
 
 class CSVExporter:
     """Handles CSV export functionality for product comparison results"""
@@ -39,7 +149,9 @@ class CSVExporter:
     def export_to_csv(self,
                       results: List[Dict[str, Any]],
                       filename: Optional[str] = None,
-                      fields: Optional[List[str]] = None) -> str:
+                      fields: Optional[List[str]] = None,
+                      file: Optional[IO[str]] = None,
+                      flush_every: Optional[int] = None) -> Optional[str]:
         """
         Export product results to CSV file
 
@@ -47,28 +159,28 @@ class CSVExporter:
             results: List of product dictionaries
             filename: Output filename (default: price_comparison_TIMESTAMP.csv)
             fields: List of fields to include (default: all standard fields)
+            file: Open text file-like object to write to instead of a file on disk
+            flush_every: Flush and fsync after every N rows so a crash loses at
+                most N rows; each sync costs a disk round trip, so leave as
+                None unless the export is long-running
 
         Returns:
-            Path to the created CSV file
+            Path to the created CSV file, or None when writing to ``file``
         """
         if not results:
             raise ValueError("No results to export")
 
+        if file is not None:
+            self._write_csv(file, results, fields, flush_every)
+            return None
+
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"price_comparison_{timestamp}.csv"
 
-        # Use provided fields or default fields
-        export_fields = fields or self.default_fields
-
-        # Filter fields to only include those present in results
-        available_fields = set(results[0].keys())
-        export_fields = [f for f in export_fields if f in available_fields]
-
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=export_fields, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(results)
+        with open(filename, 'w', newline='', encoding='utf-8',
+                  buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+            self._write_csv(csvfile, results, fields, flush_every)
 
         return filename
 
@@ -88,17 +200,97 @@ class CSVExporter:
         if not results:
             raise ValueError("No results to export")
 
-        export_fields = fields or self.default_fields
-        available_fields = set(results[0].keys())
-        export_fields = [f for f in export_fields if f in available_fields]
-
         output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=export_fields, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(results)
+        self._write_csv(output, results, fields)
 
         return output.getvalue()
 
+    def _write_csv(self,
+                   output: IO[str],
+                   results: List[Dict[str, Any]],
+                   fields: Optional[List[str]] = None,
+                   flush_every: Optional[int] = None):
+        """Write header and rows to an open text stream, syncing every ``flush_every`` rows"""
+        export_fields = self._select_fields(results, fields)
+
+        # Plain writer over generated rows skips DictWriter's per-row key checks
+        writer = csv.writer(output)
+        writer.writerow(export_fields)
+        rows = map(_row_getter(export_fields), results)
+
+        if not flush_every:
+            writer.writerows(rows)
+            return
+
+        while True:
+            chunk = list(islice(rows, flush_every))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+            _sync_stream(output)
+
+    def export_to_csv_rows(self,
+                           results: List[Dict[str, Any]],
+                           fields: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Export product results as CSV text, one line at a time
+
+        Lets web responses stream a download instead of holding the whole
+        file in memory.
+
+        Args:
+            results: List of product dictionaries
+            fields: List of fields to include
+
+        Returns:
+            Iterator of CSV lines, header first, each ending in a line terminator
+        """
+        if not results:
+            raise ValueError("No results to export")
+
+        return self._iter_csv_lines(results, self._select_fields(results, fields))
+
+    @staticmethod
+    def export_records_to_csv_rows(records: Iterable[Sequence[Any]],
+                                   fields: Sequence[str]) -> Iterator[str]:
+        """
+        Export rows that are already in column order as CSV text, one line at a time
+
+        Suited to rows streamed from a database cursor: no dict is built per row.
+
+        Args:
+            records: Rows whose values follow ``fields``
+            fields: Header names, one per column
+
+        Yields:
+            CSV lines, header first, each ending in a line terminator
+        """
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields)
+        for record in records:
+            yield writer.writerow(record)
+
+    @staticmethod
+    def _iter_csv_lines(results: List[Dict[str, Any]], export_fields: List[str]) -> Iterator[str]:
+        """Yield the header and each row formatted by csv.writer"""
+        writer = csv.writer(_Echo())
+        yield writer.writerow(export_fields)
+
+        row = _row_getter(export_fields)
+        for r in results:
+            yield writer.writerow(row(r))
+
+    def _select_fields(self,
+                       results: List[Dict[str, Any]],
+                       fields: Optional[List[str]] = None) -> List[str]:
+        """Requested (or default) fields that the first result actually has"""
+        # Use provided fields or default fields
+        export_fields = fields or self.default_fields
+
+        # Filter fields to only include those present in results
+        available_fields = results[0].keys()  # key views have O(1) membership
+        return [f for f in export_fields if f in available_fields]
+
     def export_selected_products(self,
                                  results: List[Dict[str, Any]],
                                  selected_indices: List[int],
@@ -118,15 +310,97 @@ class CSVExporter:
         return self.export_to_csv(selected_results, filename)
 
 
+class JSONExporter:
+    """Handles JSON export for API consumers of product comparison results"""
+
+    def export_to_json_string(self, results: List[Dict[str, Any]]) -> str:
+        """
+        Export product results to a compact JSON array string
+
+        Uses orjson when installed and the standard library otherwise;
+        both produce the same output.
+
+        Args:
+            results: List of product dictionaries
+
+        Returns:
+            JSON data as string
+        """
+        if not results:
+            raise ValueError("No results to export")
+
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(results, default=_json_default).decode('utf-8')
+
+        return json.dumps(list(results), default=_json_default,
+                          separators=(',', ':'), ensure_ascii=False)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values JSON has no type for (dates as ISO 8601, the rest as text)"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+class ParquetExporter:
+    """Handles columnar Parquet export for product comparison results"""
+
+    def __init__(self):
+        self.default_fields = CSVExporter().default_fields
+
+    def export_to_parquet(self,
+                          results: List[Dict[str, Any]],
+                          filename: Optional[str] = None,
+                          fields: Optional[List[str]] = None,
+                          compression: str = 'zstd') -> str:
+        """
+        Export product results to a Parquet file
+
+        Args:
+            results: List of product dictionaries
+            filename: Output filename (default: price_comparison_TIMESTAMP.parquet)
+            fields: List of fields to include (default: all standard fields)
+            compression: Parquet compression codec
+
+        Returns:
+            Path to the created Parquet file
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet export. Install it with: pip install pyarrow")
+
+        if not results:
+            raise ValueError("No results to export")
+
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"price_comparison_{timestamp}.parquet"
+
+        # Same field selection as the CSV export
+        available_fields = results[0].keys()  # key views have O(1) membership
+        export_fields = [f for f in (fields or self.default_fields) if f in available_fields]
+
+        columns = {f: [r.get(f) for r in results] for f in export_fields}
+        pq.write_table(pa.table(columns), filename, compression=compression)
+
+        return filename
+
+
 class PDFExporter:
     """Handles PDF report generation for product comparison results"""
 
     def __init__(self):
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
+        self._render_cache: "OrderedDict[Tuple[str, str, int], bytes]" = OrderedDict()
 
     def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
+        """Setup custom paragraph and table styles"""
         self.styles.add(ParagraphStyle(
             name='CustomTitle',
             parent=self.styles['Heading1'],
@@ -155,11 +429,41 @@ class PDFExporter:
             fontName='Helvetica-Bold'
         ))
 
+        # Built once; setStyle copies the commands, so tables can share these
+        self._summary_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ])
+
+        self._product_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ])
+
     def generate_report(self,
                         results: List[Dict[str, Any]],
                         filename: Optional[str] = None,
                         title: str = "Price Comparison Report",
-                        include_charts: bool = True) -> str:
+                        include_charts: bool = True,
+                        file: Optional[IO[bytes]] = None) -> Optional[str]:
         """
         Generate comprehensive PDF report
 
@@ -168,21 +472,88 @@ class PDFExporter:
             filename: Output filename (default: report_TIMESTAMP.pdf)
             title: Report title
             include_charts: Whether to include charts and visualizations
+            file: Open binary file-like object to write to instead of a file on disk
+
+        Returns:
+            Path to the created PDF file, or None when writing to ``file``
+        """
+        doc, filename = self._open_document(results, filename, file)
+
+        builders = self._section_builders(results, include_charts)
+        sections = {name: build() for name, build in builders.items()}
+
+        # Build PDF
+        doc.build(self._assemble_story(title, len(results), sections))
+        return None if file is not None else filename
+
+    async def generate_report_async(self,
+                                    results: List[Dict[str, Any]],
+                                    filename: Optional[str] = None,
+                                    title: str = "Price Comparison Report",
+                                    include_charts: bool = True,
+                                    file: Optional[IO[bytes]] = None) -> Optional[str]:
+        """
+        Generate the same report as generate_report without blocking the event loop
+
+        Sections are built concurrently in worker threads and the document
+        is laid out in one more. ReportLab holds the GIL while it works, so
+        this frees the caller's loop rather than using extra cores; see
+        generate_reports_bulk for multi-core rendering.
+
+        Args:
+            results: List of product dictionaries
+            filename: Output filename (default: report_TIMESTAMP.pdf)
+            title: Report title
+            include_charts: Whether to include charts and visualizations
+            file: Open binary file-like object to write to instead of a file on disk
 
         Returns:
-            Path to the created PDF file
+            Path to the created PDF file, or None when writing to ``file``
         """
+        doc, filename = self._open_document(results, filename, file)
+
+        loop = asyncio.get_running_loop()
+        builders = self._section_builders(results, include_charts)
+        built = await asyncio.gather(*(loop.run_in_executor(None, build) for build in builders.values()))
+        sections = dict(zip(builders, built))
+
+        await loop.run_in_executor(None, doc.build, self._assemble_story(title, len(results), sections))
+        return None if file is not None else filename
+
+    def _open_document(self,
+                       results: List[Dict[str, Any]],
+                       filename: Optional[str],
+                       file: Optional[IO[bytes]]) -> Tuple[SimpleDocTemplate, Optional[str]]:
+        """Validate report input and create the document template"""
         if not results:
             raise ValueError("No results to export")
 
-        if filename is None:
+        if file is None and filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"report_{timestamp}.pdf"
 
-        doc = SimpleDocTemplate(filename, pagesize=letter,
+        # SimpleDocTemplate accepts either a path or a writable binary stream
+        doc = SimpleDocTemplate(file if file is not None else filename, pagesize=letter,
                                 rightMargin=72, leftMargin=72,
                                 topMargin=72, bottomMargin=18)
-
+        return doc, filename
+
+    def _section_builders(self,
+                          results: List[Dict[str, Any]],
+                          include_charts: bool) -> Dict[str, Callable[[], List]]:
+        """Independent report sections, each as a zero-argument builder"""
+        # Summary and chart only need a few fields, so read them once as columns
+        columns = _to_columns(results, _PDF_COLUMN_FIELDS)
+
+        builders = {'summary': partial(self._create_summary_section, columns)}
+        if include_charts:
+            builders['charts'] = partial(self._create_charts_section, columns)
+        builders['table'] = partial(self._create_product_table, results)
+        builders['deals'] = partial(self._create_best_deals_section, results)
+        return builders
+
+    def _assemble_story(self, title: str, total: int, sections: Dict[str, List]) -> List:
+        """Lay out the header and the built sections in report order"""
         # Container for PDF elements
         story = []
 
@@ -193,103 +564,93 @@ class PDFExporter:
         # Add metadata
         story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
                                self.styles['Normal']))
-        story.append(Paragraph(f"Total Products: {len(results)}", self.styles['Normal']))
+        story.append(Paragraph(f"Total Products: {total}", self.styles['Normal']))
         story.append(Spacer(1, 20))
         story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#1a237e')))
         story.append(Spacer(1, 20))
 
         # Add summary statistics
-        story.extend(self._create_summary_section(results))
+        story.extend(sections['summary'])
         story.append(Spacer(1, 20))
 
         # Add charts if requested
-        if include_charts and len(results) > 0:
-            story.extend(self._create_charts_section(results))
+        if 'charts' in sections:
+            story.extend(sections['charts'])
             story.append(PageBreak())
 
         # Add product comparison table
         story.append(Paragraph("Product Comparison", self.styles['CustomHeading']))
         story.append(Spacer(1, 12))
-        story.extend(self._create_product_table(results))
+        story.extend(sections['table'])
 
         # Add best deals section
         story.append(PageBreak())
-        story.extend(self._create_best_deals_section(results))
+        story.extend(sections['deals'])
 
-        # Build PDF
-        doc.build(story)
-        return filename
+        return story
 
-    def _create_summary_section(self, results: List[Dict[str, Any]]) -> List:
-        """Create summary statistics section"""
+    def _create_summary_section(self, columns: Dict[str, List[Any]]) -> List:
+        """Create summary statistics section from price/rating/discount columns"""
         elements = []
 
         elements.append(Paragraph("Summary Statistics", self.styles['CustomHeading']))
         elements.append(Spacer(1, 12))
 
-        # Calculate statistics
-        prices = [float(r.get('price', 0)) for r in results if r.get('price')]
-        avg_price = sum(prices) / len(prices) if prices else 0
-        min_price = min(prices) if prices else 0
-        max_price = max(prices) if prices else 0
-
-        # Calculate average rating
-        ratings = [float(r.get('rating', 0)) for r in results if r.get('rating')]
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
-
-        # Calculate products with discounts
-        discounted = sum(1 for r in results if r.get('discount_percentage', 0) > 0)
+        stats = self._summary_stats(columns)
 
         # Create summary table
         summary_data = [
             ['Metric', 'Value'],
-            ['Average Price', f"₹{avg_price:.2f}"],
-            ['Lowest Price', f"₹{min_price:.2f}"],
-            ['Highest Price', f"₹{max_price:.2f}"],
-            ['Average Rating', f"{avg_rating:.1f}/5.0"],
-            ['Discounted Products', f"{discounted}/{len(results)}"],
+            ['Average Price', f"₹{stats['avg_price']:.2f}"],
+            ['Lowest Price', f"₹{stats['min_price']:.2f}"],
+            ['Highest Price', f"₹{stats['max_price']:.2f}"],
+            ['Average Rating', f"{stats['avg_rating']:.1f}/5.0"],
+            ['Discounted Products', f"{stats['discounted']}/{len(columns['price'])}"],
         ]
 
         summary_table = Table(summary_data, colWidths=[3 * inch, 2 * inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
+        summary_table.setStyle(self._summary_style)
 
         elements.append(summary_table)
         return elements
 
-    def _create_charts_section(self, results: List[Dict[str, Any]]) -> List:
-        """Create charts and visualizations section"""
+    @staticmethod
+    def _summary_stats(columns: Dict[str, List[Any]]) -> Dict[str, Any]:
+        """Compute price, rating and discount figures for the summary table"""
+        prices = np.array([float(p) for p in columns['price'] if p], dtype=np.float64)
+        ratings = np.array([float(r) for r in columns['rating'] if r], dtype=np.float64)
+        discounted = sum(1 for d in columns['discount_percentage'] if (d or 0) > 0)
+
+        return {
+            'avg_price': float(prices.mean()) if prices.size else 0,
+            'min_price': float(prices.min()) if prices.size else 0,
+            'max_price': float(prices.max()) if prices.size else 0,
+            'avg_rating': float(ratings.mean()) if ratings.size else 0,
+            'discounted': discounted,
+        }
+
+    def _create_charts_section(self, columns: Dict[str, List[Any]]) -> List:
+        """Create charts and visualizations section from the price column"""
         elements = []
 
         elements.append(Paragraph("Price Analysis", self.styles['CustomHeading']))
         elements.append(Spacer(1, 12))
 
         # Create price distribution chart
-        if len(results) > 1:
-            chart = self._create_price_chart(results)
+        if len(columns['price']) > 1:
+            chart = self._create_price_chart(columns)
             if chart:
                 elements.append(chart)
                 elements.append(Spacer(1, 20))
 
         return elements
 
-    def _create_price_chart(self, results: List[Dict[str, Any]]) -> Optional[Drawing]:
+    def _create_price_chart(self, columns: Dict[str, List[Any]]) -> Optional[Drawing]:
         """Create a price comparison bar chart"""
-        # Take top 10 products by price
-        sorted_results = sorted(results, key=lambda x: float(x.get('price', 0)))[:10]
+        # Take the 10 cheapest products, parsing each price only once
+        prices = heapq.nsmallest(10, (float(p or 0) for p in columns['price']))
 
-        if not sorted_results:
+        if not prices:
             return None
 
         drawing = Drawing(400, 200)
@@ -300,11 +661,10 @@ class PDFExporter:
         chart.width = 300
 
         # Prepare data
-        prices = [float(r.get('price', 0)) for r in sorted_results]
         chart.data = [prices]
 
         # Configure chart
-        chart.categoryAxis.categoryNames = [f"P{i + 1}" for i in range(len(sorted_results))]
+        chart.categoryAxis.categoryNames = [f"P{i + 1}" for i in range(len(prices))]
         chart.valueAxis.valueMin = 0
         chart.valueAxis.valueMax = max(prices) * 1.1
         chart.bars[0].fillColor = colors.HexColor('#1565c0')
@@ -328,21 +688,10 @@ class PDFExporter:
 
             table_data.append([product_name, price, discount, rating, seller])
 
-        # Create table
-        product_table = Table(table_data, colWidths=[2.5 * inch, 1 * inch, 0.8 * inch, 0.8 * inch, 1.4 * inch])
-        product_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
+        # LongTable splits across pages in linear time and repeats the header row
+        product_table = LongTable(table_data, colWidths=[2.5 * inch, 1 * inch, 0.8 * inch, 0.8 * inch, 1.4 * inch],
+                                  repeatRows=1)
+        product_table.setStyle(self._product_style)
 
         elements.append(product_table)
         return elements
@@ -354,30 +703,46 @@ class PDFExporter:
         elements.append(Paragraph("Best Deals", self.styles['CustomHeading']))
         elements.append(Spacer(1, 12))
 
-        # Find best deals (highest discount)
-        discounted = [r for r in results if r.get('discount_percentage', 0) > 0]
-        best_deals = sorted(discounted,
-                            key=lambda x: float(x.get('discount_percentage', 0)),
-                            reverse=True)[:5]
+        # Find best deals (highest discount), parsing each discount only once
+        keyed = ((float(r.get('discount_percentage', 0) or 0), r) for r in results)
+        top = heapq.nlargest(5, (pair for pair in keyed if pair[0] > 0), key=itemgetter(0))
+        best_deals = [deal for _, deal in top]
 
         if best_deals:
-            for i, deal in enumerate(best_deals, 1):
-                elements.append(Paragraph(
-                    f"<b>{i}. {deal.get('product_name', 'N/A')}</b>",
-                    self.styles['Normal']
-                ))
-                elements.append(Paragraph(
-                    f"Price: ₹{deal.get('price', 0):.2f} | "
-                    f"Discount: {deal.get('discount_percentage', 0)}% | "
-                    f"Seller: {deal.get('seller', 'N/A')}",
-                    self.styles['Normal']
-                ))
-                elements.append(Spacer(1, 8))
+            # One paragraph for the whole list keeps the flowable count constant
+            entries = [
+                f"<b>{i}. {deal.get('product_name', 'N/A')}</b><br/>"
+                f"Price: ₹{deal.get('price', 0):.2f} | "
+                f"Discount: {deal.get('discount_percentage', 0)}% | "
+                f"Seller: {deal.get('seller', 'N/A')}"
+                for i, deal in enumerate(best_deals, 1)
+            ]
+            elements.append(Paragraph("<br/><br/>".join(entries), self.styles['Normal']))
         else:
             elements.append(Paragraph("No discounted products found.", self.styles['Normal']))
 
         return elements
 
+    def generate_reports_bulk(self,
+                              jobs: Sequence[Tuple],
+                              max_workers: Optional[int] = None) -> List[str]:
+        """
+        Generate several independent PDF reports in parallel processes
+
+        ReportLab rendering is CPU-bound Python, so separate processes
+        scale where threads would not.
+
+        Args:
+            jobs: Sequence of argument tuples for generate_report,
+                e.g. (results, filename) or (results, filename, title)
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            Paths to the created PDF files, in job order
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_render_report, jobs))
+
     def generate_comparison_report(self,
                                    results: List[Dict[str, Any]],
                                    selected_products: List[int],
@@ -394,8 +759,143 @@ class PDFExporter:
             Path to created PDF
         """
         selected = [results[i] for i in selected_products if i < len(results)]
-        return self.generate_report(selected, filename,
-                                    title="Selected Products Comparison Report")
+        pdf = self._render_to_bytes(selected, "Selected Products Comparison Report")
+
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"report_{timestamp}.pdf"
+
+        with open(filename, 'wb') as pdffile:
+            pdffile.write(pdf)
+
+        return filename
+
+    def _render_to_bytes(self, results: List[Dict[str, Any]], title: str) -> bytes:
+        """
+        Render a report to bytes, reusing the last few renders of identical content
+
+        Renders are keyed by a PDF_RENDER_CACHE_SECONDS time window as well
+        as the content. A reused report therefore shows a "Generated:" time
+        at most one window old, and identical requests arriving in different
+        windows each render again.
+
+        Args:
+            results: List of product dictionaries
+            title: Report title
+
+        Returns:
+            PDF document bytes
+        """
+        digest = hashlib.blake2b(json.dumps(results, sort_keys=True, default=str).encode('utf-8'),
+                                 digest_size=16).hexdigest()
+        window = int(time.time() // PDF_RENDER_CACHE_SECONDS)
+        key = (digest, title, window)
+
+        pdf = self._render_cache.get(key)
+        if pdf is not None:
+            self._render_cache.move_to_end(key)
+            return pdf
+
+        buffer = io.BytesIO()
+        self.generate_report(results, title=title, file=buffer)
+        pdf = buffer.getvalue()
+
+        self._render_cache[key] = pdf
+        if len(self._render_cache) > PDF_RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+
+        return pdf
+
+
+def _render_report(job: Tuple) -> str:
+    """Build one report in a worker process (top-level so it can be pickled)"""
+    return PDFExporter().generate_report(*job)
+
+
+# PDFExporter of the current PDFWorkerPool worker process
+_worker_exporter: Optional[PDFExporter] = None
+
+
+def _init_pdf_worker():
+    """Build the worker's exporter, with its styles, once at process start"""
+    global _worker_exporter
+    _worker_exporter = PDFExporter()
+
+
+def _render_report_bytes(results: List[Dict[str, Any]], title: str) -> bytes:
+    """Render one report to bytes in a PDFWorkerPool worker"""
+    buf = io.BytesIO()
+    _worker_exporter.generate_report(results, title=title, file=buf)
+    return buf.getvalue()
+
+
+class PDFWorkerPool:
+    """
+    Long-lived worker processes that render PDF reports to bytes
+
+    ReportLab layout is CPU-bound Python. Rendering in a few persistent
+    processes keeps it off the caller's GIL, and each worker builds its
+    exporter once instead of per report. Workers start on first use, and
+    are started again if one of them dies.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """
+        Args:
+            max_workers: Number of worker processes
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def render(self,
+               results: List[Dict[str, Any]],
+               title: str = "Price Comparison Report") -> bytes:
+        """
+        Render a report in a worker process
+
+        Args:
+            results: List of product dictionaries (must be picklable)
+            title: Report title
+
+        Returns:
+            The PDF document
+
+        Raises:
+            ValueError: If results is empty
+        """
+        if not results:
+            raise ValueError("No results to export")
+
+        try:
+            return self._render_once(results, title)
+        except BrokenProcessPool:
+            # A worker died (killed, out of memory); try once more on a fresh pool
+            return self._render_once(results, title)
+
+    def _render_once(self, results: List[Dict[str, Any]], title: str) -> bytes:
+        """Render on the current pool, dropping the pool if it turns out to be broken"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     initializer=_init_pdf_worker)
+            executor = self._executor
+        try:
+            return executor.submit(_render_report_bytes, list(results), title).result()
+        except BrokenProcessPool:
+            with self._lock:
+                # Another thread may already have replaced it
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            raise
+
+    def shutdown(self):
+        """Stop the worker processes; the next render starts new ones"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
 
 
 # Factory function for easy usage
@@ -404,14 +904,18 @@ def create_exporter(format_type: str):
     Factory function to create appropriate exporter
 
     Args:
-        format_type: 'csv' or 'pdf'
+        format_type: 'csv', 'pdf', 'parquet' or 'json'
 
     Returns:
-        CSVExporter or PDFExporter instance
+        CSVExporter, PDFExporter, ParquetExporter or JSONExporter instance
     """
     if format_type.lower() == 'csv':
         return CSVExporter()
     elif format_type.lower() == 'pdf':
         return PDFExporter()
+    elif format_type.lower() == 'parquet':
+        return ParquetExporter()
+    elif format_type.lower() == 'json':
+        return JSONExporter()
     else:
         raise ValueError(f"Unsupported format: {format_type}")
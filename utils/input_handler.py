@@ -4,8 +4,49 @@ Provides functions for handling user input via CLI and web interfaces
 with validation for URLs vs product names.
 """
 
-import re
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+_HOST_LABEL_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-')
+
+
+def _is_valid_hostname(host):
+    """
+    Checks a lower-cased host against the accepted URL host forms.
+
+    Accepts ``localhost``, dotted IPv4 addresses and domain names whose
+    labels are 1-63 characters of [a-z0-9-] ending in a 2-6 letter TLD.
+    Each label is scanned once, so the cost is linear in the host length.
+
+    Args:
+        host (str): Host portion of a URL, already lower-cased
+
+    Returns:
+        bool: True if the host is acceptable, False otherwise
+    """
+    if host == 'localhost':
+        return True
+
+    labels = (host[:-1] if host.endswith('.') else host).split('.')
+
+    if len(labels) == 4 and all(label.isdigit() and len(label) <= 3 for label in labels):
+        return True
+
+    if len(labels) < 2:
+        return False
+
+    tld = labels[-1]
+    if not (2 <= len(tld) <= 6 and tld.isascii() and tld.isalpha()):
+        return False
+
+    for label in labels[:-1]:
+        if not 1 <= len(label) <= 63:
+            return False
+        if label[0] == '-' or label[-1] == '-':
+            return False
+        if not _HOST_LABEL_CHARS.issuperset(label):
+            return False
+
+    return True
 
 
 def is_valid_url(input_string):
@@ -24,24 +65,35 @@ def is_valid_url(input_string):
     # Remove leading/trailing whitespace
     input_string = input_string.strip()
 
-    # Basic URL pattern check
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-    # Check if it matches the URL pattern
-    if url_pattern.match(input_string):
-        try:
-            result = urlparse(input_string)
-            return all([result.scheme, result.netloc])
-        except ValueError:
-            return False
+    # Cheap scheme check rejects most non-URLs before any parsing
+    head = input_string[:8].lower()
+    if not (head.startswith('http://') or head.startswith('https://')):
+        return False
+
+    # Path and query may hold any non-space characters, including non-ASCII
+    if any(ch.isspace() for ch in input_string):
+        return False
+
+    try:
+        parts = urlsplit(input_string)
+    except ValueError:
+        return False
+
+    netloc = parts.netloc
+    if not netloc or '@' in netloc or netloc.startswith('['):
+        return False
+
+    # Only a path or a non-empty query may follow the host
+    rest = input_string[len(parts.scheme) + 3 + len(netloc):]
+    if rest and (rest[0] not in '/?' or rest == '?'):
+        return False
+
+    # Any run of digits is accepted as a port; its range is not checked
+    host, colon, port = netloc.partition(':')
+    if colon and not port.isdecimal():
+        return False
 
-    return False
+    return host.isascii() and _is_valid_hostname(host.lower())
 
 
 def validate_input(input_string):
@@ -75,8 +127,8 @@ def validate_input(input_string):
             'valid': False
         }
 
-    # Check if it's a valid URL
-    if is_valid_url(input_string):
+    # Check if it's a valid URL (product names have no scheme separator, skip parsing them)
+    if '://' in input_string and is_valid_url(input_string):
         return {
             'type': 'url',
             'value': input_string,
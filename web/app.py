@@ -3,34 +3,365 @@ Flask web application with export functionality and database integration
 Provides web interface for scraper with CSV/PDF export buttons and search history
 """
 
+import gzip
 import io
 import os
-import tempfile
+import threading
 import time
+import traceback
+import uuid
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from flask import Flask, flash, jsonify, redirect, render_template, request, send_file, url_for
+from cachetools import LRUCache, TTLCache
+from flask import Flask, Response, flash, jsonify, make_response, redirect, render_template, request, send_file, url_for
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
 
 from database.database import create_sqlite_db
+from scrapers.base_scraper import BaseScraper, fresh_fetches
 from scrapers.scraper_manager import scraper_manager
-from utils.export_utils import CSVExporter, PDFExporter
+from utils.export_utils import CSVExporter, PDFExporter, PDFWorkerPool
+from utils.input_handler import validate_input
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider encoding with orjson
+
+    Always writes compact JSON with keys in insertion order, the output the
+    app configures for the default provider; sort_keys, compact and indent
+    are not consulted. Dates, decimals and UUIDs go through Flask's
+    fallback, so API responses only get faster. Non-ASCII text is emitted
+    as UTF-8 rather than \\u escapes.
+    """
+
+    compact = True
+    sort_keys = False
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if ORJSON_AVAILABLE else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string"""
+        return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize a JSON string or UTF-8 bytes"""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the arguments into a JSON response without a str round-trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default,
+                            option=self._OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 
 app = Flask(__name__, template_folder='../templates')
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+# Compact, unsorted JSON even in debug mode; the API is for programs, not people
+app.json.compact = True
+app.json.sort_keys = False
 # Use environment variable for secret key, fallback to dev key for development only
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-key-only-change-in-production')
 
+
+def _install_template_cache(flask_app: Flask, directory: Optional[str] = None) -> None:
+    """
+    Keep compiled templates on disk so new worker processes skip recompiling
+
+    Args:
+        flask_app: App whose Jinja environment gets the cache
+        directory: Cache directory (default: a per-user folder in the temp dir)
+    """
+    flask_app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+
+
+# JINJA_CACHE_DIR picks the template bytecode cache folder; '' turns it off
+jinja_cache_dir = os.environ.get('JINJA_CACHE_DIR')
+if jinja_cache_dir != '':
+    _install_template_cache(app, jinja_cache_dir)
+
 # Initialize exporters
 csv_exporter = CSVExporter()
 pdf_exporter = PDFExporter()
 
-# Initialize database
-db = create_sqlite_db('scraper_history.db', schema_file='database/schema_sqlite.sql')
+# PDF downloads are rendered in worker processes, off the request threads'
+# GIL; PDF_WORKERS=0 renders them in-process instead
+pdf_workers = int(os.environ.get('PDF_WORKERS', '2'))
+pdf_pool = PDFWorkerPool(max_workers=pdf_workers) if pdf_workers > 0 else None
+
+# Scraper page fetches are reused for this many seconds
+HTTP_CACHE_TTL = 900
+
+# Pages containing any of these are block or CAPTCHA pages, which sites
+# often serve with status 200; they are never cached
+BLOCK_PAGE_MARKERS = ('captcha', 'robot check', 'access denied', 'unusual traffic')
+
+
+def _is_cacheable_page(response) -> bool:
+    """True unless a fetched page looks like a block or CAPTCHA page"""
+    text = response.text.lower()
+    return not any(marker in text for marker in BLOCK_PAGE_MARKERS)
+
+
+def _install_http_cache(cache_name: str) -> bool:
+    """
+    Cache the scrapers' page fetches in a SQLite file
+
+    Only fetches made through BaseScraper.http_get() use the cache; other
+    ``requests`` calls in the process are untouched. Only 200 responses
+    that pass _is_cacheable_page() are stored. The cache key ignores the
+    rotated User-Agent; the pool is all desktop browsers that receive the
+    same pages. Scrapes run inside fresh_fetches() skip cached pages.
+
+    Args:
+        cache_name: SQLite cache path (without the .sqlite suffix); missing
+            parent directories are created
+
+    Returns:
+        True if the cache was installed, False if requests-cache is missing
+    """
+    if not REQUESTS_CACHE_AVAILABLE:
+        return False
+    os.makedirs(os.path.dirname(os.path.abspath(cache_name)), exist_ok=True)
+    BaseScraper.set_http_session(requests_cache.CachedSession(
+        cache_name, backend='sqlite',
+        expire_after=HTTP_CACHE_TTL,
+        allowable_codes=(200,),
+        allowable_methods=('GET', 'HEAD'),
+        filter_fn=_is_cacheable_page))
+    return True
+
+
+# SCRAPER_HTTP_CACHE picks the HTTP cache file, by default in the app's
+# instance folder rather than the working directory; '' turns it off
+http_cache_name = os.environ.get('SCRAPER_HTTP_CACHE',
+                                 os.path.join(app.instance_path, 'http_cache'))
+if http_cache_name:
+    _install_http_cache(http_cache_name)
+
+# Initialize database (SCRAPER_DB_PATH=':memory:' gives a throwaway in-memory DB)
+db_path = os.environ.get('SCRAPER_DB_PATH', 'scraper_history.db')
+db = create_sqlite_db(db_path, schema_file='database/schema_sqlite.sql',
+                      pooled=db_path == ':memory:')
 
 # Store current search context
 current_search_id = None
 current_results = []
 
+# Results of recent searches keyed by search ID, so an export form can name the
+# search it came from instead of relying on whichever search ran last
+RESULT_CACHE_SIZE = 128
+_result_cache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+_result_cache_lock = threading.RLock()
+
+# Background scrapes started through /api/search/jobs, polled by job ID.
+# Jobs are kept for SEARCH_JOB_TTL seconds after they start.
+SEARCH_JOB_TTL = 600
+_search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='search-job')
+_search_jobs: Dict[str, Tuple[float, int, Future]] = {}
+_search_jobs_lock = threading.Lock()
+
+# Recent scrape results keyed by (normalized query, sites), so repeat searches skip the network
+SEARCH_CACHE_TTL = 300
+_search_cache = TTLCache(maxsize=512, ttl=SEARCH_CACHE_TTL)
+_search_cache_lock = threading.RLock()
+
+# A completed search stored less than this many seconds ago is shown again
+# instead of scraping, unless the user asks for fresh prices
+RECENT_SEARCH_MAX_AGE = 900
+
+# CSV exports with at least this many rows are gzipped for clients that accept it
+CSV_GZIP_MIN_ROWS = 100
+
+# Other text responses are gzipped (at the fastest level) once they reach this size
+COMPRESS_MIN_SIZE = 500
+COMPRESS_LEVEL = 1
+COMPRESS_MIMETYPES = frozenset({'text/html', 'application/json', 'text/css',
+                                'application/javascript'})
+
+# Symbols for price displays rebuilt from stored results; other currencies
+# are shown by code
+CURRENCY_SYMBOLS = {'INR': '₹', 'USD': '$', 'EUR': '€', 'GBP': '£', 'JPY': '¥'}
+
+# Dashboard aggregates and recent history, dropped whenever a search finishes
+REPORT_CACHE_TTL = 60
+_report_cache = TTLCache(maxsize=64, ttl=REPORT_CACHE_TTL)
+_report_cache_lock = threading.Lock()
+
+
+def _cached_search(query: str, sites: List[str] = None,
+                   refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Scrape ``query`` on ``sites``, reusing results from the last few minutes
+
+    Empty results are not cached, so a blocked or failed scrape is retried
+    on the next request.
+
+    Args:
+        query: Product name or search query
+        sites: Site names to search (None, [] or ['all'] = all sites)
+        refresh: Scrape even if cached results exist, then cache the new ones
+
+    Returns:
+        List of product results
+    """
+    key = (query.strip().lower(), _sites_filter(sites))
+
+    if not refresh:
+        with _search_cache_lock:
+            cached = _search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+    # A refresh must not be answered from the HTTP cache either
+    with fresh_fetches(refresh):
+        results = scraper_manager.search_product(query, sites)
+
+    if results:
+        with _search_cache_lock:
+            _search_cache[key] = list(results)
+    return results
+
+
+def _sites_filter(sites: Optional[List[str]]) -> Optional[str]:
+    """
+    A site selection in the form stored as a search's 'sites_filter' metadata
+
+    Sites are lower-cased and sorted so the same selection always matches,
+    whatever order it was submitted in. As in the scraper, 'all' anywhere
+    in the selection means every site.
+
+    Args:
+        sites: Site names as submitted
+
+    Returns:
+        Comma-separated site names, or None for all sites
+    """
+    if not sites or 'all' in sites:
+        return None
+    return ','.join(sorted({site.strip().lower() for site in sites}))
+
+
+def _recent_stored_search(query: str, sites: List[str]) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Results of a matching search completed in the last RECENT_SEARCH_MAX_AGE seconds
+
+    Args:
+        query: Product name or search query
+        sites: Site names to search (empty, None or ['all'] = all sites)
+
+    Returns:
+        Tuple of (search_id, results), or None if no recent search matches
+    """
+    search_id = db.find_recent_completed_search(query, RECENT_SEARCH_MAX_AGE,
+                                                sites_filter=_sites_filter(sites))
+    if search_id is None:
+        return None
+
+    results = _stored_results_for_display(search_id)
+    return (search_id, results) if results else None
+
+
+def _cached_report(key: Tuple, load: Callable[[], Any]) -> Any:
+    """
+    Return the cached value for ``key``, calling ``load`` on a miss
+
+    Args:
+        key: Cache key, e.g. ('statistics', days)
+        load: Runs the database queries for this report
+
+    Returns:
+        Cached or freshly loaded value
+    """
+    with _report_cache_lock:
+        cached = _report_cache.get(key)
+    if cached is not None:
+        return cached
+
+    value = load()
+    with _report_cache_lock:
+        _report_cache[key] = value
+    return value
+
+
+def _search_statistics(days: int) -> Tuple[Dict, List[Dict], List[Dict]]:
+    """Statistics, popular queries and site performance for the last ``days`` days"""
+    return _cached_report(('statistics', days), lambda: (
+        db.get_search_statistics(days=days),
+        db.get_popular_queries(limit=10),
+        db.get_site_performance(),
+    ))
+
+
+def _recent_searches(limit: int) -> List[Dict]:
+    """The ``limit`` most recent searches"""
+    return _cached_report(('recent', limit), lambda: db.get_recent_searches(limit=limit))
+
+
+def _file_timestamp() -> str:
+    """Current local time formatted for export filenames, e.g. 20240131_154500"""
+    return f"{datetime.now():%Y%m%d_%H%M%S}"
+
+
+def _cacheable(response: Response, max_age: int) -> Response:
+    """
+    Let clients and proxies cache a response and revalidate it by ETag
+
+    Args:
+        response: Complete (non-streamed) response
+        max_age: Seconds the response may be reused without asking again
+
+    Returns:
+        The response, or an empty 304 if the request's If-None-Match matches
+    """
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+@app.after_request
+def _compress_response(response: Response) -> Response:
+    """Gzip complete HTML/JSON/CSS/JS responses for clients that accept it"""
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or response.mimetype not in COMPRESS_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    if not request.accept_encodings['gzip']:
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    # The body no longer matches a strong ETag computed before compression
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
 
 @app.route('/')
 def index():
@@ -41,8 +372,6 @@ def index():
 @app.route('/submit_input', methods=['POST'])
 def submit_input():
     """Handle input validation from search form (for compatibility with index.html template)"""
-    from utils.input_handler import validate_input
-
     # Get input from form
     user_input = request.form.get('search_input', '').strip()
 
@@ -77,37 +406,27 @@ def search():
         flash('Please enter a search query', 'error')
         return redirect(url_for('index'))
 
-    # Create search record in database
-    current_search_id = db.create_search(query=query, status='in_progress')
-    start_time = time.time()
+    refresh = bool(request.form.get('force_refresh'))
 
     try:
-        # Log search attempt
-        print(f"[SEARCH] Query: {query}, Sites: {sites}, Search ID: {current_search_id}")
-
-        # Perform real-time scraping
-        current_results = scraper_manager.search_product(query, sites if sites else None)
+        stored = None if refresh else _recent_stored_search(query, sites)
+        if stored:
+            # Show the matching search from a few minutes ago instead of scraping again
+            current_search_id, current_results = stored
+            print(f"[SEARCH] Query: {query}, Sites: {sites}, reusing Search ID: {current_search_id}")
+        else:
+            # Create search record in database
+            current_search_id = db.create_search(query=query, status='in_progress')
+
+            # Log search attempt
+            print(f"[SEARCH] Query: {query}, Sites: {sites}, Search ID: {current_search_id}")
+
+            # Perform real-time scraping
+            current_results = _run_scrape(query, sites, current_search_id,
+                                          source='web_ui', refresh=refresh)
 
         print(f"[SEARCH] Results count: {len(current_results)}")
 
-        # Save results to database
-        if current_results:
-            db.add_results_batch(current_search_id, current_results)
-
-        # Update search with completion status
-        duration_ms = int((time.time() - start_time) * 1000)
-        db.update_search(
-            search_id=current_search_id,
-            total_results=len(current_results),
-            status='completed',
-            duration_ms=duration_ms
-        )
-
-        # Add metadata
-        db.add_metadata(current_search_id, 'source', 'web_ui')
-        if sites:
-            db.add_metadata(current_search_id, 'sites_filter', ','.join(sites))
-
         if not current_results:
             flash('No results found. The scrapers may be blocked or the product was not found. Try a simpler search term like "iPhone 15".', 'warning')
             return redirect(url_for('index'))
@@ -117,37 +436,120 @@ def search():
                                query=query,
                                search_id=current_search_id,
                                total=len(current_results))
+    except Exception as e:
+        print(f"[ERROR] Search failed: {str(e)}")
+        traceback.print_exc()
+        flash(f'An error occurred while searching: {str(e)}', 'error')
+        return redirect(url_for('index'))
+
+
+def _run_scrape(query: str, sites: List[str], search_id: int, source: str,
+                refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Scrape a query and record the outcome against its search record
+
+    Shared by the synchronous search form and background search jobs.
+
+    Args:
+        query: Product name or search query
+        sites: Site names to search (empty or None = all sites)
+        search_id: Search record created for this scrape
+        source: Value stored as the search's 'source' metadata
+        refresh: Scrape even if recent results are cached
+
+    Returns:
+        List of product results
+
+    Raises:
+        Exception: Any scraping or database error, after marking the search failed
+    """
+    start_time = time.time()
+
+    try:
+        results = _cached_search(query, sites if sites else None, refresh=refresh)
+
+        # Save results, completion status and metadata in one commit
+        duration_ms = int((time.time() - start_time) * 1000)
+        with db.transaction():
+            if results:
+                db.add_results_batch(search_id, results)
+
+            db.update_search(
+                search_id=search_id,
+                total_results=len(results),
+                status='completed',
+                duration_ms=duration_ms
+            )
+
+            db.add_metadata(search_id, 'source', source)
+            sites_filter = _sites_filter(sites)
+            if sites_filter:
+                db.add_metadata(search_id, 'sites_filter', sites_filter)
+            # Prices are normalized to one currency; keep it for reuse of these results
+            currencies = {r.get('currency') for r in results}
+            if len(currencies) == 1 and None not in currencies:
+                db.add_metadata(search_id, 'currency', currencies.pop())
+
+        if results:
+            with _result_cache_lock:
+                _result_cache[search_id] = results
+        with _report_cache_lock:
+            _report_cache.clear()
+
+        return results
     except Exception as e:
         # Update search with error status
         duration_ms = int((time.time() - start_time) * 1000)
         db.update_search(
-            search_id=current_search_id,
+            search_id=search_id,
             total_results=0,
             status='failed',
             duration_ms=duration_ms
         )
-        db.add_metadata(current_search_id, 'error', str(e))
-
-        print(f"[ERROR] Search failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        flash(f'An error occurred while searching: {str(e)}', 'error')
-        return redirect(url_for('index'))
+        db.add_metadata(search_id, 'error', str(e))
+        with _report_cache_lock:
+            _report_cache.clear()
+        raise
 
 
 @app.route('/results', methods=['GET'])
 def results():
-    """Display cached results (for when URL is accessed directly)"""
+    """
+    Display cached results (for when URL is accessed directly)
+
+    The page only changes when a new search completes, so it carries an
+    ETag naming the latest search and the displayed query; a browser
+    revalidating with If-None-Match gets an empty 304 without a re-render.
+    """
     query = request.args.get('q', 'recent search')
 
     if not current_results:
         flash('No results available. Please perform a new search.', 'info')
         return redirect(url_for('index'))
 
-    return render_template('results.html',
-                           results=current_results,
-                           query=query,
-                           total=len(current_results))
+    etag = f'results-{current_search_id}-{zlib.crc32(query.encode("utf-8")):08x}'
+    if request.if_none_match.contains_weak(etag):
+        not_modified = Response(status=304)
+        _mark_revalidate(not_modified, etag)
+        return not_modified
+
+    response = make_response(render_template('results.html',
+                                             results=current_results,
+                                             query=query,
+                                             total=len(current_results)))
+    _mark_revalidate(response, etag)
+    return response
+
+
+def _mark_revalidate(response: Response, etag: str) -> None:
+    """
+    Let the browser keep a page but check its ETag before every reuse
+
+    The ETag is weak because the page may be sent gzipped or not.
+    """
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.set_etag(etag, weak=True)
 
 
 @app.route('/api/search', methods=['POST'])
@@ -160,9 +562,15 @@ def api_search():
     if not query:
         return jsonify({'error': 'Query required'}), 400
 
+    refresh = bool(data.get('force_refresh'))
+
     try:
-        # Perform real-time scraping
-        results = scraper_manager.search_product(query, sites)
+        stored = None if refresh else _recent_stored_search(query, sites)
+        if stored:
+            results = stored[1]
+        else:
+            # Perform real-time scraping
+            results = _cached_search(query, sites, refresh=refresh)
 
         return jsonify({
             'success': True,
@@ -177,6 +585,62 @@ def api_search():
         }), 500
 
 
+@app.route('/api/search/jobs', methods=['POST'])
+def api_search_start():
+    """API endpoint to start a scrape in the background and return a job to poll"""
+    data = request.get_json()
+    query = data.get('query', '')
+    sites = data.get('sites', ['all'])
+
+    if not query:
+        return jsonify({'error': 'Query required'}), 400
+
+    search_id = db.create_search(query=query, status='in_progress')
+    future = _search_executor.submit(_run_scrape, query, sites, search_id, 'api_job')
+
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    with _search_jobs_lock:
+        # Forget jobs nobody has polled for a while
+        for stale in [j for j, (created, _, _) in _search_jobs.items() if now - created > SEARCH_JOB_TTL]:
+            del _search_jobs[stale]
+        _search_jobs[job_id] = (now, search_id, future)
+
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'search_id': search_id,
+        'status_url': url_for('api_search_status', job_id=job_id)
+    }), 202
+
+
+@app.route('/api/search/status/<job_id>')
+def api_search_status(job_id):
+    """API endpoint to poll a background search job"""
+    with _search_jobs_lock:
+        job = _search_jobs.get(job_id)
+
+    if job is None:
+        return jsonify({'error': 'Unknown or expired job'}), 404
+
+    _, search_id, future = job
+    if not future.done():
+        return jsonify({'done': False, 'search_id': search_id})
+
+    error = future.exception()
+    if error is not None:
+        return jsonify({'done': True, 'success': False, 'search_id': search_id, 'error': str(error)})
+
+    results = future.result()
+    return jsonify({
+        'done': True,
+        'success': True,
+        'search_id': search_id,
+        'total': len(results),
+        'results': results
+    })
+
+
 @app.route('/api/convert', methods=['POST'])
 def api_convert_currency():
     """API endpoint for currency conversion"""
@@ -195,94 +659,62 @@ def api_convert_currency():
 @app.route('/api/currencies', methods=['GET'])
 def api_supported_currencies():
     """API endpoint to get supported currencies"""
-    return jsonify({
+    return _cacheable(jsonify({
         'currencies': scraper_manager.get_supported_currencies()
-    })
+    }), max_age=3600)
 
 
 @app.route('/export/csv', methods=['POST'])
 def export_csv():
     """Export current results to CSV"""
-    if not current_results:
+    source, search_id = _results_for_export()
+    if not source:
         flash('No results to export', 'error')
         return redirect(url_for('index'))
 
-    # Get selected indices if any
-    selected = request.form.getlist('selected')
-
-    if selected:
-        selected_indices = [int(i) for i in selected]
-        export_data = [current_results[i] for i in selected_indices if i < len(current_results)]
-    else:
-        export_data = current_results
-
-    # Generate CSV in memory
-    csv_string = csv_exporter.export_to_csv_string(export_data)
-
-    # Create file-like object
-    csv_bytes = io.BytesIO(csv_string.encode('utf-8'))
+    export_data = _select(source, request.form.getlist('selected'))
 
     # Generate filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _file_timestamp()
     filename = f"price_comparison_{timestamp}.csv"
 
     # Record export in database
-    if current_search_id:
+    if search_id:
         db.record_export(
-            search_id=current_search_id,
+            search_id=search_id,
             export_format='csv',
             result_count=len(export_data),
             file_path=f'/exports/{filename}'
         )
 
-    return send_file(
-        csv_bytes,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=filename
-    )
+    return _csv_download(export_data, filename)
 
 
 @app.route('/export/pdf', methods=['POST'])
 def export_pdf():
     """Export current results to PDF"""
-    if not current_results:
+    source, search_id = _results_for_export()
+    if not source:
         flash('No results to export', 'error')
         return redirect(url_for('index'))
 
-    # Get selected indices if any
-    selected = request.form.getlist('selected')
+    export_data = _select(source, request.form.getlist('selected'))
 
-    if selected:
-        selected_indices = [int(i) for i in selected]
-        export_data = [current_results[i] for i in selected_indices if i < len(current_results)]
+    # Render the PDF straight into memory, no temporary file needed
+    timestamp = _file_timestamp()
+    if pdf_pool is not None:
+        pdf_bytes = io.BytesIO(pdf_pool.render(export_data))
     else:
-        export_data = current_results
-
-    # Generate PDF using temporary file with cross-platform compatibility
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # Create temporary file that works on both Windows and Unix
-    with tempfile.NamedTemporaryFile(mode='wb', suffix='.pdf', delete=False) as temp_file:
-        temp_filename = temp_file.name
-
-    try:
-        pdf_exporter.generate_report(export_data, filename=temp_filename)
-
-        # Read the file into memory
-        with open(temp_filename, 'rb') as f:
-            pdf_bytes = io.BytesIO(f.read())
-    finally:
-        # Clean up temp file
-        if os.path.exists(temp_filename):
-            os.remove(temp_filename)
+        pdf_bytes = io.BytesIO()
+        pdf_exporter.generate_report(export_data, file=pdf_bytes)
+        pdf_bytes.seek(0)
 
     filename = f"price_comparison_report_{timestamp}.pdf"
 
     # Record export in database
-    if current_search_id:
+    if search_id:
         db.record_export(
-            search_id=current_search_id,
+            search_id=search_id,
             export_format='pdf',
             result_count=len(export_data),
             file_path=f'/exports/{filename}'
@@ -323,7 +755,7 @@ def api_export_pdf():
     if not results:
         return jsonify({'error': 'No results provided'}), 400
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _file_timestamp()
     filename = f"report_{timestamp}.pdf"
 
     pdf_exporter.generate_report(results, filename=filename)
@@ -339,7 +771,7 @@ def api_export_pdf():
 def history():
     """View search history"""
     limit = request.args.get('limit', 50, type=int)
-    recent_searches = db.get_recent_searches(limit=limit)
+    recent_searches = _recent_searches(limit)
 
     return render_template('history.html', searches=recent_searches)
 
@@ -349,9 +781,7 @@ def statistics():
     """View statistics and analytics"""
     days = request.args.get('days', 30, type=int)
 
-    stats = db.get_search_statistics(days=days)
-    popular = db.get_popular_queries(limit=10)
-    sites = db.get_site_performance()
+    stats, popular, sites = _search_statistics(days)
 
     return render_template('statistics.html',
                            stats=stats,
@@ -380,18 +810,107 @@ def view_search(search_id):
                            exports=exports)
 
 
-@app.route('/export/csv/<int:search_id>', methods=['POST'])
+@app.route('/export/csv/<int:search_id>', methods=['GET', 'POST'])
 def export_search_csv(search_id):
-    """Export a specific search's results to CSV"""
-    # Get results from database
-    results = db.get_results_by_search_id(search_id)
+    """
+    Export a specific search's results to CSV
+
+    A completed search never changes, so its download is marked immutable
+    and a browser revalidating with If-None-Match gets an empty 304.
+    Only POST (the export button) is recorded in the export history; GETs
+    may come from link prefetchers, crawlers or browser re-downloads.
+    """
+    search = db.get_search_by_id(search_id)
+    immutable = bool(search) and search.get('status') == 'completed'
+    etag = f'search-{search_id}-csv'
+    if immutable and request.if_none_match.contains_weak(etag):
+        not_modified = Response(status=304)
+        _mark_immutable(not_modified, etag)
+        return not_modified
 
-    if not results:
+    # The search row already records how many results were stored with it
+    result_count = search.get('total_results') if search else 0
+
+    if not result_count:
         flash('No results found for this search', 'error')
         return redirect(url_for('view_search', search_id=search_id))
 
-    # Convert database results to export format
-    export_data = [
+    # A response kept for a year gets a name that stays true for a year
+    if immutable:
+        filename = f"search_{search_id}.csv"
+    else:
+        filename = f"search_{search_id}_{_file_timestamp()}.csv"
+
+    if request.method == 'POST':
+        db.record_export(
+            search_id=search_id,
+            export_format='csv',
+            result_count=result_count,
+            file_path=f'/exports/{filename}'
+        )
+
+    # Rows go straight from the database cursor to the response
+    lines = csv_exporter.export_records_to_csv_rows(
+        db.iter_results_for_export(search_id), db.EXPORT_COLUMNS)
+    response = _csv_response(lines, result_count, filename)
+    if immutable:
+        _mark_immutable(response, etag)
+    return response
+
+
+def _mark_immutable(response: Response, etag: str) -> None:
+    """
+    Let the browser keep a download for good and revalidate it by ETag
+
+    The ETag is weak because the same export may be sent gzipped or not.
+    """
+    response.cache_control.private = True
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    response.set_etag(etag, weak=True)
+
+
+def _select(source: List[Dict[str, Any]], selected: List[str]) -> List[Dict[str, Any]]:
+    """
+    Rows of ``source`` picked by an export form's checkboxes
+
+    Args:
+        source: Results the form was rendered from
+        selected: Row indices as submitted; out-of-range ones are ignored
+
+    Returns:
+        Selected rows in submitted order, or all of ``source`` if none were selected
+    """
+    if not selected:
+        return source
+    n = len(source)
+    return [source[i] for i in map(int, selected) if 0 <= i < n]
+
+
+def _results_for_export():
+    """
+    Results an export form refers to
+
+    Uses the form's ``search_id`` when given (from memory if it is still
+    cached, else from the database) and the latest search otherwise.
+
+    Returns:
+        Tuple of (results, search_id)
+    """
+    search_id = request.form.get('search_id', type=int)
+    if search_id is None:
+        return current_results, current_search_id
+
+    with _result_cache_lock:
+        results = _result_cache.get(search_id)
+    if results is None:
+        results = _stored_results_for_export(search_id)
+    return results, search_id
+
+
+def _stored_results_for_export(search_id: int) -> List[Dict[str, Any]]:
+    """Load a search's results from the database and convert them to export format"""
+    return [
         {
             'product_name': r['product_name'],
             'price': r['price'],
@@ -405,31 +924,74 @@ def export_search_csv(search_id):
             'site': r['site_name'],
             'scraped_at': r['scraped_at']
         }
-        for r in results
+        for r in db.get_results_by_search_id(search_id)
     ]
 
-    # Generate CSV
-    csv_string = csv_exporter.export_to_csv_string(export_data)
-    csv_bytes = io.BytesIO(csv_string.encode('utf-8'))
 
-    # Generate filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"search_{search_id}_{timestamp}.csv"
-
-    # Record export
-    db.record_export(
-        search_id=search_id,
-        export_format='csv',
-        result_count=len(export_data),
-        file_path=f'/exports/{filename}'
-    )
+def _stored_results_for_display(search_id: int) -> List[Dict[str, Any]]:
+    """
+    Load a search's results from the database in the format the scraper returns
+
+    Prices are shown in the currency recorded with the search; searches
+    stored without one predate that record and were all in INR.
+    """
+    stored_currency = db.get_metadata(search_id, 'currency')
+    currency = stored_currency[0]['metadata_value'] if stored_currency else 'INR'
+    symbol = CURRENCY_SYMBOLS.get(currency, f'{currency} ')
+
+    results = []
+    for r in db.get_results_by_search_id(search_id):
+        try:
+            price = float(r['price'])
+        except (TypeError, ValueError):
+            price = 0.0
+        results.append({
+            'product_name': r['product_name'] or 'N/A',
+            'price': price,
+            'price_display': f"{symbol}{price:,.2f}",
+            'price_breakdown': '',
+            'rating': r['rating'] or 'N/A',
+            'reviews': r['reviews_count'] or 0,
+            'availability': r['availability'] or '',
+            'seller': r['seller'] or r['site_name'],
+            'url': r['product_url'] or '#',
+            'scraped_at': r['scraped_at'],
+            'currency': currency
+        })
+    return results
 
-    return send_file(
-        csv_bytes,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=filename
-    )
+
+def _csv_download(export_data: List[Dict[str, Any]], filename: str) -> Response:
+    """Stream results as a CSV attachment, one encoded row at a time"""
+    return _csv_response(csv_exporter.export_to_csv_rows(export_data),
+                         len(export_data), filename)
+
+
+def _csv_response(lines: Iterable[str], row_count: int, filename: str) -> Response:
+    """
+    Stream CSV lines as an attachment
+
+    Exports of CSV_GZIP_MIN_ROWS rows or more are gzip-compressed on the fly
+    for clients that accept it.
+    """
+    headers = {'Content-Disposition': f'attachment; filename={filename}',
+               'Vary': 'Accept-Encoding'}
+
+    if row_count >= CSV_GZIP_MIN_ROWS and request.accept_encodings['gzip']:
+        headers['Content-Encoding'] = 'gzip'
+        return Response(_gzip_stream(lines), mimetype='text/csv', headers=headers)
+
+    return Response(lines, mimetype='text/csv', headers=headers)
+
+
+def _gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip-compress text chunks as they are produced"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
 
 
 @app.route('/api/statistics')
@@ -437,15 +999,13 @@ def api_statistics():
     """API endpoint for search statistics"""
     days = request.args.get('days', 30, type=int)
 
-    stats = db.get_search_statistics(days=days)
-    popular = db.get_popular_queries(limit=10)
-    sites = db.get_site_performance()
+    stats, popular, sites = _search_statistics(days)
 
-    return jsonify({
+    return _cacheable(jsonify({
         'statistics': stats,
         'popular_queries': popular,
         'site_performance': sites
-    })
+    }), max_age=REPORT_CACHE_TTL)
 
 
 @app.route('/api/search/history')
@@ -453,17 +1013,28 @@ def api_search_history():
     """API endpoint for search history"""
     limit = request.args.get('limit', 20, type=int)
     query_filter = request.args.get('query')
+    cursor = request.args.get('cursor', type=int)
+
+    if limit < 1:
+        return jsonify({'success': False, 'error': 'limit must be at least 1'}), 400
 
     if query_filter:
         searches = db.search_by_query(f'%{query_filter}%')
+    elif cursor is not None:
+        searches = db.get_searches_before(cursor, limit=limit)
     else:
-        searches = db.get_recent_searches(limit=limit)
+        searches = _recent_searches(limit)
 
-    return jsonify({
+    response = {
         'success': True,
         'count': len(searches),
         'searches': searches
-    })
+    }
+    if not query_filter:
+        # Pass back as ?cursor= for the next (older) page; None on the last page
+        response['next_cursor'] = searches[-1]['search_id'] if len(searches) == limit else None
+
+    return jsonify(response)
 
 
 @app.route('/api/search/<int:search_id>/results')
@@ -474,8 +1045,14 @@ def api_search_results(search_id):
     end_date_str = request.args.get('end_date')
 
     if start_date_str and end_date_str:
-        start_date = datetime.fromisoformat(start_date_str)
-        end_date = datetime.fromisoformat(end_date_str)
+        try:
+            start_date = datetime.fromisoformat(start_date_str)
+            end_date = datetime.fromisoformat(end_date_str)
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'start_date and end_date must be ISO 8601 dates'
+            }), 400
         results = db.get_results_by_search_and_date(search_id, start_date, end_date)
     else:
         results = db.get_results_by_search_id(search_id)